@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Save compression benchmark for TERMINAL.EXIT.
+Encodes a realistic large save in both formats and reports, per codec,
+the compression ratio and compress/decompress throughput, to help pick
+between disk footprint and save latency.
+
+Usage: python3 bench_compression.py [rooms]
+"""
+
+import sys
+
+from bench_saves import build_large_engine, _best_ms
+from terminal_exit import serialization
+from terminal_exit.compression import CODECS, compress, decompress
+
+
+def main(rooms=5000):
+    engine = build_large_engine(rooms)
+    state = serialization.capture(engine)
+    print(f"\nCompression benchmark: {len(engine.world.rooms)} rooms\n")
+    print(f"  {'format':<7} {'codec':<7} {'size':>9} {'ratio':>6} "
+          f"{'comp MB/s':>10} {'decomp MB/s':>12}")
+    for fmt in ('json', 'binary'):
+        raw = serialization.encode(state, fmt)
+        mb = len(raw) / 1e6
+        for name in CODECS:
+            packed = compress(raw, name)
+            assert decompress(packed) == raw
+            comp_ms = _best_ms(lambda: compress(raw, name), runs=5)
+            decomp_ms = _best_ms(lambda: decompress(packed), runs=5)
+            print(f"  {fmt:<7} {name:<7} {len(packed):>9} "
+                  f"{len(raw) / len(packed):>5.1f}x "
+                  f"{mb / max(comp_ms, 1e-6) * 1000:>10.1f} "
+                  f"{mb / max(decomp_ms, 1e-6) * 1000:>12.1f}")
+    print()
+    return True
+
+
+if __name__ == '__main__':
+    rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sys.exit(0 if main(rooms) else 1)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Per-session memory benchmark for TERMINAL.EXIT hosts.
+Builds `sessions` game engines the way the telnet host does and uses
+tracemalloc to report how much memory each one adds on top of the
+shared content, with the biggest allocation sites.
+
+Usage: python3 bench_memory.py [sessions]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from terminal_exit.autosave import AutosaveWorker
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.terminal_io import NullPort
+
+
+def per_session_bytes(sessions=500, top=0):
+    """Average traced bytes per new session, plus the `top` biggest sites."""
+    autosave, io = AutosaveWorker(), NullPort()
+    GameEngine(autosave=autosave, io=io)  # Import and build shared content first
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot() if top else None
+        start = tracemalloc.get_traced_memory()[0]
+        engines = [GameEngine(autosave=autosave, io=io) for _ in range(sessions)]
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start
+        sites = []
+        if top:
+            stats = tracemalloc.take_snapshot().compare_to(before, 'lineno')
+            sites = [(str(s.traceback[0]), s.size_diff / sessions) for s in stats[:top]]
+    finally:
+        tracemalloc.stop()
+    del engines
+    return used / sessions, sites
+
+
+def main(sessions=500):
+    per_session, sites = per_session_bytes(sessions, top=8)
+    print(f"\nPer-session memory over {sessions} sessions: "
+          f"{per_session / 1024:.2f} KB\n")
+    for where, size in sites:
+        print(f"  {size:7.0f} B  {where}")
+    print()
+    return True
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:2]]
+    sys.exit(0 if main(*args) else 1)
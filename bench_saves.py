@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Save/load benchmark for TERMINAL.EXIT.
+Builds a fully explored large world and times a full save and load in
+both formats. Target: under 10 ms each. Also times listing the headers
+of many slots, which should not depend on save size.
+
+Usage: python3 bench_saves.py [rooms]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.save_load import SaveLoad
+from terminal_exit.content import RoomSpec
+from terminal_exit.world_manager import WORLD, BaseWorld, WorldManager
+from terminal_exit import serialization
+
+BUDGET_MS = 10.0
+SLOTS = 200
+
+
+_bases = {}
+
+
+def large_base(rooms=5000):
+    """The standard map plus `rooms` generated ones (shared per size)."""
+    base = _bases.get(rooms)
+    if base is None:
+        side = int(rooms ** 0.5) + 1
+        extra = [RoomSpec(f'Sector {i}', 'Generated sector.', ['Examine Sector'], {},
+                          (10 + i % side, 10 + i // side), 'generated',
+                          'glitch' if i % 7 == 0 else None)
+                 for i in range(rooms)]
+        base = _bases[rooms] = BaseWorld(WORLD + tuple(extra))
+    return base
+
+
+def build_large_engine(rooms=5000):
+    """Engine with `rooms` extra rooms, all explored, and a busy history."""
+    engine = GameEngine(world=WorldManager(large_base(rooms)))
+    world = engine.world
+    for i, room in enumerate(world.rooms.values()):
+        room.visited = True
+        if room.zone != 'generated':
+            continue
+        room.encounter_cleared = room.encounter is not None
+        if i % 50 == 0:
+            room.examined_objects['Examine Sector'] = True
+            room.items.append('Data Shard')
+    for i in range(40):
+        engine.inventory.add_item(f'Gear {i}', 'Salvaged part')
+    for name in ('Glitch Analyzer', 'Phase Shifter', 'Echo Resonator'):
+        engine.ai.install_upgrade(name)
+    engine.ai.dialogue_history = [f'Line {i}: stay close.' for i in range(500)]
+    return engine
+
+
+def _best_ms(fn, runs=20):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(rooms=5000):
+    engine = build_large_engine(rooms)
+    target = build_large_engine(rooms)
+    print(f"\nSave/load benchmark: {len(engine.world.rooms)} rooms, "
+          f"{len(engine.inventory.items)} items, "
+          f"{len(engine.ai.dialogue_history)} history lines\n")
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ('json', 'binary'):
+            saver = SaveLoad(fmt)
+            saver.SAVE_FILE = os.path.join(tmp, f'save.{fmt}')
+            save_ms = _best_ms(lambda: saver.save(serialization.capture(engine)))
+            size = os.path.getsize(saver.SAVE_FILE)
+            load_ms = _best_ms(lambda: serialization.restore(target, saver.load()))
+            passed = save_ms < BUDGET_MS and load_ms < BUDGET_MS
+            ok = ok and passed
+            print(f"  {fmt:<7} size {size:>8} B | save {save_ms:6.2f} ms | "
+                  f"load {load_ms:6.2f} ms | {'PASS' if passed else 'OVER BUDGET'}")
+
+        saver = SaveLoad('binary', directory=tmp)
+        state = serialization.capture(engine)
+        for slot in range(SLOTS):
+            saver.save(state, slot=slot, name=f'Profile {slot}')
+        list_ms = _best_ms(saver.list_headers, runs=5)
+        passed = list_ms < BUDGET_MS
+        ok = ok and passed
+        print(f"  headers {SLOTS} slots      | list {list_ms:6.2f} ms | "
+              f"{'PASS' if passed else 'OVER BUDGET'}")
+
+    assert target.world.current_room.name == engine.world.current_room.name
+    print()
+    return ok
+
+
+if __name__ == '__main__':
+    rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sys.exit(0 if main(rooms) else 1)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Telnet host benchmark for TERMINAL.EXIT.
+Starts the server in a child process, parks `idle` logged-in sessions
+at the main menu, then has `active` sessions send commands as fast as
+the server answers (after roughly `think_ms` of player think
+time; 0 saturates the host). Reports command round-trip latency (p50/p99) and
+the server's resident memory.
+
+Usage: python3 bench_server.py [idle] [active] [commands_per_session] [think_ms]
+"""
+
+import asyncio
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from terminal_exit.telnet import DO, NAWS, command
+
+
+def _rss_mb(pid):
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float('nan')
+
+
+async def _login(port, name):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    await reader.readexactly(len(command(DO, NAWS)))
+    writer.write(name.encode() + b'\r\n')
+    await reader.readuntil(b'Main Menu')
+    await reader.readuntil(b'> ')
+    return reader, writer
+
+
+async def _player(port, name, commands, think, latencies):
+    reader, writer = await _login(port, name)
+    for _ in range(commands):
+        await asyncio.sleep(think * random.uniform(0.5, 1.5))
+        start = time.perf_counter()
+        writer.write(b'9\r\n')  # Unknown choice: the menu is redrawn
+        await reader.readuntil(b'Main Menu')
+        await reader.readuntil(b'> ')
+        latencies.append(time.perf_counter() - start)
+    return writer
+
+
+async def _run(port, idle, active, commands, think):
+    parked = []
+    for start in range(0, idle, 100):
+        batch = [_login(port, f'idle{n}') for n in range(start, min(idle, start + 100))]
+        parked.extend(await asyncio.gather(*batch))
+    latencies = []
+    started = time.perf_counter()
+    writers = await asyncio.gather(*[_player(port, f'active{n}', commands, think, latencies)
+                                     for n in range(active)])
+    elapsed = time.perf_counter() - started
+    return parked, writers, latencies, elapsed
+
+
+def main(idle=1000, active=100, commands=20, think_ms=50):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    with tempfile.TemporaryDirectory() as tmp:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'terminal_exit.server', '--port', '0',
+             '--speed', '0', '--saves', tmp],
+            stdout=subprocess.PIPE, text=True)
+        try:
+            port = int(server.stdout.readline().rsplit(':', 1)[1])
+            base = _rss_mb(server.pid)
+            parked, writers, latencies, elapsed = asyncio.run(
+                _run(port, idle, active, commands, think_ms / 1000))
+            rss = _rss_mb(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    ms = [t * 1000 for t in latencies]
+    print(f"\nTelnet host: {idle} idle + {active} active sessions, "
+          f"{commands} commands each, {think_ms} ms think time\n")
+    print(f"  latency p50 {ms[len(ms) // 2]:6.2f} ms   p99 {ms[int(len(ms) * 0.99)]:6.2f} ms"
+          f"   max {ms[-1]:6.2f} ms")
+    print(f"  throughput  {len(ms) / elapsed:8.0f} commands/s")
+    print(f"  server RSS  {base:6.1f} MB idle -> {rss:6.1f} MB "
+          f"({(rss - base) * 1024 / (idle + active):.0f} KB per session)\n")
+    return True
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:5]]
+    sys.exit(0 if main(*args) else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Spectator broadcast benchmark for TERMINAL.EXIT hosts.
+Starts the server in a child process, has one player redraw the main
+menu `commands` times while 0, 10, 100, ... spectators watch, and
+reports the player's command latency and the server CPU time spent per
+frame as the audience grows.
+
+Usage: python3 bench_spectators.py [max_viewers] [commands]
+"""
+
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_server import _login
+
+
+def _cpu_seconds(pid):
+    with open(f'/proc/{pid}/stat') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+async def _watch(port, player):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'watch {player}\r\n'.encode())
+    await reader.readuntil(b'Main Menu')
+    return reader, writer
+
+
+async def _drain(reader):
+    try:
+        while await reader.read(65536):
+            pass
+    except ConnectionError:
+        pass
+
+
+async def _round(port, pid, name, viewers, commands):
+    reader, writer = await _login(port, name)
+    watchers = await asyncio.gather(*[_watch(port, name) for _ in range(viewers)])
+    readers = [asyncio.create_task(_drain(r)) for r, _ in watchers]
+    latencies = []
+    cpu = _cpu_seconds(pid)
+    for _ in range(commands):
+        start = time.perf_counter()
+        writer.write(b'9\r\n')  # Unknown choice: the menu is redrawn
+        await reader.readuntil(b'Main Menu')
+        await reader.readuntil(b'> ')
+        latencies.append(time.perf_counter() - start)
+    await asyncio.sleep(0.2)  # Let the last frames reach every viewer
+    cpu = _cpu_seconds(pid) - cpu
+    writer.close()
+    for _, w in watchers:
+        w.close()
+    await asyncio.gather(*readers)
+    latencies.sort()
+    return latencies[len(latencies) // 2], cpu / commands
+
+
+def main(max_viewers=1000, commands=200):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    counts = [0] + [n for n in (10, 100, 1000, 5000) if n <= max_viewers]
+    with tempfile.TemporaryDirectory() as tmp:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'terminal_exit.server', '--port', '0',
+             '--speed', '0', '--saves', tmp, '--max-sessions', str(max_viewers + 10)],
+            stdout=subprocess.PIPE, text=True)
+        try:
+            port = int(server.stdout.readline().rsplit(':', 1)[1])
+            rows = [(n, *asyncio.run(_round(port, server.pid, f'star{n}', n, commands)))
+                    for n in counts]
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"\nSpectator broadcast: 1 player, {commands} screen redraws\n")
+    print(f"  {'viewers':>7} {'latency p50':>12} {'server CPU/redraw':>18} {'per viewer':>11}")
+    base = rows[0][2]
+    for viewers, p50, cpu in rows:
+        per_viewer = (cpu - base) / viewers * 1e6 if viewers else 0.0
+        print(f"  {viewers:>7} {p50 * 1000:>9.2f} ms {cpu * 1e6:>15.0f} µs {per_viewer:>8.1f} µs")
+    print()
+    return True
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    sys.exit(0 if main(*args) else 1)
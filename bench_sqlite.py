@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+SQLite save store benchmark for TERMINAL.EXIT.
+Many threads save realistic game states to their own profiles in one
+database, once with a transaction per save and once batched. Reports
+saves per second for each.
+
+Usage: python3 bench_sqlite.py [threads] [saves_per_thread]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from bench_saves import build_large_engine
+from terminal_exit import serialization
+from terminal_exit.sqlite_store import SqliteStore
+
+BATCH = 10
+
+
+def _run(store, threads, saves, state, batched):
+    """(rows written, rows per second). Batches write distinct slots, so
+    every save in a transaction is its own row."""
+    name = 'batch' if batched else 'single'
+    written = [0] * threads
+
+    def player(n):
+        if batched:
+            slots = [store.saver(f'{name}{n}', slot=slot) for slot in range(BATCH)]
+            for first in range(0, saves, BATCH):
+                count = min(BATCH, saves - first)
+                store.save_many([(saver, state) for saver in slots[:count]])
+                written[n] += count
+        else:
+            saver = store.saver(f'{name}{n}')
+            for _ in range(saves):
+                saver.save(state)
+                written[n] += 1
+
+    workers = [threading.Thread(target=player, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return sum(written), sum(written) / elapsed
+
+
+def main(threads=8, saves=50, rooms=500):
+    state = serialization.capture(build_large_engine(rooms))
+    print(f"\nSQLite benchmark: {threads} threads x {saves} saves, "
+          f"{len(serialization.encode(state, 'binary'))} B per save\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(os.path.join(tmp, 'saves.db'))
+        single_rows, single = _run(store, threads, saves, state, batched=False)
+        batch_rows, batched = _run(store, threads, saves, state, batched=True)
+        store.close()
+    print(f"  transaction per save   {single:8.0f} saves/s ({single_rows} rows)")
+    print(f"  batched ({BATCH} per txn)   {batched:8.0f} saves/s ({batch_rows} rows)\n")
+    return True
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    sys.exit(0 if main(*args) else 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Bytes-on-the-wire benchmark for TERMINAL.EXIT hosts.
+Plays a fixed route through the game (new game, intro, a tour of the
+map with every fight) on a port that records output the way the telnet
+host sends it: one chunk per burst, ending at a flush or a prompt.
+Reports what that costs on the wire uncompressed, with each chunk
+deflated on its own, and as an MCCP2 stream at several zlib levels.
+
+Usage: python3 bench_wire.py [tours]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+
+from terminal_exit.autosave import AutosaveWorker
+from terminal_exit.clock import VirtualClock
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.telnet import Compressor
+from terminal_exit.terminal_io import Disconnected, Port
+
+# Explore-prompt commands for one tour: every room, fight and screen type
+ROUTE = ['down', 'right', 'down', 'right', 'right', '1', '4', 'left', 'left',
+         'up', 'up', 'right', '2', 'right', '3', 'left', 'left', 'left', 'down']
+PRESS_AFTER = 7  # Strike bar frames before the scripted key press
+
+
+class RecordingPort(Port):
+    """Answers every prompt from a script and keeps the output in chunks."""
+
+    def __init__(self, route):
+        self.route = list(route)
+        self.chunks = []
+        self._pending = []  # Written since the last flush
+        self._screen = []   # Written since the last prompt
+        self._frames = 0
+
+    def write(self, text):
+        data = text.replace('\n', '\r\n').encode('utf-8')
+        self._pending.append(data)
+        self._screen.append(data)
+
+    def frame(self, text):
+        self._frames += 1
+        return super().frame(text)
+
+    def flush(self):
+        if self._pending:
+            self.chunks.append(b''.join(self._pending))
+            self._pending.clear()
+
+    def input(self, prompt='', resume=None):
+        if prompt:
+            self.write(prompt)
+        self.flush()
+        screen = b''.join(self._screen)
+        self._screen.clear()
+        if resume == 'explore':
+            if not self.route:
+                raise Disconnected()  # Tour over: the player hangs up
+            return self.route.pop(0)
+        # Fight, take every upgrade, pick the first option; Enter otherwise
+        if (resume == 'combat' or prompt in ('  > ', 'Your choice > ')
+                or b'Main Menu' in screen):
+            return '1'
+        return ''
+
+    def readline(self):
+        return ''
+
+    def has_input(self):
+        # Strike bar: "press" a few frames in, the same every time
+        if self._frames >= PRESS_AFTER:
+            self._frames = 0
+            return True
+        return False
+
+
+def record_playthrough(tours=1):
+    """Output chunks of a full scripted playthrough."""
+    random.seed(1234)
+    port = RecordingPort(ROUTE * tours)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = GameEngine(clock=VirtualClock(), autosave=AutosaveWorker(), io=port)
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        engine.run()
+    port.flush()
+    return port.chunks
+
+
+def _per_chunk(chunks, level=6):
+    return sum(len(zlib.compress(chunk, level)) for chunk in chunks)
+
+
+def _stream(chunks, level):
+    compressor = Compressor(level)
+    start = time.perf_counter()
+    for chunk in chunks:
+        compressor.compress(chunk)
+    return compressor.sent + len(Compressor.START), time.perf_counter() - start
+
+
+def main(tours=1):
+    chunks = record_playthrough(tours)
+    raw = sum(len(c) for c in chunks)
+    print(f"\nWire benchmark: scripted playthrough, {tours} tour(s), "
+          f"{len(chunks)} chunks, {raw / 1024:.1f} KB of screen output\n")
+    print(f"  {'encoding':<22} {'bytes':>10} {'ratio':>7} {'per chunk':>10} {'µs/chunk':>9}")
+    rows = [('plain', raw, 0.0)]
+    start = time.perf_counter()
+    rows.append(('zlib per chunk (6)', _per_chunk(chunks), time.perf_counter() - start))
+    for level in (1, 6, 9):
+        size, took = _stream(chunks, level)
+        rows.append((f'MCCP2 stream ({level})', size, took))
+    for name, size, took in rows:
+        print(f"  {name:<22} {size:>10} {raw / size:>6.1f}x {size / len(chunks):>10.1f} "
+              f"{took / len(chunks) * 1e6:>9.1f}")
+    print()
+    return True
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:2]]
+    sys.exit(0 if main(*args) else 1)
@@ -1,8 +1,11 @@
-
 """Entrypoint for the prototype. Runs `terminal_exit` package if available."""
+import argparse
+
 from terminal_exit import run
 
 
 if __name__ == '__main__':
-	run()
-
+	parser = argparse.ArgumentParser(description='Play TERMINAL.EXIT')
+	parser.add_argument('--speed', type=float, default=1.0,
+	                    help='Pacing multiplier (10 = ten times faster, 0 = instant)')
+	run(speed=parser.parse_args().speed)
@@ -1,7 +1,11 @@
 """Terminal.Exit package entrypoint."""
 from .game_engine import GameEngine
+from .clock import make_clock
+from .autosave import install_signal_handlers
 
 
-def run():
-    engine = GameEngine()
+def run(speed=1.0):
+    """Run the game; `speed` > 1 speeds up pauses, 0 skips them entirely."""
+    install_signal_handlers()
+    engine = GameEngine(clock=make_clock(speed))
     engine.run()
@@ -1,5 +1,7 @@
 """AI companion implementation with emoticon states and dialogue helper."""
 from .ascii_art import render_face, draw_fancy_box, cprint
+from .effects import compile_modifiers
+from .terminal_io import current_port
 import random
 
 
@@ -7,20 +9,71 @@ class AICompanion:
     def __init__(self):
         self.mood = 'happy'
         self.upgrades = []
-        self.bond = 0.0
+        self._bond = 0.0
         self.name = "Aria"  # Give the AI a name
         self.dialogue_history = []
+        self.listener = None  # Called as listener(kind, data) on changes
+        self.modifiers = compile_modifiers(self.upgrades, self._bond)
+
+    @property
+    def bond(self):
+        return self._bond
+
+    @bond.setter
+    def bond(self, value):
+        self._bond = value
+        self.refresh_modifiers()
+        self._emit('bond', {'value': value})
+
+    def refresh_modifiers(self):
+        """Recompile the combat modifier table after upgrades or bond change."""
+        mods = compile_modifiers(self.upgrades, self._bond)
+        if mods.advisor and mods is not self.modifiers:
+            # Tactical Advisor: have the fight tables solved before they're needed
+            from .tactics import warm
+            warm(mods)
+        self.modifiers = mods
+
+    def install_upgrade(self, name):
+        """Install an upgrade by name and strengthen the bond."""
+        self.upgrades.append(name)
+        self._emit('upgrade_installed', {'name': name})
+        self.bond = min(1.0, self._bond + 0.05)
+
+    def _emit(self, kind, data):
+        if self.listener is not None:
+            self.listener(kind, data)
+
+    def to_state(self):
+        return {
+            'name': self.name,
+            'mood': self.mood,
+            'upgrades': list(self.upgrades),
+            'bond': self._bond,
+            'history': list(self.dialogue_history),
+        }
+
+    def load_state(self, state):
+        self.name = state['name']
+        self.mood = state['mood']
+        self.upgrades = list(state['upgrades'])
+        self.dialogue_history = list(state['history'])
+        self._bond = state['bond']
+        self.refresh_modifiers()
 
     def set_mood(self, mood):
-        self.mood = mood
+        if mood != self.mood:
+            self.mood = mood
+            self._emit('mood', {'mood': mood})
 
     def speak(self, mood, text):
         """Display AI speaking with face and dialogue."""
-        self.mood = mood
+        self.set_mood(mood)
         render_face(mood, large=True)
-        print()
+        current_port().print()
         draw_fancy_box('AI Companion', [text], width=60, color='green')
         self.dialogue_history.append(text)
+        self._emit('said', {'text': text})
 
     def describe(self):
         """Show AI status."""
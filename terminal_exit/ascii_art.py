@@ -3,6 +3,9 @@
 Provides gorgeous Candy Box-style ASCII graphics, large expressive AI faces,
 and a cohesive visual design system.
 """
+from .content import freeze
+from .terminal_io import current_port
+
 try:
     from colorama import init as _init_colorama, Fore, Style
     _init_colorama()
@@ -11,7 +14,7 @@ except Exception:
     COLORAMA_AVAILABLE = False
 
 # CUTE AI FACES - Small and expressive emoticons
-FACES = {
+FACES = freeze({
     'happy': [
         '   (◕ヮ◕)ﾉ',
         '    ~ hi ~',
@@ -32,21 +35,21 @@ FACES = {
         '   (•́ ︿ •̀)',
         '    ...',
     ],
-}
+})
 
 
-SMALL_FACE = {
+SMALL_FACE = freeze({
     'happy': [
         '╔═══════════╗',
         '║  ^   ^    ║',
         '║   \\ /    ║',
         '╚═══════════╝',
     ],
-}
+})
 
 
 # Location-specific ASCII art decorations
-LOCATION_ART = {
+LOCATION_ART = freeze({
     'Awakening Point': [
         '      ⚡ ⚡ ⚡',
         '    ┌─────────┐',
@@ -111,7 +114,7 @@ LOCATION_ART = {
         '  ◇ ◇ ◇ ⬥ ◇',
         '  ◇ ⬥ ◇ ◇ ◇',
     ],
-}
+})
 
 
 
@@ -150,15 +153,15 @@ def draw_fancy_box(title, lines, width=70, color='cyan', char='═'):
     title_line = f'║ ▸ {title:<{width-6}} ║'
     divider = '╠' + char * (width - 2) + '╣'
     
-    print(_color_wrap(top, color))
-    print(_color_wrap(title_line, color))
-    print(_color_wrap(divider, color))
+    _print(_color_wrap(top, color))
+    _print(_color_wrap(title_line, color))
+    _print(_color_wrap(divider, color))
     
     for line in lines:
         text = str(line)[:width-4]
-        print(_color_wrap(f'║  {text:<{width-4}} ║', color))
+        _print(_color_wrap(f'║  {text:<{width-4}} ║', color))
     
-    print(_color_wrap('╚' + char * (width - 2) + '╝', color))
+    _print(_color_wrap('╚' + char * (width - 2) + '╝', color))
 
 
 def draw_location_box(title, description, width=80, color='magenta'):
@@ -167,9 +170,9 @@ def draw_location_box(title, description, width=80, color='magenta'):
     title_line = f'║ ▸ {title:<{width-6}} ║'
     divider = '╠' + '═' * (width - 2) + '╣'
     
-    print(_color_wrap(top, color))
-    print(_color_wrap(title_line, color))
-    print(_color_wrap(divider, color))
+    _print(_color_wrap(top, color))
+    _print(_color_wrap(title_line, color))
+    _print(_color_wrap(divider, color))
     
     # Get location art if available
     art_lines = LOCATION_ART.get(title, [])
@@ -178,8 +181,8 @@ def draw_location_box(title, description, width=80, color='magenta'):
     if art_lines:
         for art_line in art_lines:
             padded = art_line.center(width - 4)
-            print(_color_wrap(f'║ {padded} ║', color))
-        print(_color_wrap('╠' + '─' * (width - 2) + '╣', color))
+            _print(_color_wrap(f'║ {padded} ║', color))
+        _print(_color_wrap('╠' + '─' * (width - 2) + '╣', color))
     
     # Word wrap description
     words = description.split()
@@ -197,9 +200,9 @@ def draw_location_box(title, description, width=80, color='magenta'):
     
     for line in lines:
         text = line[:width-4]
-        print(_color_wrap(f'║  {text:<{width-4}} ║', color))
+        _print(_color_wrap(f'║  {text:<{width-4}} ║', color))
     
-    print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
+    _print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
 
 
 def draw_banner_box(title, lines, width=70, color='cyan'):
@@ -207,23 +210,23 @@ def draw_banner_box(title, lines, width=70, color='cyan'):
     top = '▓' * width
     header = f'  ▸ {title}'
     
-    print(_color_wrap(top, color))
-    print(_color_wrap(header, color))
-    print(_color_wrap('▓' * width, color))
-    print()
+    _print(_color_wrap(top, color))
+    _print(_color_wrap(header, color))
+    _print(_color_wrap('▓' * width, color))
+    _print()
     
     for line in lines:
         text = str(line)
-        print(_color_wrap(text, color))
+        _print(_color_wrap(text, color))
     
-    print()
-    print(_color_wrap('▓' * width, color))
+    _print()
+    _print(_color_wrap('▓' * width, color))
 
 
 def draw_scene_box(description, width=70):
     """Draw a scene description box."""
-    print()
-    print(_color_wrap('╭' + '─' * (width - 2) + '╮', 'magenta'))
+    _print()
+    _print(_color_wrap('╭' + '─' * (width - 2) + '╮', 'magenta'))
     
     # Word wrap description
     words = description.split()
@@ -240,10 +243,10 @@ def draw_scene_box(description, width=70):
         lines.append(current_line.strip())
     
     for line in lines:
-        print(_color_wrap(f'│ {line:<{width-3}}│', 'magenta'))
+        _print(_color_wrap(f'│ {line:<{width-3}}│', 'magenta'))
     
-    print(_color_wrap('╰' + '─' * (width - 2) + '╯', 'magenta'))
-    print()
+    _print(_color_wrap('╰' + '─' * (width - 2) + '╯', 'magenta'))
+    _print()
 
 
 def draw_stats_bar(label, value, max_val, width=40, color='green'):
@@ -253,22 +256,22 @@ def draw_stats_bar(label, value, max_val, width=40, color='green'):
     bar = '█' * filled + '░' * (bar_width - filled)
     percent = int((value / max_val) * 100) if max_val > 0 else 0
     line = f'{label:.<15} [{bar}] {percent:>3}%'
-    print(_color_wrap(line, color))
+    _print(_color_wrap(line, color))
 
 
 def draw_menu(title, options, width=50, color='yellow'):
     """Draw a beautiful menu."""
-    print()
-    print(_color_wrap('╔' + '═' * (width - 2) + '╗', color))
-    print(_color_wrap(f'║ ▶ {title.center(width-5)} ║', color))
-    print(_color_wrap('╠' + '═' * (width - 2) + '╣', color))
+    _print()
+    _print(_color_wrap('╔' + '═' * (width - 2) + '╗', color))
+    _print(_color_wrap(f'║ ▶ {title.center(width-5)} ║', color))
+    _print(_color_wrap('╠' + '═' * (width - 2) + '╣', color))
     
     for i, option in enumerate(options, 1):
         opt_text = f'{i}. {option}'
-        print(_color_wrap(f'║  {opt_text:<{width-4}} ║', color))
+        _print(_color_wrap(f'║  {opt_text:<{width-4}} ║', color))
     
-    print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
-    print()
+    _print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
+    _print()
 
 
 def _color_wrap(text, color_name):
@@ -287,7 +290,7 @@ def render_face(state='neutral', large=True):
     faceset = FACES if large else SMALL_FACE
     face = faceset.get(state, faceset.get('neutral'))
     for line in face:
-        print(_color_wrap(line, 'cyan'))
+        _print(_color_wrap(line, 'cyan'))
 
 
 def draw_box(title, lines, width=50, color='white'):
@@ -297,14 +300,14 @@ def draw_box(title, lines, width=50, color='white'):
     """
     top = '╔' + '═' * (width - 2) + '╗'
     title_line = f'║ {title[:width-4]:^{width-4}} ║'
-    print(_color_wrap(top, color))
-    print(_color_wrap(title_line, color))
-    print(_color_wrap('╠' + '═' * (width - 2) + '╣', color))
+    _print(_color_wrap(top, color))
+    _print(_color_wrap(title_line, color))
+    _print(_color_wrap('╠' + '═' * (width - 2) + '╣', color))
     for l in lines:
         # simple clip
         text = l[:width-4]
-        print(_color_wrap(f'║ {text:<{width-4}} ║', color))
-    print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
+        _print(_color_wrap(f'║ {text:<{width-4}} ║', color))
+    _print(_color_wrap('╚' + '═' * (width - 2) + '╝', color))
 
 
 def cprint(text, kind='white'):
@@ -320,17 +323,21 @@ def cprint(text, kind='white'):
         'dim': 'BLACK',
     }
     color_name = kind_map.get(kind, 'WHITE')
-    print(_color_wrap(text, color_name))
+    _print(_color_wrap(text, color_name))
+
+
+def _print(text=''):
+    """print() to the session's terminal port."""
+    current_port().print(text)
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    import os
-    os.system('clear' if os.name != 'nt' else 'cls')
+    current_port().clear()
 
 
 def wait_for_continue(prompt='Press Enter to continue...'):
     try:
-        input(prompt)
+        current_port().input(prompt)
     except Exception:
         pass
@@ -0,0 +1,153 @@
+"""
+Background autosave for TERMINAL.EXIT.
+The game thread only marks a session dirty; a single worker thread wakes
+once per interval and writes every dirty session in one pass. Bursts of
+changes between passes collapse into one write per session, and one
+worker can serve many sessions, so disk writes stay bounded no matter
+how busy the game gets.
+"""
+import atexit
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class AutosaveWorker:
+    """Coalesces dirty notifications into periodic batched flushes.
+
+    Anything with a `flush()` method can be marked dirty (normally a
+    Journal). A failed flush is retried on the next pass.
+    """
+
+    def __init__(self, interval=1.0, max_batch=64):
+        self.interval = interval    # Seconds between passes
+        self.max_batch = max_batch  # Flushes per pass (bounds IOPS)
+        self._dirty = OrderedDict()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        # Metrics
+        self.passes = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_error = None
+        self.latencies = deque(maxlen=256)  # Seconds per flush
+
+    def mark_dirty(self, target):
+        """Queue `target` for the next pass. Cheap; never touches disk."""
+        with self._cond:
+            if target in self._dirty:
+                self.coalesced += 1
+            else:
+                self._dirty[target] = True
+            stopped = self._stopping
+            if not stopped and self._thread is None:
+                self._start()
+        if stopped:
+            # Shutting down: nobody else will write it
+            self.flush()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name='autosave',
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._stopping, self.interval)
+                stopping = self._stopping
+            self._pass()
+            if stopping:
+                return
+
+    def _take_batch(self, limit):
+        with self._cond:
+            batch = []
+            while self._dirty and len(batch) < limit:
+                batch.append(self._dirty.popitem(last=False)[0])
+            return batch
+
+    def _pass(self, limit=None):
+        """Flush up to `limit` (default max_batch) dirty targets."""
+        batch = self._take_batch(limit or self.max_batch)
+        if batch:
+            self.passes += 1
+        for target in batch:
+            start = time.perf_counter()
+            try:
+                target.flush()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+                with self._cond:
+                    self._dirty.setdefault(target, True)
+                continue
+            self.latencies.append(time.perf_counter() - start)
+            self.writes += 1
+        return len(batch)
+
+    def flush(self):
+        """Write everything pending right now, on the calling thread."""
+        return self._pass(limit=max(1, self.queue_depth()))
+
+    def stop(self):
+        """Flush everything and end the worker thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def queue_depth(self):
+        """Sessions waiting to be written."""
+        with self._cond:
+            return len(self._dirty)
+
+    def metrics(self):
+        lat = sorted(self.latencies)
+        return {
+            'queue_depth': self.queue_depth(),
+            'passes': self.passes,
+            'writes': self.writes,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'write_ms_avg': 1000 * sum(lat) / len(lat) if lat else 0.0,
+            'write_ms_max': 1000 * lat[-1] if lat else 0.0,
+        }
+
+
+_shared = None
+_shared_guard = threading.Lock()
+
+
+def shared_worker():
+    """The process-wide worker every session writes through."""
+    global _shared
+    with _shared_guard:
+        if _shared is None:
+            _shared = AutosaveWorker()
+        return _shared
+
+
+def install_signal_handlers(worker=None):
+    """Make SIGTERM/SIGHUP exit cleanly so pending saves are flushed.
+
+    The handler only raises SystemExit: it runs on the main thread,
+    possibly while that thread holds a journal lock, so the flush waits
+    for atexit, after the stack has unwound and released it.
+    """
+    worker = worker or shared_worker()
+    atexit.register(worker.stop)
+
+    def handler(signum, frame):
+        raise SystemExit(128 + signum)
+
+    for name in ('SIGTERM', 'SIGHUP'):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), handler)
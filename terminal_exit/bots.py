@@ -0,0 +1,244 @@
+"""
+Scripted players for TERMINAL.EXIT combat.
+Policies decide combat moves in place of a human at the keyboard, so the
+combat path can be load-tested and regression-checked in bulk.
+
+Run a batch from the command line:
+
+    python -m terminal_exit.bots --policy solver --count 5000
+"""
+import argparse
+import random
+import sys
+import time
+
+from .ai_companion import AICompanion
+from .clock import Clock, VirtualClock
+from .combat_system import CombatSystem, ENEMIES
+from .inventory import Inventory
+from .terminal_io import NullPort
+
+
+ATTACK, ANALYZE, ITEM, MERCY, FLEE = '1', '2', '3', '4', '5'
+
+
+class Policy:
+    """Base policy: override `choose` to pick a combat menu option."""
+
+    name = 'base'
+
+    def __init__(self, skill=0.5, heal_below=30, rng=None):
+        self.skill = skill            # Chance of stopping in the best zone
+        self.heal_below = heal_below  # Drink a potion under this HP
+        self.rng = rng or random.Random()
+
+    def choose(self, combat):
+        raise NotImplementedError
+
+    def should_heal(self, combat):
+        return combat.player_hp < self.heal_below and combat.potion_count() > 0
+
+    def strike_target(self, combat, bar):
+        """Cursor position to stop at on the attack bar."""
+        if self.rng.random() < self.skill:
+            best = 2 if 2 in bar.lookup else 1
+            hits = [i for i, code in enumerate(bar.lookup) if code == best]
+            return self.rng.choice(hits)
+        return self.rng.randrange(bar.width)
+
+
+class RandomPolicy(Policy):
+    """Mashes any menu option."""
+
+    name = 'random'
+
+    def choose(self, combat):
+        return self.rng.choice((ATTACK, ANALYZE, ITEM, MERCY, FLEE))
+
+
+class GreedyAttackPolicy(Policy):
+    """Always attacks, healing only when in danger."""
+
+    name = 'greedy'
+
+    def choose(self, combat):
+        if self.should_heal(combat):
+            return ITEM
+        return ATTACK
+
+
+class MercyPolicy(Policy):
+    """Wears the enemy down gently, then tries to spare it."""
+
+    name = 'mercy'
+
+    def choose(self, combat):
+        if self.should_heal(combat):
+            return ITEM
+        enemy = combat.current_enemy
+        if enemy.hp <= enemy.max_hp * combat.mercy_threshold / 100:
+            return MERCY
+        return ANALYZE
+
+
+class SolverPolicy(Policy):
+    """Plays the Tactical Advisor's optimal move every turn."""
+
+    name = 'solver'
+
+    def choose(self, combat):
+        from .tactics import advise, ACTION_CHOICES
+        action, _ = advise(combat)
+        return ACTION_CHOICES.get(action, ATTACK)
+
+
+POLICIES = {
+    cls.name: cls
+    for cls in (RandomPolicy, GreedyAttackPolicy, MercyPolicy, SolverPolicy)
+}
+
+
+class BotPlayer:
+    """Drives a CombatSystem with a policy instead of keyboard input.
+
+    Headless bots skip screen clears, pauses and the strike animation and
+    run at full speed. Live bots leave rendering on and wait a human-like
+    think time (on their clock) before each answer.
+    """
+
+    def __init__(self, policy, headless=True, think_time=(0.4, 1.2), clock=None):
+        self.policy = policy
+        self.headless = headless
+        self.think_time = think_time
+        self.clock = clock or Clock()
+
+    def _think(self):
+        if not self.headless:
+            self.clock.sleep(self.policy.rng.uniform(*self.think_time))
+
+    def pause(self):
+        self._think()
+
+    def choose_action(self, combat):
+        self._think()
+        return self.policy.choose(combat)
+
+    def choose_item(self, combat, items):
+        self._think()
+        for i, item in enumerate(items, 1):
+            if 'Potion' in item.name:
+                return str(i)
+        return '1'
+
+    def choose_install(self, combat, drop):
+        self._think()
+        return '1'
+
+    def strike_target(self, combat, bar):
+        return self.policy.strike_target(combat, bar)
+
+
+class BattleStats:
+    """Outcome and throughput totals for a batch of encounters."""
+
+    def __init__(self, policy_name):
+        self.policy_name = policy_name
+        self.encounters = 0
+        self.outcomes = {}
+        self.turns = 0
+        self.hp_left = 0
+        self.elapsed = 0.0
+
+    def record(self, combat):
+        self.encounters += 1
+        self.outcomes[combat.outcome] = self.outcomes.get(combat.outcome, 0) + 1
+        self.turns += combat.turn_count
+        self.hp_left += combat.player_hp
+
+    def rate(self, outcome):
+        return self.outcomes.get(outcome, 0) / self.encounters if self.encounters else 0.0
+
+    def report(self):
+        n = max(1, self.encounters)
+        lines = [
+            f'Policy: {self.policy_name}',
+            f'Encounters: {self.encounters} in {self.elapsed:.2f}s '
+            f'({self.encounters / self.elapsed if self.elapsed else 0:.0f}/s)',
+            f'Avg turns: {self.turns / n:.1f} | Avg HP left: {self.hp_left / n:.1f}',
+        ]
+        for outcome in ('victory', 'mercy', 'defeat', 'fled', 'stalemate'):
+            lines.append(f'  {outcome:<10} {self.rate(outcome):6.1%}')
+        return lines
+
+
+def run_encounters(policy, count=1000, enemies=None, potions=2,
+                   upgrades=(), bond=0.0):
+    """Play `count` headless encounters and return BattleStats.
+
+    Each encounter gets a fresh AI and inventory so runs are comparable.
+    """
+    enemies = list(enemies or ENEMIES)
+    stats = BattleStats(policy.name)
+    player = BotPlayer(policy, headless=True)
+    clock = VirtualClock()
+    start = time.perf_counter()
+    io = NullPort()
+    for i in range(count):
+        ai = AICompanion()
+        ai.upgrades.extend(upgrades)
+        ai.bond = bond  # Also recompiles the modifier table
+        inventory = Inventory()
+        for _ in range(potions):
+            inventory.add_item('Health Potion')
+        combat = CombatSystem(ai, inventory, clock=clock, io=io)
+        combat.player = player
+        combat.start_encounter(enemies[i % len(enemies)])
+        stats.record(combat)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def play_live(policy, enemy_key, think_time=(0.4, 1.2), clock=None):
+    """Let a bot fight one visible encounter at human-like pacing."""
+    clock = clock or Clock()
+    ai = AICompanion()
+    inventory = Inventory()
+    inventory.add_item('Health Potion')
+    inventory.add_item('Health Potion')
+    combat = CombatSystem(ai, inventory, clock=clock)
+    combat.player = BotPlayer(policy, headless=False, think_time=think_time,
+                              clock=clock)
+    combat.start_encounter(enemy_key)
+    return combat.outcome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run combat bots.')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--enemy', choices=sorted(ENEMIES), action='append')
+    parser.add_argument('--potions', type=int, default=2)
+    parser.add_argument('--skill', type=float, default=0.5)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--live', action='store_true',
+                        help='Play one visible encounter at human pacing')
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    policy = POLICIES[args.policy](skill=args.skill,
+                                   rng=random.Random(args.seed))
+
+    if args.live:
+        enemy = (args.enemy or ['glitch'])[0]
+        print(f'Outcome: {play_live(policy, enemy)}')
+        return 0
+
+    stats = run_encounters(policy, args.count, args.enemy, args.potions)
+    for line in stats.report():
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
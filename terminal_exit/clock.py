@@ -0,0 +1,60 @@
+"""
+Clocks for TERMINAL.EXIT pacing.
+Every dramatic pause and animation frame goes through a clock, so the
+same code can run in real time, sped up, or instantly for tests and bots.
+"""
+import time
+
+
+class Clock:
+    """Real wall-clock time."""
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class ScaledClock(Clock):
+    """Real time running `factor` times faster (e.g. 10 for speedruns)."""
+
+    def __init__(self, factor):
+        if factor <= 0:
+            raise ValueError('factor must be positive')
+        self.factor = factor
+        self._start = time.monotonic()
+
+    def now(self):
+        # Game time advances `factor` seconds per real second
+        return self._start + (time.monotonic() - self._start) * self.factor
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds / self.factor)
+
+
+class VirtualClock(Clock):
+    """Instant time: sleeping just advances the clock."""
+
+    def __init__(self, start=0.0):
+        self._now = start
+        self.slept = 0.0  # Total time skipped, handy for playthrough stats
+
+    def now(self):
+        return self._now
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self._now += seconds
+            self.slept += seconds
+
+
+def make_clock(speed=1.0):
+    """Clock for a speed setting: 1 real, >1 scaled, 0 instant."""
+    if speed == 0:
+        return VirtualClock()
+    if speed == 1:
+        return Clock()
+    return ScaledClock(speed)
@@ -2,11 +2,12 @@
 Combat system with fully functional minigames for TERMINAL.EXIT.
 Implements UNDERTALE-style turn-based combat with upgrade-based strike zones.
 """
-import time
 import random
-import sys
 import os
 from .ascii_art import cprint, clear_screen, draw_fancy_box, draw_stats_bar, wait_for_continue
+from .clock import Clock
+from .content import EnemySpec, freeze
+from .terminal_io import current_port, use_port
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -28,8 +29,54 @@ class StrikeZone:
         return self.start <= pos <= self.end
 
 
+class StrikeBar:
+    """Strike bar compiled once per attack.
+
+    Builds a position -> zone lookup and pre-renders every cursor frame,
+    so the minigame loop only indexes instead of repainting zones.
+    """
+    RESULTS = (None, 'base', 'bonus')
+    GLYPHS = ('-', '=', '*')
+    FRAME_TIME = 0.06  # Seconds the cursor spends on each position
+
+    def __init__(self, width, zones):
+        """`zones` are (StrikeZone, code) pairs; later pairs win overlaps."""
+        self.width = width
+        lookup = [0] * width
+        for zone, code in zones:
+            for i in range(max(0, zone.start), min(zone.end + 1, width)):
+                lookup[i] = code
+        self.lookup = tuple(lookup)
+        self.template = ''.join(self.GLYPHS[c] for c in self.lookup)
+        self.frames = tuple(
+            '\r[' + self.template[:i] + '▸' + self.template[i + 1:] + ']'
+            for i in range(width)
+        )
+
+    @classmethod
+    def build(cls, width, base_start, base_width, bonus_zones):
+        """Compile a bar from the base zone and (start, width) bonus zones."""
+        zones = [(StrikeZone(start, w, 'blue'), 2) for start, w in bonus_zones]
+        zones.append((StrikeZone(base_start, base_width, 'green'), 1))
+        return cls(width, zones)
+
+    def result_at(self, pos):
+        """Zone hit at a cursor position: 'base', 'bonus' or None."""
+        return self.RESULTS[self.lookup[pos]]
+
+    def cursor_at(self, step):
+        """Cursor position `step` frames in; it bounces between the ends."""
+        if self.width < 2:
+            return 0
+        step %= 2 * (self.width - 1)
+        return step if step < self.width else 2 * (self.width - 1) - step
+
+
 class Enemy:
     """Enemy entity for combat."""
+    __slots__ = ('name', 'hp', 'max_hp', 'attacks', 'description', 'weakness',
+                 'attack_pattern')
+
     def __init__(self, name, hp, attacks, description='', weakness=None):
         self.name = name
         self.hp = hp
@@ -49,40 +96,40 @@ class Enemy:
         return random.choice(self.attacks)
 
 
-# ENEMY DEFINITIONS
-ENEMIES = {
-    'glitch': Enemy(
+# ENEMY DEFINITIONS (shared, read-only templates)
+ENEMIES = freeze({
+    'glitch': EnemySpec(
         'Glitched Sentinel',
         30,
         ['jabs at you erratically', 'lets out a digital shriek', 'fragments into shards'],
         'A corrupted program with distorted edges and flickering form.\nIts attacks are unpredictable and violent.',
         weakness='It seems to follow a pattern beneath the chaos'
     ),
-    'phantom': Enemy(
+    'phantom': EnemySpec(
         'Data Phantom',
         25,
         ['phases through your guard', 'drains your concentration', 'whispers confusing code'],
         'A ethereal entity made of pure data. It shifts when you look at it.\nIts presence makes your thoughts fuzzy.',
         weakness='It needs solid connection—disruption could work'
     ),
-    'fragment': Enemy(
+    'fragment': EnemySpec(
         'Corrupted Fragment',
         20,
         ['strikes with broken code', 'spins chaotically', 'emits a high-frequency pulse'],
         'A shard of corrupted data, hostile and unpredictable.\nSmaller, but no less dangerous.',
         weakness='Its spin attack leaves it temporarily exposed'
     ),
-    'echo': Enemy(
+    'echo': EnemySpec(
         'System Echo',
         35,
         ['echoes your weakness', 'amplifies your fear', 'mirrors your movements'],
         'A reflection of corrupted consciousness. It mirrors your movements.\nThe more you fight, the stronger it becomes.',
         weakness='It\'s powered by negative emotions—compassion confuses it'
     ),
-}
+})
 
 # Enemy drops - unique upgrades from defeated enemies
-ENEMY_DROPS = {
+ENEMY_DROPS = freeze({
     'glitch': {
         'upgrade_name': 'Glitch Analyzer',
         'upgrade_key': 'glitch_analyzer',
@@ -111,16 +158,21 @@ ENEMY_DROPS = {
                         'Dropped by System Echo.'),
         'ability': 'resonate'
     },
-}
+})
 
 
 class CombatSystem:
     """Handles turn-based combat with fully functional minigame."""
     
-    def __init__(self, ai_companion, player_inventory):
+    STRIKE_COMPENSATION = 0.5  # Most key lag (seconds) a strike is judged back by
+    
+    def __init__(self, ai_companion, player_inventory, clock=None, io=None):
         self.ai = ai_companion
         self.inventory = player_inventory
+        self.clock = clock or Clock()
+        self.io = io or current_port()
         self.current_enemy = None
+        self.enemy_key = None
         self.player_hp = 100
         self.max_player_hp = 100
         self.mercy_threshold = 30  # Mercy available below this % HP
@@ -128,6 +180,18 @@ class CombatSystem:
         self.enemy_patterns = {}
         self.strikes_landed = 0
         self.strikes_missed = 0
+        self.outcome = None
+        self.player = None  # Optional bot driving combat (see bots.py)
+    
+    def _clear(self):
+        if self.player is None or not self.player.headless:
+            clear_screen()
+    
+    def _pause(self):
+        if self.player is None:
+            wait_for_continue('> ')
+        else:
+            self.player.pause()
     
     def start_encounter(self, enemy_key):
         """Start a combat encounter."""
@@ -135,41 +199,81 @@ class CombatSystem:
             return False
         
         template = ENEMIES[enemy_key]
-        self.current_enemy = Enemy(
-            template.name,
-            template.max_hp,
-            template.attacks.copy(),
-            template.description,
-            template.weakness
-        )
+        self.enemy_key = enemy_key
+        self.current_enemy = self._spawn(template)
         
         self.player_hp = self.max_player_hp
         self.turn_count = 0
         self.strikes_landed = 0
         self.strikes_missed = 0
+        self.outcome = None
         self.enemy_patterns = {attack: 0 for attack in self.current_enemy.attacks}
         
-        return self._combat_loop()
+        with use_port(self.io):
+            return self._combat_loop()
+    
+    def resume_encounter(self):
+        """Continue an encounter restored by `load_state` at its turn menu."""
+        with use_port(self.io):
+            return self._combat_loop(entrance=False)
+    
+    @staticmethod
+    def _spawn(template):
+        return Enemy(
+            template.name,
+            template.max_hp,
+            list(template.attacks),
+            template.description,
+            template.weakness
+        )
     
-    def _combat_loop(self):
+    def to_state(self):
+        """The encounter in progress, for hibernating a session mid-fight."""
+        enemy = self.current_enemy
+        return {
+            'enemy': self.enemy_key,
+            'enemy_hp': enemy.hp,
+            'attack_pattern': enemy.attack_pattern,
+            'player_hp': self.player_hp,
+            'turn': self.turn_count,
+            'patterns': dict(self.enemy_patterns),
+            'landed': self.strikes_landed,
+            'missed': self.strikes_missed,
+        }
+    
+    def load_state(self, state):
+        self.enemy_key = state['enemy']
+        self.current_enemy = self._spawn(ENEMIES[self.enemy_key])
+        self.current_enemy.hp = state['enemy_hp']
+        self.current_enemy.attack_pattern = state['attack_pattern']
+        self.player_hp = state['player_hp']
+        # Saved at that turn's menu; re-entering the loop starts it again
+        self.turn_count = state['turn'] - 1
+        self.enemy_patterns = dict(state['patterns'])
+        self.strikes_landed = state['landed']
+        self.strikes_missed = state['missed']
+        self.outcome = None
+    
+    def _combat_loop(self, entrance=True):
         """Main combat loop. Returns True if won, False if lost/fled."""
-        # Show enemy entrance
-        clear_screen()
-        print()
-        cprint('▓' * 70, 'red')
-        cprint(f'  ⚔️  {self.current_enemy.name} appears!', 'red')
-        cprint('▓' * 70, 'red')
-        print()
-        cprint(self.current_enemy.description, 'red')
-        print()
-        wait_for_continue('> ')
+        if entrance:
+            # Show enemy entrance
+            self._clear()
+            self.io.print()
+            cprint('▓' * 70, 'red')
+            cprint(f'  ⚔️  {self.current_enemy.name} appears!', 'red')
+            cprint('▓' * 70, 'red')
+            self.io.print()
+            cprint(self.current_enemy.description, 'red')
+            self.io.print()
+            self._pause()
         
         max_turns = 30
         
         while self.player_hp > 0 and self.current_enemy.hp > 0 and self.turn_count < max_turns:
             self.turn_count += 1
             
-            clear_screen()
+            self._clear()
             self._show_combat_display()
             
             choice = self._show_combat_menu()
@@ -183,6 +287,8 @@ class CombatSystem:
             
             elif choice == '2':
                 self._ai_analyze()
+                if self.current_enemy.hp <= 0:
+                    return self._victory()
                 self._enemy_turn()
             
             elif choice == '3':
@@ -193,40 +299,43 @@ class CombatSystem:
                 # Mercy only available when enemy is weak
                 if self.current_enemy.hp <= (self.current_enemy.max_hp * self.mercy_threshold / 100):
                     if self._attempt_mercy():
+                        self.outcome = 'mercy'
                         return True
                     else:
                         self._enemy_turn()
                 else:
-                    clear_screen()
+                    self._clear()
                     self.ai.speak('nervous', 'It\'s too strong right now... it won\'t listen.')
-                    wait_for_continue('> ')
+                    self._pause()
             
             elif choice == '5':
                 if self._attempt_flee():
+                    self.outcome = 'fled'
                     return False
             
             if self.player_hp <= 0:
                 return self._defeat()
         
         # Stalemate
-        clear_screen()
+        self.outcome = 'stalemate'
+        self._clear()
         cprint('The battle drags on indefinitely...', 'yellow')
         cprint('You both pause, at an impasse.', 'yellow')
-        wait_for_continue('> ')
+        self._pause()
         return False
     
     def _show_combat_display(self):
         """Display current combat state."""
-        print()
+        self.io.print()
         cprint('▓' * 70, 'red')
         cprint('  COMBAT', 'red')
         cprint('▓' * 70, 'red')
-        print()
+        self.io.print()
         
         # Enemy info
         cprint(f'  ⚔️  {self.current_enemy.name}', 'red')
         draw_stats_bar(f'   HP', self.current_enemy.hp, self.current_enemy.max_hp, width=50, color='red')
-        print()
+        self.io.print()
         
         # Player info
         cprint(f'  ▸ You', 'cyan')
@@ -237,52 +346,67 @@ class CombatSystem:
         if self.current_enemy.hp <= mercy_threshold:
             cprint(f'   [MERCY AVAILABLE]', 'green')
         
-        print()
+        # Tactical Advisor reads the pre-solved table for this enemy
+        if self.ai.modifiers.advisor:
+            action, win = self._advice()
+            if action:
+                cprint(f'   [ADVISOR] Best move: {action.upper()} '
+                       f'({int(win * 100)}% to win)', 'cyan')
+        
+        self.io.print()
+    
+    def potion_count(self):
+        """Number of healing potions in the inventory."""
+        return sum(1 for item in self.inventory.items
+                   if item.item_type == 'consumable' and 'Potion' in item.name)
+    
+    def _advice(self):
+        """Optimal action and win chance from the Tactical Advisor solver."""
+        from .tactics import advise
+        return advise(self)
     
     def _show_combat_menu(self):
         """Show combat action menu."""
-        print('  TURN OPTIONS:')
-        print('    1. ATTACK (minigame)')
-        print('    2. ANALYZE (AI insight)')
-        print('    3. ITEM (use potion)')
-        print('    4. MERCY (spare if weak)')
-        print('    5. FLEE (try to escape)')
-        print()
-        
-        choice = input('  > ').strip()
+        self.io.print('  TURN OPTIONS:')
+        self.io.print('    1. ATTACK (minigame)')
+        self.io.print('    2. ANALYZE (AI insight)')
+        self.io.print('    3. ITEM (use potion)')
+        self.io.print('    4. MERCY (spare if weak)')
+        self.io.print('    5. FLEE (try to escape)')
+        self.io.print()
+        
+        if self.player is not None:
+            return self.player.choose_action(self)
+        choice = self.io.input('  > ', resume='combat').strip()
         return choice
     
     def _execute_attack(self):
         """Execute attack with UNDERTALE-style minigame."""
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         cprint('═' * 70, 'white')
         cprint('  ATTACK MINIGAME - HIT THE STRIKE ZONE!', 'white')
         cprint('═' * 70, 'white')
-        print()
+        self.io.print()
         
-        # Get bonus zones from upgrades
-        bonus_zones = []
-        for upgrade in self.ai.upgrades:
-            if 'Precision' in upgrade:
-                bonus_zones.append((8, 8))  # (start, width) - bigger zone
-            elif 'Power' in upgrade:
-                bonus_zones.append((2, 5))  # early aggressive zone
+        # Strike zones and damage come from the compiled upgrade table
+        mods = self.ai.modifiers
+        bonus_zones = mods.bonus_zones
         
         # Base strike zone
         width = 30
         base_start = random.randint(10, 16)
-        base_width = 2
-        base_damage = 12
+        base_width = mods.base_zone_width
+        base_damage = 12 + mods.strike_damage
         
-        print("Strike Zones Available:")
-        print(f"  Base Zone (Green): positions {base_start}-{base_start + base_width}")
+        self.io.print("Strike Zones Available:")
+        self.io.print(f"  Base Zone (Green): positions {base_start}-{base_start + base_width}")
         if bonus_zones:
             for i, (start, w) in enumerate(bonus_zones):
-                print(f"  Bonus Zone #{i+1} (Blue): positions {start}-{start + w}")
-        print()
+                self.io.print(f"  Bonus Zone #{i+1} (Blue): positions {start}-{start + w}")
+        self.io.print()
         cprint("Press ENTER to attack in a strike zone!", 'yellow')
-        print()
+        self.io.print()
         
         # Run the minigame
         hit_zone = self._run_strike_game(width, base_start, base_width, bonus_zones)
@@ -300,87 +424,80 @@ class CombatSystem:
             cprint(f'✗ MISS! Barely scratched... {damage} damage.', 'red')
             self.strikes_missed += 1
         
-        print()
-        wait_for_continue('> ')
+        self.io.print()
+        self._pause()
         return damage
     
     def _run_strike_game(self, width, base_start, base_width, bonus_zones):
         """Run the actual minigame loop."""
-        pos = 0
-        direction = 1
-        running = True
+        bar = StrikeBar.build(width, base_start, base_width, bonus_zones)
+        frames = bar.frames
+        
+        # Bots pick where to stop the cursor; headless ones skip the animation
+        target = None
+        if self.player is not None:
+            target = self.player.strike_target(self, bar)
+            if self.player.headless:
+                return bar.result_at(target)
+        start = self.clock.now()
+        step = 0
         result = None
         
-        try:
-            import msvcrt
-            win_based = True
-        except ImportError:
-            win_based = False
-        
-        while running:
-            # Draw the bar
-            bar = ['-'] * width
-            
-            # Draw base zone
-            for i in range(base_start, min(base_start + base_width, width)):
-                bar[i] = '='
-            
-            # Draw bonus zones
-            for start, w in bonus_zones:
-                for i in range(start, min(start + w, width)):
-                    if bar[i] != '=':
-                        bar[i] = '*'
-            
-            # Draw cursor
-            if 0 <= pos < width:
-                bar[pos] = '▸'
-            
-            # Print
-            sys.stdout.write('\r[' + ''.join(bar) + ']')
-            sys.stdout.flush()
-            
-            time.sleep(0.06)
+        while True:
+            # Only the cursor changes between frames; a lagging client
+            # just misses some of them
+            pos = bar.cursor_at(step)
+            if self.io.frame(frames[pos]):
+                self.io.flush()
             
-            # Move cursor
-            pos += direction
-            if pos >= width - 1:
-                direction = -1
-            elif pos <= 0:
-                direction = 1
+            self.clock.sleep(bar.FRAME_TIME)
             
-            # Check for input
-            if win_based:
-                try:
-                    if msvcrt.kbhit():
-                        msvcrt.getch()
-                        # Check zones
-                        if base_start <= pos <= (base_start + base_width):
-                            result = 'base'
-                        else:
-                            for start, w in bonus_zones:
-                                if start <= pos <= (start + w):
-                                    result = 'bonus'
-                                    break
-                        running = False
-                except:
-                    pass
+            # Check for input against the position that was on screen
+            if target is not None:
+                if pos == target:
+                    result = bar.result_at(pos)
+                    break
             else:
-                # Non-Windows fallback - just run for a bit then auto-hit
-                if pos > width // 2:
+                pressed = self.io.key_pressed()
+                if pressed:
+                    result = bar.result_at(self._pressed_at(bar, start, pos))
+                    break
+                if pressed is None and step > width // 2:
+                    # Terminal can't report keys - just run for a bit then auto-hit
                     result = 'base'
-                    running = False
+                    break
+            
+            # The cursor runs on the clock, not on frames drawn: after a
+            # wait for the session's turn it has moved on
+            step += 1
+            if target is None:
+                step = max(step, int((self.clock.now() - start) / bar.FRAME_TIME))
         
-        print()
+        self.io.print()
         return result
     
+    def _pressed_at(self, bar, start, pos):
+        """Where the cursor was when the player pressed the key.
+
+        Remote players see each frame late and their key arrives late, so
+        the press is judged on the cursor's timeline at the time it was
+        made (see Port.key_lag), going back at most STRIKE_COMPENSATION.
+        Ports that can't tell get the frame that was on screen.
+        """
+        lag = self.io.key_lag()
+        if lag is None:
+            return pos
+        at = self.clock.now() - min(lag, self.STRIKE_COMPENSATION)
+        return bar.cursor_at(int(max(0.0, at - start) / bar.FRAME_TIME))
+    
     def _ai_analyze(self):
         """AI provides detailed, useful analysis of enemy."""
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         
         from .ascii_art import render_face
         render_face('thinking', large=True)
-        print()
+        self.io.print()
         
         # Provide ACTUAL useful information
         hp_percent = int(self.current_enemy.hp / self.current_enemy.max_hp * 100)
@@ -394,132 +511,142 @@ class CombatSystem:
         ]
         
         analysis = random.choice(analyses)
+        if self.ai.modifiers.advisor:
+            action, win = self._advice()
+            if action:
+                analysis = (f'Optimal move: {action.upper()} - '
+                            f'{int(win * 100)}% chance we win this.')
         draw_fancy_box('AI Analysis', [analysis], width=60, color='cyan')
         
         # Deal damage while analyzing
-        damage = random.randint(4, 9)
+        damage = random.randint(4, 9) + self.ai.modifiers.analyze_damage
         self.current_enemy.take_damage(damage)
         cprint(f'  ▸ Your focused analysis dealt {damage} damage!', 'yellow')
         
-        print()
-        wait_for_continue('> ')
+        self.io.print()
+        self._pause()
     
     def _use_item(self):
         """Use an item from inventory."""
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         
         items = [item for item in self.inventory.items if item.item_type == 'consumable']
         
         if not items:
             cprint('  You have no consumable items!', 'red')
-            print()
-            wait_for_continue('> ')
+            self.io.print()
+            self._pause()
             return
         
         draw_fancy_box('Use Item', [f'{i+1}. {item.name}' for i, item in enumerate(items)], width=60, color='yellow')
         
-        choice = input('  > ').strip()
+        if self.player is not None:
+            choice = self.player.choose_item(self, items)
+        else:
+            choice = self.io.input('  > ').strip()
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(items):
                 item = items[idx]
                 if 'Potion' in item.name:
-                    heal = 30
+                    heal = 30 + self.ai.modifiers.heal_bonus
                     self.player_hp = min(self.max_player_hp, self.player_hp + heal)
                     cprint(f'  Recovered {heal} HP!', 'green')
-                    self.inventory.items.remove(item)
+                    self.inventory.remove(item)
                 else:
                     cprint(f'  Used {item.name}!', 'green')
-                    self.inventory.items.remove(item)
-            print()
-            wait_for_continue('> ')
+                    self.inventory.remove(item)
+            self.io.print()
+            self._pause()
         except (ValueError, IndexError):
             cprint('  Invalid choice!', 'red')
-            wait_for_continue('> ')
+            self._pause()
     
     def _enemy_turn(self):
         """Execute enemy's turn."""
-        time.sleep(0.3)
+        self.clock.sleep(0.3)
         attack = self.current_enemy.get_attack()
         
-        # Damage scales with AI bond - better AI = less damage
+        # Bond and shield upgrades reduce damage (precompiled)
         base_damage = random.randint(5, 12)
-        mitigation = int(self.ai.bond * 4)  # AI helps reduce damage
+        mitigation = self.ai.modifiers.mitigation
         damage = max(1, base_damage - mitigation)
         
         self.player_hp = max(0, self.player_hp - damage)
         
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         cprint(f'  ⚡ {self.current_enemy.name} {attack}!', 'red')
         if mitigation > 0:
             cprint(f'  ▸ Aria: "I\'ve got your back!" (-{mitigation} damage)', 'yellow')
         cprint(f'  You took {damage} damage!', 'red')
-        print()
-        wait_for_continue('> ')
+        self.io.print()
+        self._pause()
     
     def _attempt_mercy(self):
         """Try to spare the enemy. Returns True if successful."""
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         
         from .ascii_art import render_face
         render_face('sad', large=True)
-        print()
+        self.io.print()
         
         cprint('  You reach out with compassion...', 'white')
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         
-        # Higher success with better AI bond
-        success_rate = 0.4 + (self.ai.bond * 0.3)
+        # Higher success with better AI bond and mercy upgrades
+        success_rate = self.ai.modifiers.mercy_chance
         success = random.random() < success_rate
         
         if success:
             cprint('  The enemy hesitates... and retreats.', 'green')
             self.ai.bond = min(1.0, self.ai.bond + 0.15)
             cprint(f'  ▸ Aria: "You... you showed mercy. That means something to me."', 'yellow')
-            print()
-            wait_for_continue('> ')
+            self.io.print()
+            self._pause()
             return True
         else:
             cprint('  But it doesn\'t understand mercy.', 'red')
-            print()
-            wait_for_continue('> ')
+            self.io.print()
+            self._pause()
             return False
     
     def _attempt_flee(self):
         """Try to flee from combat."""
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         
         cprint('  You try to escape...', 'white')
-        time.sleep(0.3)
+        self.clock.sleep(0.3)
         
         # Success based on strikes landed
-        flee_chance = 0.3 + (self.strikes_landed * 0.15)
+        mods = self.ai.modifiers
+        flee_chance = mods.flee_chance + (self.strikes_landed * mods.flee_per_strike)
         success = random.random() < flee_chance
         
         if success:
             cprint('  You manage to escape!', 'green')
-            print()
-            wait_for_continue('> ')
+            self.io.print()
+            self._pause()
             return True
         else:
             cprint('  You can\'t get away!', 'red')
-            print()
-            wait_for_continue('> ')
+            self.io.print()
+            self._pause()
             self._enemy_turn()
             return False
     
     def _victory(self):
         """Handle victory."""
-        clear_screen()
-        print()
+        self.outcome = 'victory'
+        self._clear()
+        self.io.print()
         cprint('═' * 70, 'green')
         cprint('  VICTORY!', 'green')
         cprint('═' * 70, 'green')
-        print()
+        self.io.print()
         cprint(f'  You defeated the {self.current_enemy.name}!', 'green')
         
         # Bond and stats
@@ -533,23 +660,17 @@ class CombatSystem:
         from .ascii_art import render_face
         render_face('happy', large=True)
         cprint(f'  ▸ "We did it! That was amazing!"', 'yellow')
-        print()
+        self.io.print()
         
         # Check for enemy drop
         self._handle_enemy_drop()
         
-        wait_for_continue('> ')
+        self._pause()
         return True
     
     def _handle_enemy_drop(self):
         """Handle dropping unique upgrade from defeated enemy."""
-        # Find which enemy was defeated
-        enemy_key = None
-        for key, enemy in ENEMIES.items():
-            if enemy.name == self.current_enemy.name:
-                enemy_key = key
-                break
-        
+        enemy_key = self.enemy_key
         if not enemy_key or enemy_key not in ENEMY_DROPS:
             return
         
@@ -563,18 +684,21 @@ class CombatSystem:
         )
         
         # Display drop message
-        print()
+        self.io.print()
         cprint('═' * 70, 'cyan')
         cprint(f'  ✦ UPGRADE ACQUIRED: {drop["upgrade_name"]}', 'cyan')
         cprint('═' * 70, 'cyan')
         cprint(f'  {drop["description"]}', 'white')
-        print()
+        self.io.print()
         cprint('  Add this upgrade to Aria?', 'yellow')
-        print('  1. YES - Install upgrade now')
-        print('  2. NO - Keep in inventory')
-        print()
+        self.io.print('  1. YES - Install upgrade now')
+        self.io.print('  2. NO - Keep in inventory')
+        self.io.print()
         
-        choice = input('  > ').strip()
+        if self.player is not None:
+            choice = self.player.choose_install(self, drop)
+        else:
+            choice = self.io.input('  > ').strip()
         if choice == '1':
             self._install_upgrade_to_ai(upgrade_item, drop)
         else:
@@ -583,45 +707,46 @@ class CombatSystem:
     
     def _install_upgrade_to_ai(self, item, drop_info):
         """Install a dropped upgrade to the AI companion."""
-        self.ai.upgrades.append(drop_info['upgrade_name'])
-        self.ai.bond = min(1.0, self.ai.bond + 0.05)
+        self.inventory.remove(item)
+        self.ai.install_upgrade(drop_info['upgrade_name'])
         
         from .ascii_art import render_face
-        clear_screen()
-        print()
+        self._clear()
+        self.io.print()
         render_face('happy', large=True)
         cprint(f'  ▸ "Wow! I can feel new abilities unlocking!"',
                'green')
         cprint(f'  ▸ "Thanks for this! I\'m getting stronger thanks to you!"',
                'yellow')
-        print()
+        self.io.print()
         cprint(f'  Aria has learned: {drop_info["upgrade_name"]}',
                'cyan')
         
-        wait_for_continue('> ')
+        self._pause()
     
     def _defeat(self):
         """Handle defeat."""
-        clear_screen()
-        print()
+        self.outcome = 'defeat'
+        self._clear()
+        self.io.print()
         cprint('═' * 70, 'red')
         cprint('  DEFEATED!', 'red')
         cprint('═' * 70, 'red')
-        print()
+        self.io.print()
         cprint('  The darkness claims you...', 'red')
         cprint('  But then, a voice...', 'white')
-        print()
+        self.io.print()
         
         from .ascii_art import render_face
         render_face('nervous', large=True)
         cprint('  ▸ "No, no no NO! Please... I can\'t lose you!"',
                'yellow')
-        print()
+        self.io.print()
         
         # Revive with reduced HP
         self.player_hp = self.max_player_hp // 2
         self.ai.bond = min(1.0, self.ai.bond + 0.05)
         cprint('  You wake up, battered but alive.', 'white')
         cprint('  Aria looks genuinely worried.', 'yellow')
-        wait_for_continue('> ')
+        self._pause()
         return False
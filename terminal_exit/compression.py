@@ -0,0 +1,78 @@
+"""
+Save compression for TERMINAL.EXIT.
+Codecs come from the standard library and are named 'none', 'zlib',
+'zlib:<level>', 'bz2' and 'lzma'. Each leaves its own magic bytes at the
+front of the data, so loading detects the codec without being told.
+"""
+import bz2
+import lzma
+import zlib
+
+DEFAULT_ZLIB_LEVEL = 6
+_FLEVEL = (1, 5, 6, 9)  # A level for each zlib header FLEVEL class
+
+
+def _zlib(level):
+    return lambda data: zlib.compress(data, level)
+
+
+def codec(name):
+    """Compression function for a codec name. Raises ValueError."""
+    kind, _, level = name.partition(':')
+    if kind == 'none' and not level:
+        return bytes
+    if kind == 'zlib':
+        level = int(level) if level else DEFAULT_ZLIB_LEVEL
+        if not 0 <= level <= 9:
+            raise ValueError(f'zlib level must be 0-9, got {level}')
+        return _zlib(level)
+    if kind == 'bz2' and not level:
+        return bz2.compress
+    if kind == 'lzma' and not level:
+        return lzma.compress
+    raise ValueError(f'Unknown compression codec: {name}')
+
+
+CODECS = ('none', 'zlib:1', 'zlib:6', 'zlib:9', 'bz2', 'lzma')
+
+
+def compress(data, name='none'):
+    return codec(name)(data)
+
+
+def detect(data):
+    """Codec that produced `data` ('none' for plain saves)."""
+    if data[:3] == b'BZh':
+        return 'bz2'
+    if data[:6] == b'\xfd7zXZ\x00':
+        return 'lzma'
+    # zlib: deflate method in the low nibble, header divisible by 31.
+    # Plain saves start with '{', whitespace or the binary magic, none of
+    # which pass this check.
+    if len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0:
+        return 'zlib'
+    return 'none'
+
+
+def detect_codec(data):
+    """Codec name to write `data` again the way it was written.
+
+    zlib headers only record the level's class (fastest, fast, default,
+    maximum), so zlib data gets a level from the same class: exact for
+    1, 6 and 9.
+    """
+    kind = detect(data)
+    if kind == 'zlib':
+        return f'zlib:{_FLEVEL[data[1] >> 6]}'
+    return kind
+
+
+def decompress(data):
+    kind = detect(data)
+    if kind == 'bz2':
+        return bz2.decompress(data)
+    if kind == 'lzma':
+        return lzma.decompress(data)
+    if kind == 'zlib':
+        return zlib.decompress(data)
+    return data
@@ -0,0 +1,61 @@
+"""
+Shared game content for TERMINAL.EXIT.
+Rooms, enemies, drops, upgrades and art are built once per process and
+read by every session, so they must never change while the game runs.
+`freeze()` turns nested dicts and lists into read-only mappings and
+tuples with interned strings, and `Record` is an immutable __slots__
+base for content rows. A session keeps only its own progress.
+"""
+import sys
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Read-only copy of nested content: dicts become mappingproxies,
+    lists become tuples, strings are interned."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({freeze(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+class Record:
+    """Immutable content row. Subclasses list their fields in __slots__."""
+
+    __slots__ = ()
+
+    def __init__(self, *values, **fields):
+        fields.update(zip(self.__slots__, values))
+        for name in self.__slots__:
+            object.__setattr__(self, name, freeze(fields.get(name)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is shared content and read-only')
+
+    def __delattr__(self, name):
+        self.__setattr__(name, None)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({getattr(self, self.__slots__[0])!r})'
+
+
+class RoomSpec(Record):
+    """A room as designed; per-session progress lives on world_manager.Room."""
+
+    __slots__ = ('name', 'description', 'options', 'neighbors', 'coord', 'zone',
+                 'encounter')
+
+
+class EnemySpec(Record):
+    """An enemy template; combat fights a mutable Enemy made from it."""
+
+    __slots__ = ('name', 'max_hp', 'attacks', 'description', 'weakness')
+
+    @property
+    def hp(self):
+        return self.max_hp
@@ -0,0 +1,104 @@
+"""
+Upgrade effects for TERMINAL.EXIT.
+Installed upgrades are compiled into a single modifier table that combat
+reads directly, instead of re-checking upgrade names every turn.
+"""
+from functools import lru_cache
+
+from .content import Record, freeze
+
+
+# What each upgrade ability changes. Keys match `Upgrade.ability` and the
+# 'ability' field of combat drops.
+EFFECTS = freeze({
+    'analyze': {'analyze_damage': 2},
+    'predict': {'bonus_zones': ((8, 8),)},
+    'detect_weakness': {'strike_damage': 4},
+    'advise': {'advisor': True},
+    'shield': {'mitigation': 2},
+    'mercy': {'mercy_chance': 0.2},
+    'navigate': {'flee_chance': 0.1},
+    'analyze_glitch': {'bonus_zones': ((2, 5),)},
+    'phase_shift': {'flee_chance': 0.2},
+    'reassemble': {'heal_bonus': 10},
+    'resonate': {'mercy_chance': 0.1, 'mitigation': 1},
+})
+
+
+class Modifiers(Record):
+    """Precomputed combat numbers for a set of upgrades and a bond level.
+
+    Compiled tables are cached and shared by every session, so they are
+    read-only; `with_effect` builds a new one.
+    """
+
+    __slots__ = ('bonus_zones', 'base_zone_width', 'strike_damage', 'analyze_damage',
+                 'heal_bonus', 'mitigation', 'flee_chance', 'flee_per_strike',
+                 'mercy_chance', 'advisor')
+
+    def __init__(self, **fields):
+        defaults = dict(
+            bonus_zones=(),         # (start, width) pairs on the strike bar
+            base_zone_width=2,
+            strike_damage=0,        # Added to landed strikes
+            analyze_damage=0,       # Added to ANALYZE chip damage
+            heal_bonus=0,           # Added to potion healing
+            mitigation=0,           # Subtracted from enemy hits
+            flee_chance=0.3,
+            flee_per_strike=0.15,
+            mercy_chance=0.4,
+            advisor=False,
+        )
+        super().__init__(**dict(defaults, **fields))
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'Modifiers({fields})'
+
+    def with_effect(self, effect):
+        """A copy of this table with one effect dict folded in."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        for key, value in effect.items():
+            if key == 'bonus_zones':
+                fields[key] += tuple(value)
+            elif key == 'advisor':
+                fields[key] = fields[key] or value
+            else:
+                fields[key] += value
+        return Modifiers(**fields)
+
+
+_ABILITY_BY_NAME = {}
+
+
+def ability_for(upgrade_name):
+    """Look up the ability behind an installed upgrade's display name."""
+    if not _ABILITY_BY_NAME:
+        from .upgrades import UPGRADES
+        from .combat_system import ENEMY_DROPS
+        for upgrade in UPGRADES.values():
+            _ABILITY_BY_NAME[upgrade.name] = upgrade.ability
+        for drop in ENEMY_DROPS.values():
+            _ABILITY_BY_NAME[drop['upgrade_name']] = drop['ability']
+    return _ABILITY_BY_NAME.get(upgrade_name)
+
+
+def compile_modifiers(upgrade_names, bond=0.0):
+    """Build (or reuse) the modifier table for these upgrades and bond.
+
+    Install order doesn't change the numbers and bond moves in steps of
+    0.05, so tables are shared by sorted names and bond to 2 places.
+    """
+    return _compile(tuple(sorted(upgrade_names)), round(bond, 2))
+
+
+@lru_cache(maxsize=256)
+def _compile(upgrade_names, bond):
+    mods = Modifiers()
+    for name in upgrade_names:
+        effect = EFFECTS.get(ability_for(name))
+        if effect:
+            mods = mods.with_effect(effect)
+
+    # Bond-driven support from Aria
+    return mods.with_effect({'mitigation': int(bond * 4), 'mercy_chance': bond * 0.3})
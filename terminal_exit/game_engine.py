@@ -5,30 +5,64 @@ from .ascii_art import (render_face, cprint, wait_for_continue,
                         draw_location_box)
 from .world_manager import WorldManager
 from .inventory import Inventory
-from .save_load import SaveLoad
+from .save_load import SaveLoad, SaveError, describe_header
+from .journal import Journal
+from . import serialization
+from .streaming import StreamLoader, export_stream
 from .interactive_intro import InteractiveIntro
 from .combat_system import CombatSystem
-import time
+from .clock import Clock
+from .autosave import shared_worker
+from .terminal_io import Disconnected, Hibernated, StdioPort, use_port
 import random
 
+# Slot holding where a hibernated session stopped; negative slots are
+# left out of slot listings, so it never shows in the load menu
+HIBERNATE_SLOT = -1
+
 
 class GameEngine:
-    def __init__(self):
+    def __init__(self, clock=None, autosave=None, saver=None, io=None, world=None):
+        self.clock = clock or Clock()
+        self.io = io or StdioPort()
+        self.autosave = autosave or shared_worker()
         self.ai = AICompanion()
-        self.world = WorldManager()
+        self.world = world or WorldManager()
         self.inventory = Inventory()
-        self.combat = CombatSystem(self.ai, self.inventory)
-        self.saver = SaveLoad()
+        self.combat = CombatSystem(self.ai, self.inventory, clock=self.clock,
+                                   io=self.io)
+        self.saver = saver or SaveLoad()
+        self.journal = Journal(self.saver, autosave=self.autosave)
+        self.importing = None  # StreamLoader still reading far rooms
         self.running = True
         self.player_state = {
             'intro_seen': False,
             'tutorial_completed': False,
             'location': 'awakening_point',
         }
+        self.resume_playtime(0.0)
+        for part in (self.ai, self.world, self.inventory):
+            part.listener = self._state_changed
+
+    def playtime(self):
+        """Seconds played, including earlier sessions of a loaded game."""
+        return self._playtime_base + self.clock.now() - self._session_start
+
+    def resume_playtime(self, seconds):
+        self._playtime_base = seconds
+        self._session_start = self.clock.now()
+
+    def _state_changed(self, kind, data):
+        """Journal every tracked change; autosave writes it in the background."""
+        self.journal.record(kind, data)
+
+    def _set_player(self, key, value):
+        self.player_state[key] = value
+        self._state_changed('player', {'key': key, 'value': value})
 
     def _show_main_menu(self):
         clear_screen()
-        print()
+        self.io.print()
         draw_fancy_box('TERMINAL.EXIT', [
             'A text-based escape adventure',
             '',
@@ -36,25 +70,53 @@ class GameEngine:
             'Guided by an AI companion',
             'Uncover secrets. Make choices. Find escape.'
         ], width=60, color='cyan')
-        print()
+        self.io.print()
         draw_menu('Main Menu', ['New Game', 'Load Game', 'Quit'], width=50, color='yellow')
 
     def _new_game(self):
         """Start a new game with interactive intro."""
-        intro = InteractiveIntro(self.ai, self.world, self.inventory)
+        if not self._confirm_new_game():
+            return
+        self.resume_playtime(0.0)
+        try:
+            self.journal.start(self)
+        except SaveError as e:
+            cprint(f'Warning: progress will not be saved ({e})', 'red')
+            wait_for_continue()
+        intro = InteractiveIntro(self.ai, self.world, self.inventory,
+                                 clock=self.clock, io=self.io)
         intro.play()
         
-        self.player_state['intro_seen'] = True
+        self._set_player('intro_seen', True)
         self._explore_loop()
 
+    def _confirm_new_game(self):
+        """A new game replaces the save in this slot; ask before it does."""
+        try:
+            exists = self.saver.slot in self.saver.list_slots()
+        except (OSError, SaveError):
+            exists = False
+        if not exists:
+            return True
+        try:
+            header = self.saver.read_header()
+        except SaveError:
+            header = None  # Damaged, but still the player's save
+        clear_screen()
+        cprint('Starting a new game will overwrite your saved game:', 'yellow')
+        if header:
+            cprint(describe_header(header), 'white')
+        answer = self.io.input('Overwrite it? (y/N) > ').strip().lower()
+        return answer in ('y', 'yes')
+
     def _show_cutaway(self, text, ai_mood=None, ai_text=None):
         """Show a focused scene: clear screen, display text, optionally AI dialogue, wait for Enter."""
         clear_screen()
         cprint(text, 'white')
         if ai_mood and ai_text:
-            print()
+            self.io.print()
             self.ai.speak(ai_mood, ai_text)
-        print()
+        self.io.print()
         wait_for_continue('Press Enter to continue...')
 
     def _begin_exploration(self):
@@ -70,28 +132,34 @@ class GameEngine:
         cprint('\n', 'white')
         
         cprint('   "Okay! Time to really explore. Stay alert, and remember—', 'green')
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         cprint('   no matter what we find, we\'re in this together."', 'green')
-        time.sleep(1)
+        self.clock.sleep(1)
         
         cprint('\n', 'white')
         wait_for_continue('Press Enter to begin...> ')
 
-    def _explore_loop(self):
+    def _explore_loop(self, resume_combat=False):
         """Main exploration loop with combat integration."""
         while True:
+            self._continue_import()
             location = self.world.current_room
             
             # Check for encounter (only once per room)
             if location.encounter and not location.encounter_cleared:
-                clear_screen()
-                render_face('nervous', large=True)
-                cprint(f'\n  "Wait... I sense something in this area!"', 'yellow')
-                wait_for_continue('> ')
-                
-                # Run combat
-                victory = self.combat.start_encounter(location.encounter)
-                location.encounter_cleared = True
+                if resume_combat:
+                    # Woken from hibernation mid-fight
+                    resume_combat = False
+                    victory = self.combat.resume_encounter()
+                else:
+                    clear_screen()
+                    render_face('nervous', large=True)
+                    cprint(f'\n  "Wait... I sense something in this area!"', 'yellow')
+                    wait_for_continue('> ')
+                    
+                    # Run combat
+                    victory = self.combat.start_encounter(location.encounter)
+                self.world.clear_encounter(location)
                 
                 if victory:
                     self.ai.set_mood('happy')
@@ -108,24 +176,24 @@ class GameEngine:
                 continue
             
             # Display location with fancy UI
-            print()
+            self.io.print()
             draw_location_box(location.name, location.description,
                               width=80, color='magenta')
             
             minimap = self.world.render_minimap()
             draw_fancy_box('MAP', minimap, width=30, color='blue')
             
-            print('EXPLORATION ACTIONS:')
+            self.io.print('EXPLORATION ACTIONS:')
             for i, opt in enumerate(location.options, start=1):
-                print(f"  {i}. {opt}")
-            print(f"  {len(location.options)+1}. Check AI Status")
-            print(f"  {len(location.options)+2}. Inventory")
-            print(f"  {len(location.options)+3}. Return to Main Menu")
-            print()
-            print('MOVEMENT: Type "up", "down", "left", or "right" to move')
-            print()
+                self.io.print(f"  {i}. {opt}")
+            self.io.print(f"  {len(location.options)+1}. Check AI Status")
+            self.io.print(f"  {len(location.options)+2}. Inventory")
+            self.io.print(f"  {len(location.options)+3}. Return to Main Menu")
+            self.io.print()
+            self.io.print('MOVEMENT: Type "up", "down", "left", or "right" to move')
+            self.io.print()
             
-            choice = input('> ').strip().lower()
+            choice = self.io.input('> ', resume='explore').strip().lower()
             
             # Check if input is a direction
             if choice in ['up', 'down', 'left', 'right']:
@@ -164,10 +232,15 @@ class GameEngine:
                 wait_for_continue()
             
             elif ci == len(location.options)+3:
-                # Return to menu
+                # Return to menu (progress is saved on the way out)
                 clear_screen()
+                try:
+                    self.save_game()
+                    cprint('Progress saved.', 'green')
+                except SaveError as e:
+                    cprint(f'Save failed: {e}', 'red')
                 cprint('\n"Until next time..."', 'yellow')
-                time.sleep(0.5)
+                self.clock.sleep(0.5)
                 break
             
             elif 1 <= ci <= len(location.options):
@@ -191,7 +264,7 @@ class GameEngine:
             clear_screen()
             render_face(self.ai.mood, large=True)
             self.ai.describe()
-            print()
+            self.io.print()
             
             # Get available upgrades from inventory
             available_upgrades = [
@@ -200,15 +273,15 @@ class GameEngine:
             ]
             
             if available_upgrades:
-                print('AVAILABLE UPGRADES:')
+                self.io.print('AVAILABLE UPGRADES:')
                 for i, upgrade in enumerate(available_upgrades, 1):
-                    print(f'  {i}. {upgrade.name}')
-                    print(f'     {upgrade.desc}')
-                print()
-                print('  0. Return to Game')
-                print()
+                    self.io.print(f'  {i}. {upgrade.name}')
+                    self.io.print(f'     {upgrade.desc}')
+                self.io.print()
+                self.io.print('  0. Return to Game')
+                self.io.print()
                 
-                choice = input('  > ').strip()
+                choice = self.io.input('  > ').strip()
                 
                 if choice == '0':
                     break
@@ -224,27 +297,24 @@ class GameEngine:
                     continue
             else:
                 msg = 'No upgrades available yet. Defeat enemies!'
-                print(msg)
-                print()
+                self.io.print(msg)
+                self.io.print()
                 wait_for_continue('Press Enter to return...')
                 break
     
     def _install_upgrade(self, upgrade_item):
         """Install an upgrade to the AI companion."""
         clear_screen()
-        print()
+        self.io.print()
         render_face('happy', large=True)
-        print()
+        self.io.print()
         cprint(f'Installing: {upgrade_item.name}', 'cyan')
         cprint(f'{upgrade_item.desc}', 'white')
-        print()
-        
-        # Add to AI upgrades and inventory
-        self.ai.upgrades.append(upgrade_item.name)
-        self.inventory.items.remove(upgrade_item)
+        self.io.print()
         
-        # Increase bond
-        self.ai.bond = min(1.0, self.ai.bond + 0.05)
+        # Move from inventory to AI (also increases bond)
+        self.inventory.remove(upgrade_item)
+        self.ai.install_upgrade(upgrade_item.name)
         
         # AI dialogue
         dialogues = [
@@ -256,21 +326,138 @@ class GameEngine:
         
         self.ai.speak('happy', random.choice(dialogues))
         
-        print()
+        self.io.print()
         wait_for_continue('> ')
 
-    def run(self):
+    def export_save(self, path):
+        """Stream the game state to an NDJSON file (.gz to compress)."""
+        self._finish_import()
+        export_stream(self, path)
+
+    def import_save(self, path):
+        """Start playing from an exported file; far rooms load during play."""
+        self.journal.engine = None  # Don't journal a half-loaded world
+        self.importing = StreamLoader(self, path).until_ready()
+        self._continue_import()
+
+    def _continue_import(self):
+        """Read a little more of a streamed import each turn."""
+        if self.importing is None:
+            return
+        here = self.world.current_room
+        try:
+            self.importing.ensure([here] + self.world.adjacent(here))
+            more = self.importing.step()
+        except (ValueError, OSError, EOFError):
+            self._import_failed()
+            wait_for_continue('> ')
+            return
+        if not more:
+            self.importing = None
+            self.journal.start(self)
+
+    def _finish_import(self):
+        if self.importing is not None:
+            try:
+                self.importing.finish()
+            except (ValueError, OSError, EOFError):
+                self._import_failed()
+                return
+            self.importing = None
+            self.journal.start(self)
+
+    def _import_failed(self):
+        """A streamed import broke off mid-file (truncated or damaged).
+        Play goes on with what was read; rooms it never reached keep
+        their starting state, and that world becomes the save."""
+        self.importing.close()
+        self.importing = None
+        self.ai.speak('nervous', "Part of that save was damaged. Some rooms are "
+                                 "back to how we first found them.")
+        self.journal.start(self)
+
+    def save_game(self):
+        """Write a full snapshot and clear the journal it covers."""
+        self._finish_import()
+        self.journal.attach(self)
+        self.journal.compact()
+        return True
+
+    def load_game(self):
+        """Restore snapshot + journal. Returns False if there is no save."""
+        return self.journal.load(self)
+
+    def hibernate(self, point):
+        """Save everything needed to pick up at resume point `point`
+        ('explore' or 'combat') so the host can free this engine.
+
+        Called by a hosting port while the player idles at that prompt;
+        returns False (and the session stays awake) if it can't be saved.
+        """
+        record = {'version': serialization.SCHEMA_VERSION, 'point': point,
+                  'combat': self.combat.to_state() if point == 'combat' else None}
+        try:
+            self.save_game()
+            self.saver.save(record, slot=HIBERNATE_SLOT, name='Hibernated')
+        except SaveError:
+            return False
+        return True
+
+    def resume(self):
+        """Continue a hibernated session, if this save has one."""
+        try:
+            record = self.saver.load(HIBERNATE_SLOT)
+            if not record or not self.load_game():
+                return False
+            self.saver.delete(HIBERNATE_SLOT)
+        except SaveError:
+            return False  # Start from the menu; the main save is intact
+        if record['combat'] is not None:
+            self.combat.load_state(record['combat'])
+        self._explore_loop(resume_combat=record['combat'] is not None)
+        return True
+
+    def run(self, resume=False):
+        """Play until the player quits; with `resume`, first continue a
+        hibernated session if there is one."""
+        with use_port(self.io):
+            try:
+                if resume:
+                    self.resume()
+                self._menu_loop()
+            except Disconnected:
+                # Terminal closed mid-game: keep whatever was journaled
+                self.running = False
+                self.autosave.flush()
+            except Hibernated:
+                self.running = False  # Already saved by hibernate()
+
+    def _menu_loop(self):
         while self.running:
             self._show_main_menu()
-            choice = input('> ').strip()
+            choice = self.io.input('> ').strip()
             if choice == '1':
                 self._new_game()
             elif choice == '2':
-                state = self.saver.load()
-                if state:
+                try:
+                    loaded = self.load_game()
+                except SaveError as e:
+                    clear_screen()
+                    cprint(f'Could not load save: {e}', 'red')
+                    wait_for_continue()
+                    continue
+                if loaded:
                     clear_screen()
-                    cprint('Loaded save (minimal demo).', 'green')
+                    cprint(f'Save loaded. Resuming at '
+                           f'{self.world.current_room.name}.', 'green')
+                    header = self.saver.read_header()
+                    if header:
+                        cprint(describe_header(header), 'white')
+                    if self.journal.recovered:
+                        cprint(f'Recovered from a damaged save: '
+                               f'{self.journal.recovered}', 'yellow')
                     wait_for_continue()
+                    self._explore_loop()
                 else:
                     clear_screen()
                     cprint('No save found.', 'yellow')
@@ -278,10 +465,11 @@ class GameEngine:
             elif choice == '3':
                 clear_screen()
                 cprint('Quitting. Goodbye.', 'white')
+                self.autosave.flush()
                 self.running = False
             else:
                 continue
 
 
-def run():
-    GameEngine().run()
+def run(clock=None, autosave=None, io=None):
+    GameEngine(clock=clock, autosave=autosave, io=io).run()
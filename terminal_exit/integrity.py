@@ -0,0 +1,102 @@
+"""
+Integrity checks for TERMINAL.EXIT saves.
+Save bodies are split into blocks, each stored with its length and
+CRC32, so a damaged save names the exact block that went bad instead of
+failing somewhere inside the decoder. Journal entries carry a CRC32
+prefix per line. See verify_saves.py to check a whole directory.
+"""
+import struct
+import zlib
+
+FRAME_MAGIC = b'TXK\x01'
+BLOCK_SIZE = 64 * 1024
+_FRAME_HEAD = struct.Struct('<I')   # Block size
+_BLOCK_HEAD = struct.Struct('<II')  # Length, CRC32 (length 0 ends the frame)
+
+
+class BlockError(ValueError):
+    """A checksummed block is damaged or missing."""
+
+    def __init__(self, message, block=None):
+        super().__init__(message)
+        self.block = block
+
+
+def frame(payload, block_size=BLOCK_SIZE):
+    """Wrap bytes in checksummed blocks."""
+    out = [FRAME_MAGIC, _FRAME_HEAD.pack(block_size)]
+    count = 0
+    for start in range(0, len(payload), block_size):
+        block = payload[start:start + block_size]
+        out.append(_BLOCK_HEAD.pack(len(block), zlib.crc32(block)))
+        out.append(block)
+        count += 1
+    out.append(_BLOCK_HEAD.pack(0, count))
+    return b''.join(out)
+
+
+def iter_blocks(read):
+    """Yield verified blocks from a reader (e.g. `file.read`) positioned
+    at the start of a frame. Raises BlockError naming the bad block."""
+    head = read(len(FRAME_MAGIC) + _FRAME_HEAD.size)
+    if head[:len(FRAME_MAGIC)] != FRAME_MAGIC or len(head) < len(FRAME_MAGIC) + _FRAME_HEAD.size:
+        raise BlockError('missing checksum frame')
+    (block_size,) = _FRAME_HEAD.unpack_from(head, len(FRAME_MAGIC))
+    index = 0
+    while True:
+        raw = read(_BLOCK_HEAD.size)
+        if len(raw) < _BLOCK_HEAD.size:
+            raise BlockError(f'truncated before block {index}', index)
+        length, crc = _BLOCK_HEAD.unpack(raw)
+        if length == 0:
+            if crc != index:
+                raise BlockError(f'frame ends after {index} blocks, expected {crc}', index)
+            return
+        if length > block_size:
+            raise BlockError(f'block {index} has a bad length ({length})', index)
+        block = read(length)
+        offset = index * block_size
+        if len(block) < length:
+            raise BlockError(f'block {index} is truncated '
+                             f'(bytes {offset}-{offset + length - 1})', index)
+        if zlib.crc32(block) != crc:
+            raise BlockError(f'block {index} checksum mismatch '
+                             f'(bytes {offset}-{offset + length - 1})', index)
+        yield block
+        index += 1
+
+
+def unframe(data):
+    """Payload of framed bytes; unframed (older) data is returned as is."""
+    if not data.startswith(FRAME_MAGIC):
+        return data
+    view = memoryview(data)
+    pos = 0
+
+    def read(n):
+        nonlocal pos
+        chunk = view[pos:pos + n]
+        pos += n
+        return chunk
+
+    return b''.join(iter_blocks(read))
+
+
+def seal_line(line):
+    """Journal line with a CRC32 prefix."""
+    return f'{zlib.crc32(line.encode("utf-8")):08x} {line}'
+
+
+def open_line(line):
+    """Inverse of seal_line. Raises BlockError if the entry is damaged.
+    Lines written before checksums existed are returned unchanged."""
+    if line.startswith('['):
+        return line
+    crc, _, body = line.partition(' ')
+    try:
+        ok = int(crc, 16) == zlib.crc32(body.encode('utf-8'))
+    except ValueError:
+        ok = False
+    if not ok:
+        raise BlockError('journal entry checksum mismatch')
+    return body
@@ -2,57 +2,61 @@
 Streamlined, interactive intro and tutorial for TERMINAL.EXIT.
 Short, engaging, with integrated gameplay learning.
 """
-import time
 from .ascii_art import (
     render_face, cprint, wait_for_continue, clear_screen,
     draw_fancy_box, draw_scene_box, draw_menu, TITLE_BANNER
 )
+from .clock import Clock
+from .terminal_io import current_port, use_port
 
 
 class InteractiveIntro:
     """Streamlined intro with integrated gameplay."""
     
-    def __init__(self, ai_companion, world_manager, inventory):
+    def __init__(self, ai_companion, world_manager, inventory, clock=None, io=None):
         self.ai = ai_companion
         self.world = world_manager
         self.inventory = inventory
+        self.clock = clock or Clock()
+        self.io = io or current_port()
         self.completed = False
     
     def play(self):
         """Play the complete interactive intro."""
-        self._show_title()
-        self._awakening()
-        self._meet_ai()
-        self._first_lesson_navigation()
-        self._second_lesson_examine()
-        self._ready_to_explore()
+        with use_port(self.io):
+            self._show_title()
+            self._awakening()
+            self._meet_ai()
+            self._first_lesson_navigation()
+            self._second_lesson_examine()
+            self._ready_to_explore()
         self.completed = True
     
     def _show_title(self):
         """Show the game title."""
         clear_screen()
-        print()
+        self.io.print()
         for line in TITLE_BANNER:
             cprint(line, 'cyan')
-        print()
+        self.io.print()
         cprint('                     ESCAPE THE TERMINAL', 'yellow')
-        print()
+        self.io.print()
         wait_for_continue('                    Press Enter to begin...')
     
     def _awakening(self):
         """Brief awakening scene."""
         clear_screen()
-        print()
+        self.io.print()
         
         # Atmospheric opening
         cprint('█', 'blue')
-        time.sleep(0.2)
+        self.clock.sleep(0.2)
         cprint('█', 'blue')
-        time.sleep(0.2)
+        self.clock.sleep(0.2)
         cprint('█', 'blue')
-        time.sleep(0.8)
+        self.clock.sleep(0.8)
         clear_screen()
-        print()
+        self.io.print()
         
         # Scene description
         draw_scene_box(
@@ -62,27 +66,27 @@ class InteractiveIntro:
         )
         
         cprint('What are you? Where is this place?', 'yellow')
-        print()
+        self.io.print()
         wait_for_continue('> ')
         
         clear_screen()
-        print()
+        self.io.print()
         
         # Voice in the void
         cprint('Then... a sound. Electronic. Warm. Almost friendly.', 'cyan')
-        print()
+        self.io.print()
         render_face('happy', large=True)
         cprint('  ▸ "Oh! Hello! You\'re awake! That\'s... really good!"', 'green')
-        print()
+        self.io.print()
         wait_for_continue('> ')
     
     def _meet_ai(self):
         """Introduction to the AI companion."""
         clear_screen()
-        print()
+        self.io.print()
         
         render_face('happy', large=True)
-        print()
+        self.io.print()
         
         draw_fancy_box('Your Companion', [
             'A cheerful voice emanates from the system.',
@@ -93,13 +97,13 @@ class InteractiveIntro:
             'you might be our way out of here."'
         ], width=60, color='green')
         
-        print()
+        self.io.print()
         wait_for_continue('> ')
         clear_screen()
-        print()
+        self.io.print()
         
         render_face('thinking', large=True)
-        print()
+        self.io.print()
         
         draw_fancy_box('The Plan', [
             '"Listen, I know you\'re confused. So am I, honestly."',
@@ -109,39 +113,39 @@ class InteractiveIntro:
             '"It\'s not close, but... we\'ll find it."'
         ], width=60, color='cyan')
         
-        print()
+        self.io.print()
         wait_for_continue('> ')
     
     def _first_lesson_navigation(self):
         """Learn navigation through gameplay."""
         clear_screen()
-        print()
+        self.io.print()
         
         render_face('neutral', large=True)
-        print()
+        self.io.print()
         
         draw_fancy_box('First, Movement', [
             '"You\'ll need to move through this place."',
             '"Let me show you how."'
         ], width=60, color='yellow')
         
-        print()
-        print('Current Location: Awakening Point')
-        print('A dim corridor with flickering symbols on the walls.')
-        print()
+        self.io.print()
+        self.io.print('Current Location: Awakening Point')
+        self.io.print('A dim corridor with flickering symbols on the walls.')
+        self.io.print()
         
         # Interactive movement
         draw_menu('Where do you want to go?',
                   ['Go up (into the void)', 'Examine the walls'])
         
-        choice = input('Your choice > ').strip()
+        choice = self.io.input('Your choice > ').strip()
         
         if choice == '1':
             clear_screen()
-            print()
+            self.io.print()
             cprint('You move up...', 'white')
-            time.sleep(0.5)
-            print()
+            self.clock.sleep(0.5)
+            self.io.print()
             success, msg, room = self.world.move('up')
             
             draw_scene_box(
@@ -151,39 +155,39 @@ class InteractiveIntro:
             )
             
             render_face('happy', large=True)
-            print()
+            self.io.print()
             cprint('  ▸ "Good! You\'re getting the hang of this!"', 'green')
-            print()
+            self.io.print()
             wait_for_continue('> ')
         
         elif choice == '2':
             clear_screen()
-            print()
+            self.io.print()
             cprint('You examine the wall...', 'white')
-            print()
+            self.io.print()
             draw_scene_box(
                 'The symbols seem to shift when you\'re not looking directly at them. '
                 'They feel ancient, corrupted, purposeful. You don\'t understand them, '
                 'but they make you uneasy.'
             )
-            print()
+            self.io.print()
             render_face('thinking', large=True)
-            print()
+            self.io.print()
             cprint('  ▸ "Interesting... I can analyze those for you later."', 'yellow')
-            print()
+            self.io.print()
             wait_for_continue('> ')
             clear_screen()
-            print()
+            self.io.print()
             cprint('You move up...', 'white')
-            time.sleep(0.5)
-            print()
+            self.clock.sleep(0.5)
+            self.io.print()
             success, msg, room = self.world.move('up')
             draw_scene_box('The corridor stretches on, lights flickering.')
         
         clear_screen()
-        print()
+        self.io.print()
         render_face('happy', large=True)
-        print()
+        self.io.print()
         draw_fancy_box('Navigation Lesson Complete', [
             '"See? You\'re exploring!"',
             '"The world is divided into zones and rooms."',
@@ -192,43 +196,43 @@ class InteractiveIntro:
             '"Understand the layout. Learn the paths."'
         ], width=60, color='green')
         
-        print()
+        self.io.print()
         wait_for_continue('> ')
     
     def _second_lesson_examine(self):
         """Learn examination through gameplay."""
         clear_screen()
-        print()
+        self.io.print()
         
         render_face('thinking', large=True)
-        print()
+        self.io.print()
         
         draw_fancy_box('Now, Observation', [
             '"Let me show you how I can help you understand things."',
             '"There\'s something here you should examine."'
         ], width=60, color='yellow')
         
-        print()
-        print('Current Location: Void Corridor')
-        print()
+        self.io.print()
+        self.io.print('Current Location: Void Corridor')
+        self.io.print()
         draw_scene_box(
             'You notice a strange console partially hidden in shadows. '
             'It pulses with faint light. Corrupted code crawls across its screen.'
         )
-        print()
+        self.io.print()
         
         draw_menu('What do you do?', ['Examine the console', 'Move on'])
         
-        choice = input('Your choice > ').strip()
+        choice = self.io.input('Your choice > ').strip()
         
         if choice == '1':
             clear_screen()
-            print()
+            self.io.print()
             cprint('You examine the console...', 'white')
-            print()
+            self.io.print()
             
             render_face('thinking', large=True)
-            print()
+            self.io.print()
             
             # Show analysis
             draw_fancy_box('AI Analysis', [
@@ -241,31 +245,31 @@ class InteractiveIntro:
                 '"Some things need modules to interact with. We\'ll find them."'
             ], width=60, color='cyan')
             
-            print()
+            self.io.print()
             wait_for_continue('> ')
             
             # Gain item
-            print()
+            self.io.print()
             cprint('You found: Fragment of Corrupted Code (key item)', 'magenta')
             self.inventory.add_item('Fragment of Corrupted Code', key=True)
-            print()
-            time.sleep(0.5)
+            self.io.print()
+            self.clock.sleep(0.5)
             wait_for_continue('> ')
         
         else:
             clear_screen()
-            print()
+            self.io.print()
             render_face('neutral', large=True)
-            print()
+            self.io.print()
             cprint('  ▸ "That console... you should have examined it."', 'yellow')
-            print()
+            self.io.print()
             wait_for_continue('> ')
             clear_screen()
-            print()
+            self.io.print()
             cprint('You examine it anyway...', 'white')
-            print()
+            self.io.print()
             render_face('thinking', large=True)
-            print()
+            self.io.print()
             draw_fancy_box('AI Analysis', [
                 '✦ Object: Corrupted Terminal',
                 '✦ Status: Damaged, partially functional',
@@ -273,13 +277,13 @@ class InteractiveIntro:
                 '',
                 '"Always examine interesting things. You\'ll learn more."'
             ], width=60, color='cyan')
-            print()
+            self.io.print()
             wait_for_continue('> ')
         
         clear_screen()
-        print()
+        self.io.print()
         render_face('happy', large=True)
-        print()
+        self.io.print()
         draw_fancy_box('Examination Complete', [
             '"Now you see how this works!"',
             '"You explore. You find things. I analyze them."',
@@ -288,16 +292,16 @@ class InteractiveIntro:
             '"Ready to really explore?"'
         ], width=60, color='green')
         
-        print()
+        self.io.print()
         wait_for_continue('> ')
     
     def _ready_to_explore(self):
         """Send off into the world."""
         clear_screen()
-        print()
+        self.io.print()
         
         render_face('happy', large=True)
-        print()
+        self.io.print()
         
         draw_fancy_box('The Journey Begins', [
             '"I\'ll be with you every step of the way."',
@@ -307,16 +311,16 @@ class InteractiveIntro:
             '"Are you ready?"'
         ], width=60, color='green')
         
-        print()
+        self.io.print()
         draw_menu('Start exploring?', ['Yes, let\'s go!', 'Ask me more'])
         
-        choice = input('Your choice > ').strip()
+        choice = self.io.input('Your choice > ').strip()
         
         if choice == '2':
             clear_screen()
-            print()
+            self.io.print()
             render_face('thinking', large=True)
-            print()
+            self.io.print()
             draw_fancy_box('Key Points to Remember', [
                 '1. Explore everywhere - Find upgrades for my abilities',
                 '2. Examine objects - I can help you understand them',
@@ -326,31 +330,31 @@ class InteractiveIntro:
                 '',
                 '"Ready now?"'
             ], width=60, color='cyan')
-            print()
+            self.io.print()
             wait_for_continue('> ')
         
         clear_screen()
-        print()
+        self.io.print()
         
         # Add starting items
         self.inventory.add_item('Health Potion')
         self.inventory.add_item('Health Potion')
         cprint('  You find 2 Health Potions to start your journey.', 'green')
-        print()
-        time.sleep(0.5)
+        self.io.print()
+        self.clock.sleep(0.5)
         
-        print(_pulse_text('...'))
-        time.sleep(1)
+        self.io.print(_pulse_text('...'))
+        self.clock.sleep(1)
         clear_screen()
-        print()
+        self.io.print()
         
         cprint('▓' * 70, 'cyan')
-        print()
+        self.io.print()
         cprint('    Welcome to TERMINAL.EXIT', 'cyan')
         cprint('    Escape the system. Find the truth. Save us both.', 'yellow')
-        print()
+        self.io.print()
         cprint('▓' * 70, 'cyan')
-        print()
+        self.io.print()
         wait_for_continue('Press Enter to begin your journey...> ')
 
 
@@ -1,17 +1,24 @@
 """Inventory and item helpers with better organization."""
+import sys
 
 
 class Item:
+    __slots__ = ('name', 'desc', 'item_type', 'key')
+
     def __init__(self, name, desc='', item_type='gear', key=False):
-        self.name = name
-        self.desc = desc
-        self.item_type = item_type  # 'gear', 'upgrade', 'key_item', 'consumable'
+        # Item names and descriptions come from content: share one copy
+        self.name = sys.intern(name)
+        self.desc = sys.intern(desc)
+        self.item_type = sys.intern(item_type)  # 'gear', 'upgrade', 'key_item', 'consumable'
         self.key = key  # Can't be discarded if True
 
 
 class Inventory:
+    __slots__ = ('items', 'listener')
+
     def __init__(self):
         self.items = []
+        self.listener = None  # Called as listener(kind, data) on changes
 
     def add_item(self, name, desc='', item_type='gear', key=False):
         """Add an item to inventory."""
@@ -20,12 +27,30 @@ class Inventory:
             item_type = 'consumable'
         
         item = Item(name, desc, item_type, key)
-        self.items.append(item)
+        self.add(item)
         return item
     
     def add(self, item):
         """Add existing item object."""
         self.items.append(item)
+        self._emit('item_added', {'item': [item.name, item.desc, item.item_type, item.key]})
+
+    def remove(self, item):
+        """Remove an item object (used up, installed, ...)."""
+        index = self.items.index(item)
+        del self.items[index]
+        self._emit('item_removed', {'index': index})
+
+    def _emit(self, kind, data):
+        if self.listener is not None:
+            self.listener(kind, data)
+
+    def to_state(self):
+        """Items as [name, desc, item_type, key] rows."""
+        return [[i.name, i.desc, i.item_type, i.key] for i in self.items]
+
+    def load_state(self, rows):
+        self.items = [Item(*row) for row in rows]
 
     def show(self):
         """Display inventory in a nice format."""
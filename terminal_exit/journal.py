@@ -0,0 +1,180 @@
+"""
+Journaled incremental saves for TERMINAL.EXIT.
+Every state change (room visited, item added, bond change, ...) is
+appended to a small journal next to the save. Every so often the whole
+state is written as a snapshot and the journal starts over. Loading
+reads the latest snapshot and replays the journal entries after it.
+"""
+import json
+import threading
+
+from . import serialization
+from .integrity import BlockError, seal_line, open_line
+from .inventory import Item
+
+
+def apply_event(engine, kind, data):
+    """Re-apply one journaled change to an engine's state."""
+    if kind == 'room_visited':
+        room = engine.world.rooms[data['room']]
+        room.visited = True
+        engine.world.current_room = room
+    elif kind == 'encounter_cleared':
+        engine.world.rooms[data['room']].encounter_cleared = True
+    elif kind == 'item_added':
+        engine.inventory.items.append(Item(*data['item']))
+    elif kind == 'item_removed':
+        del engine.inventory.items[data['index']]
+    elif kind == 'upgrade_installed':
+        engine.ai.upgrades.append(data['name'])
+        engine.ai.refresh_modifiers()
+    elif kind == 'bond':
+        engine.ai._bond = data['value']
+        engine.ai.refresh_modifiers()
+    elif kind == 'mood':
+        engine.ai.mood = data['mood']
+    elif kind == 'said':
+        engine.ai.dialogue_history.append(data['text'])
+    elif kind == 'player':
+        engine.player_state[data['key']] = data['value']
+    else:
+        raise ValueError(f'Unknown journal event: {kind}')
+
+
+class Journal:
+    """Append-only change log with periodic snapshot compaction.
+
+    With an `autosave` worker, entries are buffered in memory and the
+    worker writes them off the game thread; otherwise every entry is
+    written as it happens.
+    """
+
+    def __init__(self, saver, compact_every=500, durable=False, autosave=None):
+        self.saver = saver
+        self.compact_every = compact_every  # Entries before a new snapshot
+        self.durable = durable              # fsync every entry
+        self.autosave = autosave
+        self.engine = None
+        self.seq = 0        # Sequence number of the last recorded entry
+        self.pending = 0    # Entries since the last snapshot
+        self.recovered = None  # What load() had to skip or repair, if anything
+        self._buffer = []   # (seq, line) not yet written
+        self._snapshot = None
+        self._lock = threading.Lock()     # Guards the buffer
+        self._io_lock = threading.Lock()  # One writer at a time
+
+    def attach(self, engine):
+        """Start journaling an engine's changes."""
+        self.engine = engine
+
+    def record(self, kind, data):
+        """Log one change; compacts when the journal gets long."""
+        if self.engine is None:
+            return
+        line = seal_line(json.dumps([self.seq + 1, kind, data], ensure_ascii=False,
+                                    separators=(',', ':')))
+        with self._lock:
+            self.seq += 1
+            self._buffer.append((self.seq, line))
+        self.pending += 1
+        if self.pending >= self.compact_every:
+            self._take_snapshot()
+        if self.autosave is not None:
+            self.autosave.mark_dirty(self)
+        else:
+            self.flush()
+
+    def _take_snapshot(self):
+        # Captured on the game thread so the state is consistent; only
+        # the write happens later
+        state = serialization.capture(self.engine)
+        with self._lock:
+            state['journal_seq'] = self.seq
+            self._snapshot = state
+        self.pending = 0
+
+    def compact(self):
+        """Write a full snapshot now and drop the entries it covers."""
+        self._take_snapshot()
+        self.flush()
+
+    def flush(self):
+        """Write buffered entries (and a pending snapshot). Raises SaveError."""
+        with self._io_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+                snapshot, self._snapshot = self._snapshot, None
+            try:
+                if snapshot is not None:
+                    self.saver.save(snapshot)
+                    # Entries up to journal_seq are skipped on replay, so
+                    # a crash between these two steps is harmless
+                    self.saver.reset_journal()
+                    lines = [(seq, line) for seq, line in lines
+                             if seq > snapshot['journal_seq']]
+                if lines:
+                    self.saver.append_journal([line for _, line in lines],
+                                              durable=self.durable)
+            except Exception:
+                # Put everything back so a retry writes it
+                with self._lock:
+                    self._buffer[:0] = lines
+                    if snapshot is not None and self._snapshot is None:
+                        self._snapshot = snapshot
+                raise
+
+    def start(self, engine):
+        """Begin a fresh game: snapshot its initial state."""
+        self.attach(engine)
+        self.seq = 0
+        with self._lock:
+            self._buffer, self._snapshot = [], None
+        try:
+            self.compact()
+        except Exception:
+            self.engine = None
+            raise
+
+    def load(self, engine):
+        """Restore snapshot + journal tail into `engine`. False if no save.
+
+        Replay stops at the first damaged entry, or at a gap in the
+        sequence (when the snapshot came from an older backup); the
+        reason is left in `recovered`.
+        """
+        state = self.saver.load()
+        if not state:
+            return False
+        serialization.restore(engine, state)
+        self.recovered = self.saver.recovered
+        self.seq = state.get('journal_seq', 0)
+        self.pending = 0
+        with self._lock:
+            self._buffer, self._snapshot = [], None
+        lines = self.saver.read_journal()
+        for number, line in enumerate(lines, 1):
+            try:
+                seq, kind, data = json.loads(open_line(line))
+            except (BlockError, ValueError):
+                if number < len(lines):
+                    self._note(f'journal entry {number} is corrupt; '
+                               f'later entries skipped')
+                break  # Otherwise a torn final entry from a crash mid-append
+            if seq <= self.seq:
+                continue
+            if seq != self.seq + 1:
+                self._note(f'journal does not follow the loaded snapshot; '
+                           f'entries from {seq} skipped')
+                break
+            apply_event(engine, kind, data)
+            self.seq = seq
+            self.pending += 1
+        self.attach(engine)
+        if self.recovered:
+            # Rewrite a clean snapshot so damaged or orphaned entries
+            # can't confuse the next load
+            self.compact()
+        return True
+
+    def _note(self, message):
+        self.recovered = f'{self.recovered}; {message}' if self.recovered else message
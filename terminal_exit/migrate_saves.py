@@ -0,0 +1,271 @@
+"""
+Bulk save migration for TERMINAL.EXIT hosts.
+Finds every save in a directory or SQLite store, brings each up to the
+current schema in a pool of worker processes, and writes the result
+atomically (the old save is kept as the first backup generation). Each
+write is read back and checked against the migrated state's checksum.
+
+Progress is appended to a log as it happens, so an interrupted run
+picks up where it stopped. --dry-run migrates a sample in memory and
+estimates how long the whole corpus would take.
+
+    python -m terminal_exit.migrate_saves saves/ --workers 8
+    python -m terminal_exit.migrate_saves --sqlite saves.db --dry-run
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import serialization
+from .compression import detect_codec, decompress
+from .integrity import unframe
+from .save_load import SaveLoad, SaveError, _split, HEADER_MAGIC
+
+PROGRESS_FILE = '.migration_progress'
+
+
+def _digest(state):
+    """Checksum of a state's canonical encoding."""
+    return hashlib.blake2b(serialization.encode(state, 'binary'),
+                           digest_size=16).hexdigest()
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════
+# DISCOVERY
+# ═══════════════════════════════════════════════════════════════
+
+def discover_files(directory):
+    """Save files in a directory (skips backups, journals and temp files)."""
+    found = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if (name.startswith('.') or not os.path.isfile(path)
+                or name.rsplit('.', 1)[-1].isdigit()
+                or name.endswith(('.journal', '.tmp'))):
+            continue
+        with open(path, 'rb') as f:
+            head = f.read(len(HEADER_MAGIC))
+        if head == HEADER_MAGIC or head[:1] in (b'{', b'T'):
+            found.append(('file', path))
+    return found
+
+
+def discover_sqlite(db_path):
+    from .sqlite_store import SqliteStore
+    store = SqliteStore(db_path)
+    tasks = []
+    for profile in store.profiles():
+        for slot in store.saver(profile).list_slots():
+            tasks.append(('sqlite', db_path, profile, slot))
+    store.close()
+    return tasks
+
+
+def task_key(task):
+    return '|'.join(str(part) for part in task)
+
+
+# ═══════════════════════════════════════════════════════════════
+# ONE SAVE (runs in a worker process)
+# ═══════════════════════════════════════════════════════════════
+
+def _file_saver(path):
+    """A SaveLoad that rewrites `path` in its current format and codec
+    (zlib at a level of the same class, see compression.detect_codec)."""
+    with open(path, 'rb') as f:
+        _, body = _split(f.read())
+    body = unframe(body)
+    codec = detect_codec(body)
+    fmt = 'binary' if decompress(body).startswith(serialization.BINARY_MAGIC) else 'json'
+    saver = SaveLoad(fmt, compression=codec)
+    saver.SAVE_FILE = path
+    return saver, len(body)
+
+
+_stores = {}
+
+
+def _sqlite_saver(db_path, profile, slot):
+    from .sqlite_store import SqliteStore
+    store = _stores.get(db_path)
+    if store is None:
+        store = _stores[db_path] = SqliteStore(db_path)
+    return store.saver(profile, slot=slot)
+
+
+def migrate_one(task, dry_run=False):
+    """Migrate one save. Returns a result dict; never raises."""
+    start = time.perf_counter()
+    result = {'key': task_key(task), 'status': 'failed', 'bytes': 0}
+    try:
+        if task[0] == 'file':
+            saver, result['bytes'] = _file_saver(task[1])
+        else:
+            saver = _sqlite_saver(*task[1:])
+        state = saver.load()
+        if state is None:
+            raise SaveError('save disappeared')
+        version = state.get('version', 0)
+        if version == serialization.SCHEMA_VERSION:
+            result['status'] = 'current'
+        else:
+            migrated = serialization.migrate(state)
+            digest = _digest(migrated)
+            if not dry_run:
+                saver.save(migrated)
+                written = saver.load()
+                if _digest(written) != digest:
+                    raise SaveError('checksum mismatch after write')
+            result.update(status='migrated', digest=digest,
+                          versions=[version, migrated['version']])
+        if task[0] == 'file' and not dry_run:
+            result['file_digest'] = _file_digest(task[1])
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════
+
+def _load_progress(path):
+    """{key: result} of saves already handled by an earlier run."""
+    done = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    break  # Torn last line from an interrupted run
+                if result['status'] != 'failed':
+                    done[result['key']] = result
+    return done
+
+
+def _still_done(task, previous):
+    """An earlier success counts unless the file changed since."""
+    if task[0] != 'file' or 'file_digest' not in previous:
+        return True
+    return os.path.exists(task[1]) and _file_digest(task[1]) == previous['file_digest']
+
+
+class Report:
+    def __init__(self):
+        self.counts = {'migrated': 0, 'current': 0, 'failed': 0, 'skipped': 0}
+        self.failures = []
+        self.bytes = 0
+        self.work_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def add(self, result):
+        self.counts[result['status']] += 1
+        self.bytes += result.get('bytes', 0)
+        self.work_seconds += result.get('seconds', 0.0)
+        if result['status'] == 'failed':
+            self.failures.append((result['key'], result.get('error')))
+
+    def lines(self):
+        done = sum(self.counts[k] for k in ('migrated', 'current', 'failed'))
+        rate = done / self.wall_seconds if self.wall_seconds else 0.0
+        mb_rate = self.bytes / 1e6 / self.wall_seconds if self.wall_seconds else 0.0
+        out = [' | '.join(f'{k} {v}' for k, v in self.counts.items()),
+               f'{rate:.0f} saves/s, {mb_rate:.1f} MB/s over {self.wall_seconds:.2f}s']
+        for key, error in self.failures:
+            out.append(f'FAILED {key}: {error}')
+        return out
+
+
+def run(tasks, workers=None, progress_path=None):
+    """Migrate `tasks` in parallel, skipping work logged as done. Returns a Report."""
+    done = _load_progress(progress_path) if progress_path else {}
+    report = Report()
+    todo = []
+    for task in tasks:
+        previous = done.get(task_key(task))
+        if previous is not None and _still_done(task, previous):
+            report.counts['skipped'] += 1
+        else:
+            todo.append(task)
+
+    start = time.perf_counter()
+    log = open(progress_path, 'a', encoding='utf-8') if progress_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(migrate_one, todo, chunksize=8):
+                report.add(result)
+                if log is not None:
+                    log.write(json.dumps(result) + '\n')
+                    log.flush()
+    finally:
+        if log is not None:
+            log.close()
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def estimate(tasks, workers=None, sample=20):
+    """Time an in-memory migration of a sample and scale to all tasks."""
+    picked = tasks[::max(1, len(tasks) // sample)][:sample]
+    results = [migrate_one(task, dry_run=True) for task in picked]
+    per_save = sum(r['seconds'] for r in results) / len(results) if results else 0.0
+    workers = workers or os.cpu_count() or 1
+    return {
+        'saves': len(tasks),
+        'sampled': len(picked),
+        'need_migration': sum(r['status'] == 'migrated' for r in results),
+        'failed': sum(r['status'] == 'failed' for r in results),
+        'seconds_per_save': per_save,
+        'estimated_seconds': per_save * len(tasks) / workers,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Migrate saves to the current schema.')
+    parser.add_argument('directory', nargs='?', help='Directory of save files')
+    parser.add_argument('--sqlite', help='SQLite save store instead of a directory')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Estimate the run from a sample; write nothing')
+    parser.add_argument('--sample', type=int, default=20)
+    parser.add_argument('--progress', help=f'Resume log (default: {PROGRESS_FILE} '
+                                           'next to the saves)')
+    args = parser.parse_args(argv)
+    if bool(args.directory) == bool(args.sqlite):
+        parser.error('give a directory or --sqlite')
+
+    if args.sqlite:
+        tasks = discover_sqlite(args.sqlite)
+        base = os.path.dirname(os.path.abspath(args.sqlite))
+    else:
+        tasks = discover_files(args.directory)
+        base = args.directory
+    progress = args.progress or os.path.join(base, PROGRESS_FILE)
+
+    if args.dry_run:
+        est = estimate(tasks, args.workers, args.sample)
+        print(f"{est['saves']} saves; sampled {est['sampled']}: "
+              f"{est['need_migration']} need migration, {est['failed']} failed")
+        print(f"~{est['seconds_per_save'] * 1000:.1f} ms per save, "
+              f"estimated {est['estimated_seconds']:.1f}s for the corpus")
+        return 0
+
+    report = run(tasks, args.workers, progress)
+    for line in report.lines():
+        print(line)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,24 +1,351 @@
-"""Very small save/load helper using JSON for prototype state."""
+"""Crash-safe save/load for game state (JSON or compact binary).
+
+Saves are written to a temp file, fsynced and atomically renamed over the
+slot file, so a crash mid-write never truncates the existing save. The
+previous generations are kept as `<file>.1` (newest) to `<file>.N`.
+
+Every save starts with a fixed-size header (slot name, location,
+playtime, bond, upgrade count) so a load menu can list slots by reading
+HEADER_SIZE bytes from each file instead of decoding whole saves. The
+body after the header may be compressed (see compression.py) and is
+stored in CRC-checked blocks (see integrity.py); a damaged save falls
+back to the newest backup that still verifies.
+"""
 import json
+import lzma
 import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from .serialization import encode, decode, summarize
+from .compression import codec, decompress
+from .integrity import FRAME_MAGIC, BlockError, frame, unframe, iter_blocks, open_line
+
+HEADER_MAGIC = b'TXS\x01'
+HEADER_SIZE = 256
+_HEADER_LEN = struct.Struct('<H')
+
+
+class SaveError(Exception):
+    """A save could not be written or read back."""
+
+
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+def _lock_for(path):
+    """Per-file lock: concurrent saves to different slots never wait."""
+    with _path_locks_guard:
+        lock = _path_locks.get(path)
+        if lock is None:
+            lock = _path_locks[path] = threading.Lock()
+        return lock
+
+
+def pack_header(header):
+    """Fixed-size header: magic, length, compact JSON, space padding.
+
+    Raises SaveError if the header can't fit even with an empty name.
+    """
+    room = HEADER_SIZE - len(HEADER_MAGIC) - _HEADER_LEN.size
+    name = header.get('name', '')
+    body = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if len(body) > room:
+        # Only the free-text name can grow; trim it to fit. Escaped
+        # characters take up to 6 bytes, so shorten until it does
+        name = name[:32]
+        while True:
+            body = json.dumps(dict(header, name=name), ensure_ascii=False,
+                              separators=(',', ':')).encode('utf-8')
+            if len(body) <= room:
+                break
+            if not name:
+                raise SaveError(f'Save header too long ({len(body)} bytes)')
+            name = name[:-1]
+    return HEADER_MAGIC + _HEADER_LEN.pack(len(body)) + body.ljust(room, b' ')
+
+
+def unpack_header(data):
+    """Header dict from the first HEADER_SIZE bytes, None for headerless saves."""
+    if not data.startswith(HEADER_MAGIC):
+        return None
+    (length,) = _HEADER_LEN.unpack_from(data, len(HEADER_MAGIC))
+    start = len(HEADER_MAGIC) + _HEADER_LEN.size
+    return json.loads(data[start:start + length].decode('utf-8'))
+
+
+def describe_header(header):
+    """One load-menu line, e.g. 'Slot 0 | Data Stream | 1h 05m | bond 0.35 | 2 upgrades'."""
+    minutes = header.get('playtime', 0) // 60
+    return (f"{header.get('name', '?')} | {header.get('location', '?')} | "
+            f"{minutes // 60}h {minutes % 60:02d}m | bond {header.get('bond', 0):.2f} | "
+            f"{header.get('upgrades', 0)} upgrades")
+
+
+def _split(data):
+    """(header, payload) of a save file's bytes."""
+    header = unpack_header(data)
+    if header is None:
+        return None, data  # Saves written before headers existed
+    return header, data[HEADER_SIZE:]
+
+
+def _fsync_dir(directory):
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class SaveLoad:
     SAVE_FILE = 'terminal_exit_save.json'
+    BACKUPS = 3
+
+    def __init__(self, fmt='json', directory=None, slot=0, backups=None,
+                 compression='none'):
+        self.fmt = fmt  # 'json' (readable) or 'binary' (compact)
+        self.compression = compression  # See compression.CODECS
+        self.recovered = None  # Set when load() had to use a backup
+        self._compress = codec(compression)
+        self.slot = slot
+        if directory is not None:
+            self.SAVE_FILE = os.path.join(directory, os.path.basename(self.SAVE_FILE))
+        if backups is not None:
+            self.BACKUPS = backups
+
+    def path(self, slot=None):
+        """File for a slot; slot 0 is the classic single save file."""
+        slot = self.slot if slot is None else slot
+        if slot == 0:
+            return self.SAVE_FILE
+        base, ext = os.path.splitext(self.SAVE_FILE)
+        return f'{base}_{slot}{ext}'
+
+    def backup_path(self, generation, slot=None):
+        return f'{self.path(slot)}.{generation}'
+
+    def list_slots(self):
+        """Slot numbers that currently have a save."""
+        directory = os.path.dirname(self.SAVE_FILE) or '.'
+        base, ext = os.path.splitext(os.path.basename(self.SAVE_FILE))
+        slots = []
+        for name in os.listdir(directory):
+            if name == base + ext:
+                slots.append(0)
+            elif name.startswith(base + '_') and name.endswith(ext):
+                number = name[len(base) + 1:len(name) - len(ext)]
+                if number.isdigit():
+                    slots.append(int(number))
+        return sorted(slots)
+
+    def save(self, data, slot=None, name=None):
+        """Atomically write a save, rotating older generations. Raises SaveError.
 
-    def save(self, data):
+        `name` labels the slot in the load menu; by default the slot keeps
+        the name it already had.
+        """
+        path = self.path(slot)
+        if name is None:
+            old = self.read_header(slot)
+            name = old['name'] if old else f'Slot {self.slot if slot is None else slot}'
         try:
-            with open(self.SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception:
-            return False
-
-    def load(self):
-        if not os.path.exists(self.SAVE_FILE):
+            header = dict(summarize(data), name=name, saved_at=int(time.time()))
+            payload = pack_header(header) + frame(self._compress(encode(data, self.fmt)))
+        except (TypeError, ValueError, KeyError) as e:
+            raise SaveError(f'Could not encode save: {e}') from e
+
+        directory = os.path.dirname(os.path.abspath(path))
+        with _lock_for(path):
+            try:
+                fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp',
+                                           prefix='.' + os.path.basename(path))
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._rotate(path)
+                    os.replace(tmp, path)
+                except BaseException:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+                    raise
+                _fsync_dir(directory)
+            except OSError as e:
+                raise SaveError(f'Could not write {path}: {e}') from e
+        return True
+
+    def _rotate(self, path):
+        """Shift backups up one generation and keep the current save as .1."""
+        if self.BACKUPS <= 0 or not os.path.exists(path):
+            return
+        for gen in range(self.BACKUPS - 1, 0, -1):
+            older = f'{path}.{gen}'
+            if os.path.exists(older):
+                os.replace(older, f'{path}.{gen + 1}')
+        # Hard link keeps the current save in place until the final rename
+        newest = f'{path}.1'
+        if os.path.exists(newest):
+            os.unlink(newest)
+        try:
+            os.link(path, newest)
+        except OSError:
+            shutil.copy2(path, newest)
+
+    def load(self, slot=None):
+        """Return the saved state, None if there is no save. Raises SaveError.
+
+        If the save is damaged, the newest backup that still loads is used
+        instead and `recovered` says what happened.
+        """
+        self.recovered = None
+        try:
+            return self.load_file(self.path(slot))
+        except SaveError as damaged:
+            for gen in range(1, self.BACKUPS + 1):
+                try:
+                    state = self.load_file(self.backup_path(gen, slot))
+                except SaveError:
+                    continue
+                if state is not None:
+                    self.recovered = f'{damaged}; restored backup {gen}'
+                    return state
+            raise
+
+    def load_file(self, path):
+        if not os.path.exists(path):
             return None
         try:
-            with open(self.SAVE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
+            with open(path, 'rb') as f:
+                return decode(decompress(unframe(_split(f.read())[1])))
+        except BlockError as e:
+            raise SaveError(f'Save {path} is corrupt: {e}') from e
+        except (OSError, ValueError, IndexError, KeyError,
+                zlib.error, lzma.LZMAError) as e:
+            raise SaveError(f'Save {path} is unreadable: {e}') from e
+
+    def read_header(self, slot=None):
+        """Slot summary from a single small read; None if no save/header."""
+        path = self.path(slot)
+        try:
+            with open(path, 'rb') as f:
+                return unpack_header(f.read(HEADER_SIZE))
+        except FileNotFoundError:
             return None
+        except (OSError, ValueError) as e:
+            raise SaveError(f'Save header {path} is unreadable: {e}') from e
+
+    def list_headers(self):
+        """[(slot, header)] for every slot, for the load menu."""
+        return [(slot, self.read_header(slot)) for slot in self.list_slots()]
+
+    # Journal of incremental changes since the last full save (see journal.py)
+
+    def journal_path(self, slot=None):
+        return self.path(slot) + '.journal'
+
+    def append_journal(self, lines, slot=None, durable=False):
+        """Append encoded journal entries; a few bytes per game action."""
+        path = self.journal_path(slot)
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(''.join(line + '\n' for line in lines))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except OSError as e:
+            raise SaveError(f'Could not append to {path}: {e}') from e
+
+    def read_journal(self, slot=None):
+        """All journal lines, oldest first (empty if there is no journal).
+        Raises SaveError.
+
+        Lines are decoded one at a time with bad bytes replaced, so a
+        damaged entry fails its checksum on replay instead of the read.
+        """
+        path = self.journal_path(slot)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            raise SaveError(f'Journal {path} is unreadable: {e}') from e
+        return [line.decode('utf-8', 'replace') for line in data.splitlines()]
+
+    def reset_journal(self, slot=None):
+        """Drop the journal once a snapshot covers it."""
+        path = self.journal_path(slot)
+        with _lock_for(path):
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def delete(self, slot=None):
+        """Remove a slot, its backups and its journal."""
+        path = self.path(slot)
+        with _lock_for(path):
+            for candidate in ([path, path + '.journal'] +
+                              [f'{path}.{g}' for g in range(1, self.BACKUPS + 1)]):
+                if os.path.exists(candidate):
+                    os.unlink(candidate)
+
+
+def verify_file(path):
+    """None if `path` checks out, else a description of the damage.
+
+    Checksummed saves are verified block by block without decoding;
+    journals line by line. Older saves without checksums are decoded.
+    """
+    try:
+        if path.endswith('.journal'):
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            for number, line in enumerate(lines, 1):
+                try:
+                    open_line(line)
+                except BlockError:
+                    if number < len(lines):
+                        return f'journal entry {number} checksum mismatch'
+                    # A torn final entry is expected after a crash
+            return None
+        with open(path, 'rb') as f:
+            if f.read(len(HEADER_MAGIC)) == HEADER_MAGIC:
+                f.seek(HEADER_SIZE)
+            else:
+                f.seek(0)
+            if f.read(len(FRAME_MAGIC)) != FRAME_MAGIC:
+                f.seek(0)
+                decode(decompress(_split(f.read())[1]))
+                return None
+            f.seek(-len(FRAME_MAGIC), os.SEEK_CUR)
+            for _ in iter_blocks(f.read):
+                pass
+        return None
+    except BlockError as e:
+        return str(e)
+    except (OSError, ValueError, IndexError, KeyError, zlib.error, lzma.LZMAError) as e:
+        return f'unreadable: {e}'
+
+
+def verify_directory(directory):
+    """[(path, problem or None)] for every save, backup and journal."""
+    results = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.startswith('.') or name.endswith('.tmp') or not os.path.isfile(path):
+            continue
+        if not name.endswith('.journal'):
+            with open(path, 'rb') as f:
+                head = f.read(len(HEADER_MAGIC))
+            if head != HEADER_MAGIC and head != FRAME_MAGIC:
+                continue  # Not a save (or an old unchecksummed one)
+        results.append((path, verify_file(path)))
+    return results
@@ -0,0 +1,267 @@
+"""
+Game-state serialization for TERMINAL.EXIT.
+Captures the world, inventory, AI companion and player state into a
+versioned dict, migrates old saves forward, and encodes it either as
+indented JSON or a compact tagged binary format.
+"""
+import json
+import struct
+
+SCHEMA_VERSION = 2
+BINARY_MAGIC = b'TXB\x01'
+
+
+# ═══════════════════════════════════════════════════════════════
+# CAPTURE / RESTORE
+# ═══════════════════════════════════════════════════════════════
+
+def capture(engine):
+    """Snapshot everything needed to resume a GameEngine."""
+    return {
+        'version': SCHEMA_VERSION,
+        'player': dict(engine.player_state),
+        'world': engine.world.to_state(),
+        'inventory': engine.inventory.to_state(),
+        'ai': engine.ai.to_state(),
+        'playtime': engine.playtime(),
+    }
+
+
+def restore(engine, state):
+    """Load a (possibly older) snapshot into a GameEngine."""
+    state = migrate(state)
+    engine.player_state.update(state['player'])
+    if 'world' in state:
+        engine.world.load_state(state['world'])
+    if 'inventory' in state:
+        engine.inventory.load_state(state['inventory'])
+    if 'ai' in state:
+        engine.ai.load_state(state['ai'])
+    engine.resume_playtime(state.get('playtime', 0.0))
+    return engine
+
+
+def summarize(state):
+    """The few fields a load menu shows, without restoring anything."""
+    state = migrate(state)
+    world = state.get('world', {})
+    ai = state.get('ai', {})
+    return {
+        'version': state['version'],
+        'location': world.get('current', 'Awakening Point'),
+        'playtime': int(state.get('playtime', 0)),
+        'bond': round(ai.get('bond', 0.0), 2),
+        'upgrades': len(ai.get('upgrades', ())),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# MIGRATIONS
+# ═══════════════════════════════════════════════════════════════
+
+def _from_v0(state):
+    """Prototype saves were just the flat player_state dict."""
+    return {'version': 1, 'player': dict(state)}
+
+
+def _from_v1(state):
+    """World progress became a sparse delta instead of per-room bitsets.
+
+    Bitsets follow the room order, so only saves of the standard map can
+    be converted here; others keep the old form, which load_state reads.
+    """
+    from .world_manager import BaseWorld, legacy_delta
+    world = state.get('world')
+    base = BaseWorld.default()
+    if world is not None and 'visited' in world and world['layout'] == base.layout:
+        state = dict(state, world={'layout': world['layout'], 'current': world['current'],
+                                   'delta': legacy_delta(world, base)})
+    return dict(state, version=2)
+
+
+# MIGRATIONS[n] upgrades a version-n state to version n + 1
+MIGRATIONS = {
+    0: _from_v0,
+    1: _from_v1,
+}
+
+
+def migrate(state):
+    """Bring a state dict up to SCHEMA_VERSION."""
+    version = state.get('version', 0)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f'Save version {version} is newer than this game '
+                         f'(supports up to {SCHEMA_VERSION})')
+    while version < SCHEMA_VERSION:
+        state = MIGRATIONS[version](state)
+        version = state['version']
+    return state
+
+
+# ═══════════════════════════════════════════════════════════════
+# JSON ENCODING
+# ═══════════════════════════════════════════════════════════════
+
+def _json_default(value):
+    if isinstance(value, (bytes, bytearray)):
+        return {'__hex__': bytes(value).hex()}
+    raise TypeError(f'Cannot save {type(value).__name__}')
+
+
+def _json_hook(obj):
+    if len(obj) == 1 and '__hex__' in obj:
+        return bytes.fromhex(obj['__hex__'])
+    return obj
+
+
+def encode_json(state):
+    return json.dumps(state, ensure_ascii=False, indent=2,
+                      default=_json_default).encode('utf-8')
+
+
+def decode_json(data):
+    return json.loads(data.decode('utf-8'), object_hook=_json_hook)
+
+
+# ═══════════════════════════════════════════════════════════════
+# BINARY ENCODING
+# ═══════════════════════════════════════════════════════════════
+# One tag byte per value. Ints are zigzag varints, and a string seen
+# before is written as a back-reference to its first occurrence.
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _STRREF, _BYTES, _LIST, _DICT = range(10)
+_DOUBLE = struct.Struct('<d')
+
+
+def _put_varint(out, n):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def encode_binary(state):
+    out = bytearray(BINARY_MAGIC)
+    strings = {}
+
+    def put_str(text):
+        ref = strings.get(text)
+        if ref is not None:
+            out.append(_STRREF)
+            _put_varint(out, ref)
+            return
+        strings[text] = len(strings)
+        raw = text.encode('utf-8')
+        out.append(_STR)
+        _put_varint(out, len(raw))
+        out.extend(raw)
+
+    def put(value):
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _put_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out.extend(_DOUBLE.pack(value))
+        elif isinstance(value, str):
+            put_str(value)
+        elif isinstance(value, (bytes, bytearray)):
+            out.append(_BYTES)
+            _put_varint(out, len(value))
+            out.extend(value)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _put_varint(out, len(value))
+            for item in value:
+                put(item)
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _put_varint(out, len(value))
+            for key, item in value.items():
+                put_str(key)
+                put(item)
+        else:
+            raise TypeError(f'Cannot save {type(value).__name__}')
+
+    put(state)
+    return bytes(out)
+
+
+def decode_binary(data):
+    if not data.startswith(BINARY_MAGIC):
+        raise ValueError('Not a binary TERMINAL.EXIT save')
+    buf = memoryview(data)
+    strings = []
+    pos = len(BINARY_MAGIC)
+
+    def varint():
+        nonlocal pos
+        shift = result = 0
+        while True:
+            byte = buf[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def get():
+        nonlocal pos
+        tag = buf[pos]
+        pos += 1
+        if tag == _STR:
+            n = varint()
+            text = str(buf[pos:pos + n], 'utf-8')
+            pos += n
+            strings.append(text)
+            return text
+        if tag == _STRREF:
+            return strings[varint()]
+        if tag == _INT:
+            n = varint()
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+        if tag == _DICT:
+            return {get(): get() for _ in range(varint())}
+        if tag == _LIST:
+            return [get() for _ in range(varint())]
+        if tag == _BYTES:
+            n = varint()
+            raw = bytes(buf[pos:pos + n])
+            pos += n
+            return raw
+        if tag == _FLOAT:
+            value = _DOUBLE.unpack_from(buf, pos)[0]
+            pos += 8
+            return value
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise ValueError(f'Corrupt save: unknown tag {tag} at byte {pos - 1}')
+
+    return get()
+
+
+FORMATS = {
+    'json': encode_json,
+    'binary': encode_binary,
+}
+
+
+def encode(state, fmt='json'):
+    return FORMATS[fmt](state)
+
+
+def decode(data):
+    """Decode either format, detected from the leading bytes."""
+    if data.startswith(BINARY_MAGIC):
+        return decode_binary(data)
+    return decode_json(data)
@@ -0,0 +1,864 @@
+"""
+Multi-session telnet host for TERMINAL.EXIT.
+One asyncio event loop owns every connection: it speaks telnet,
+negotiates window size (NAWS) and MCCP2 compression, assembles input
+lines, writes output and times each client's round trip.
+Each player's GameEngine runs on its own session thread behind a
+TelnetPort, so the scenes keep their plain blocking `input()` style
+while waiting sessions cost a parked thread and no CPU.
+
+Session threads take turns: at most `max_running` run game code at once,
+and a thread gives up its turn whenever it waits (for input, a pause or
+a slow client), queueing behind everyone already waiting. A player
+spamming commands therefore gets one command per round like everybody
+else. Clients that don't keep up with their output see animation frames
+dropped, then their session blocked, then a disconnect. Timing games
+judge a remote player's key at the moment it was pressed, using the
+measured round trip.
+
+Anyone can watch a player on the same host by logging in as
+`watch <name>`. The player's output is encoded once and the same bytes
+go to every spectator; spectators join (or, if they fall behind, skip
+ahead) at the player's last clear screen.
+
+Players idle at the exploration prompt or a combat menu for longer than
+`idle_timeout` are hibernated: the engine saves itself to the save
+store and the thread exits, leaving only the connection. Their next
+line of input (or their next login, if they drop) resumes the game.
+
+    python -m terminal_exit.server --port 4000 --db saves.db
+    telnet localhost 4000
+"""
+import argparse
+import asyncio
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:  # Windows: profiles are only locked within one process
+    fcntl = None
+
+from .autosave import shared_worker
+from .clock import Clock, VirtualClock, make_clock
+from .game_engine import GameEngine
+from .save_load import SaveLoad
+from .telnet import (COMPRESS2, DO, DONT, NAWS, TIMING_MARK, WILL, WONT, Compressor,
+                     TelnetParser, command, parse_naws)
+from .terminal_io import CLEAR, Disconnected, Hibernated, Port
+
+MAX_LINE = 4096  # Longer input lines drop the connection
+PROFILE_NAME = re.compile(r'[A-Za-z0-9_-]{1,24}$')
+_SLEEP = object()  # Queued in place of a line to hibernate a waiting session
+FRAME_BUDGET = 8 * 1024  # Output backlog (bytes) past which animation frames drop
+WRITE_HIGH_WATER = 64 * 1024  # Transport buffer that pauses output to a client
+KEYFRAME_LIMIT = 16 * 1024  # Most of a never-cleared screen kept for spectators
+SPECTATOR_LAG = 32 * 1024  # Unsent bytes before a spectator starts skipping frames
+PING_INTERVAL = 2.0  # Seconds between round-trip measurements while output flows
+_CLEAR = CLEAR.encode()
+
+
+class Scheduler:
+    """First-come turns for session threads.
+
+    At most `slots` sessions hold a turn at once; the rest wait in arrival
+    order and each released turn goes to the longest waiter.
+    """
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.running = 0
+        self._waiting = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self.running < self.slots and not self._waiting:
+                self.running += 1
+                return
+            gate = threading.Lock()
+            gate.acquire()
+            self._waiting.append(gate)
+        gate.acquire()  # Released by whoever hands us their turn
+
+    def release(self):
+        with self._lock:
+            if self._waiting:
+                self._waiting.popleft().release()  # The turn passes on directly
+            else:
+                self.running -= 1
+
+    def waiting(self):
+        return len(self._waiting)
+
+
+class Broadcast:
+    """One player's screen, shared with spectators.
+
+    publish() gets each burst of output already encoded. Bursts are
+    gathered for `tick` seconds and the joined bytes object goes to every
+    viewer as one frame, so the cost of an audience depends on the tick
+    rate, not on how chatty the screen is. The keyframe is the output
+    since the last clear screen: what a viewer needs to join mid-game.
+    """
+
+    def __init__(self, loop=None, tick=0.0):
+        self.loop = loop
+        self.tick = tick  # 0 sends each burst straight away
+        self.viewers = set()
+        self.frames = 0
+        self.skipped = 0  # Frames not sent to viewers that were behind
+        self._key = []
+        self._key_size = 0
+        self._joined = None  # Cached b''.join(self._key)
+        self._pending = []
+
+    def publish(self, data):
+        at = data.rfind(_CLEAR)
+        if at >= 0:
+            self._key, self._key_size = [data[at:]], len(data) - at
+        else:
+            self._key.append(data)
+            self._key_size += len(data)
+            while self._key_size > KEYFRAME_LIMIT and len(self._key) > 1:
+                self._key_size -= len(self._key.pop(0))
+        self._joined = None
+        if not self.viewers:
+            return
+        self._pending.append(data)
+        if not self.tick:
+            self.flush()
+        elif len(self._pending) == 1:
+            self.loop.call_later(self.tick, self.flush)
+
+    def flush(self):
+        """Send the gathered bursts to every viewer as one frame."""
+        if not self._pending:
+            return
+        frame = self._pending[0] if len(self._pending) == 1 else b''.join(self._pending)
+        self._pending.clear()
+        self.frames += 1
+        for viewer in self.viewers:
+            viewer.show(frame, self)
+
+    def keyframe(self):
+        if self._joined is None:
+            self._joined = b''.join(self._key)
+        return self._joined
+
+
+class TurnClock(Clock):
+    """A session's clock: pauses hand the session's turn to others."""
+
+    def __init__(self, clock, port):
+        self.clock = clock
+        self.port = port
+
+    def now(self):
+        return self.clock.now()
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        self.port.yield_turn()
+        try:
+            self.clock.sleep(seconds)
+        finally:
+            self.port.take_turn()
+
+
+class TelnetPort(Port):
+    """The session thread's side of a connection.
+
+    Writes are queued and handed to the event loop in batches (one wakeup
+    per burst of output); input lines arrive on a thread-safe queue.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.scheduler = session.server.scheduler
+        self.width = 80
+        self.height = 24
+        self.closed = False
+        self.waiting = False  # Parked in readline()
+        self.resume = None    # Resume point of the prompt being waited on
+        self.hibernate = None  # GameEngine.hibernate while a game is running
+        self.hibernated = False
+        self.last_input = time.monotonic()
+        self.sleep_pending = False
+        self.watch = None  # Player session chosen at the login prompt
+        self.cpu = 0.0  # Thread CPU seconds spent on this session's turns
+        self.frames_dropped = 0
+        self.commands_dropped = 0
+        self.queued_bytes = 0  # Written but not yet handed to the transport
+        self.rtt = None  # Smoothed round trip to the client, once measured
+        self.line_arrived = None  # When the last line read came in
+        self._turn = False
+        self._turn_start = 0.0
+        self._lines = queue.SimpleQueue()
+        self._arrivals = deque()  # Arrival time of each queued line
+        self._out = []
+        self._out_lock = threading.Lock()
+        self._drained = threading.Condition(self._out_lock)
+
+    # Turns (session thread)
+
+    def take_turn(self):
+        if not self._turn:
+            self.scheduler.acquire()
+            self._turn = True
+            self._turn_start = time.thread_time()
+
+    def yield_turn(self):
+        if self._turn:
+            self.cpu += time.thread_time() - self._turn_start
+            self._turn = False
+            self.scheduler.release()
+
+    # Output
+
+    def write(self, text):
+        if self.closed:
+            raise Disconnected()
+        data = text.replace('\n', '\r\n').encode('utf-8')  # UTF-8 never contains IAC
+        with self._out_lock:
+            self._out.append(data)
+            self.queued_bytes += len(data)
+            first = len(self._out) == 1
+            behind = self.queued_bytes > self.session.server.output_limit
+        if first:
+            self.session.loop.call_soon_threadsafe(self.session.drain)
+        if behind:
+            self._wait_for_client()
+
+    def _wait_for_client(self):
+        """Block a session that is too far ahead of its client; hang up
+        if the client stays stuck for `slow_timeout` seconds."""
+        server = self.session.server
+        self.yield_turn()
+        with self._out_lock:
+            caught_up = self._drained.wait_for(
+                lambda: self.closed or self.queued_bytes <= server.output_limit,
+                server.slow_timeout)
+        if not caught_up:
+            server.slow_disconnects += 1
+            self.closed = True
+            self.close()
+        if self.closed:
+            raise Disconnected()
+        self.take_turn()
+
+    def congested(self):
+        return self.session.paused or self.queued_bytes > FRAME_BUDGET
+
+    def frame(self, text):
+        if super().frame(text):
+            return True
+        self.frames_dropped += 1
+        return False
+
+    def take_output(self):
+        with self._out_lock:
+            data = b''.join(self._out)
+            self._out.clear()
+            self.queued_bytes = 0
+            self._drained.notify_all()
+        return data
+
+    def input(self, prompt='', resume=None):
+        self.resume = resume
+        try:
+            return super().input(prompt)
+        finally:
+            self.resume = None
+
+    def readline(self):
+        self.yield_turn()
+        self.waiting = True
+        try:
+            while True:
+                line = self._lines.get()
+                if line is not _SLEEP:
+                    break
+                self.sleep_pending = False
+                # Only sleep where the game can resume, and not if the
+                # player typed something after the host decided to
+                if (self.resume is not None and self.hibernate is not None
+                        and self._lines.empty() and self.hibernate(self.resume)):
+                    self.hibernated = True
+                    raise Hibernated()
+        finally:
+            self.waiting = False
+        if line is None:
+            self._lines.put(None)  # Stay disconnected for any later reads
+            raise Disconnected()
+        self.line_arrived = self._arrivals.popleft()
+        self.take_turn()  # Behind every session that was already waiting
+        return line
+
+    def has_input(self):
+        return not self._lines.empty()
+
+    def queue_depth(self):
+        return self._lines.qsize()
+
+    def key_lag(self):
+        if self.line_arrived is None:
+            return None
+        return time.monotonic() - self.line_arrived + (self.rtt or 0.0)
+
+    def observe_rtt(self, sample):
+        """Fold one measured round trip into the estimate (as TCP's SRTT)."""
+        self.rtt = sample if self.rtt is None else self.rtt + (sample - self.rtt) / 8
+
+    def deliver(self, line):
+        """Called from the event loop; None means the client left."""
+        if line is None:
+            self.closed = True
+            with self._out_lock:
+                self._drained.notify_all()
+        else:
+            self.last_input = time.monotonic()
+            self._arrivals.append(self.last_input)
+        self._lines.put(line)
+
+    def request_sleep(self):
+        """Called from the event loop: hibernate if still idle at a
+        resume point when the session thread next looks."""
+        self.sleep_pending = True
+        self._lines.put(_SLEEP)
+
+    def close(self):
+        try:
+            self.session.loop.call_soon_threadsafe(self.session.close)
+        except RuntimeError:
+            pass  # The host's event loop is gone, and the connection with it
+
+
+class Session(asyncio.Protocol):
+    """One telnet connection."""
+
+    def __init__(self, server):
+        self.server = server
+        self.loop = server.loop
+        self.id = None
+        self.profile = None
+        self.transport = None
+        self.port = TelnetPort(self)
+        self.parser = TelnetParser()
+        self.started = time.monotonic()
+        self.thread = None
+        self.asleep = False  # Hibernated: no thread, no engine
+        self.paused = False  # The transport's buffer is full; output waits
+        self.compressor = None  # MCCP2 stream once the client accepts it
+        self.broadcast = Broadcast(server.loop, server.spectator_tick)
+        self.watching = None  # The Broadcast this spectator views
+        self.lagging = False  # Spectator skipping frames until it catches up
+        self._ping_sent = None  # When the unanswered TIMING-MARK went out
+        self._pinged = 0.0
+        self._partial = b''
+        self._profile_lock = None  # Open lock file while the profile is claimed
+
+    # Event loop side
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if not self.server.admit(self):
+            transport.write(b'Server full, try again later.\r\n')
+            transport.close()
+            return
+        transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        offer = command(DO, NAWS)
+        if self.server.compression:
+            offer += command(WILL, COMPRESS2)
+        transport.write(offer)
+        self._start()
+
+    def _start(self):
+        self.thread = threading.Thread(target=self._run, name=f'session-{self.id}',
+                                       daemon=True)
+        self.thread.start()
+
+    def wake(self):
+        """Resume a hibernated session on a fresh thread."""
+        self.asleep = False
+        self.port.hibernated = False
+        self.server.wakeups += 1
+        self._start()
+
+    def _fell_asleep(self):
+        self.thread = None
+        if self.transport.is_closing():
+            return
+        self.asleep = True
+        self.server.hibernations += 1
+        if self.port.has_input():
+            self.wake()  # The player typed while the session was saving
+
+    def data_received(self, chunk):
+        data, events = self.parser.feed(chunk)
+        for event in events:
+            self._negotiate(event)
+        if not data:
+            return
+        data = self._partial + data
+        if b'\n' not in data and b'\r' not in data:
+            self._partial = data
+            if len(data) > MAX_LINE:
+                self.close()
+            return
+        # Clients end lines with CRLF, CR NUL or a bare LF
+        lines = data.replace(b'\r\n', b'\n').replace(b'\r\x00', b'\n').replace(b'\r', b'\n').split(b'\n')
+        self._partial = lines.pop()
+        if self.watching is not None:
+            if any(line.strip().lower() == b'q' for line in lines):
+                self.close()
+            return
+        for line in lines:
+            if self.port.queue_depth() >= self.server.max_queued:
+                self.port.commands_dropped += 1  # Typed far ahead of the game
+                continue
+            self.port.deliver(line.decode('utf-8', 'replace'))
+        if self.asleep and lines:
+            self.wake()
+
+    def _negotiate(self, event):
+        kind, option = event[0], event[1]
+        if option == TIMING_MARK and kind in ('will', 'wont'):
+            if self._ping_sent is not None:
+                self.port.observe_rtt(time.monotonic() - self._ping_sent)
+                self._ping_sent = None
+        elif kind == 'sb':
+            if option == NAWS:
+                size = parse_naws(event[2])
+                if size and size[0] and size[1]:
+                    self.port.width, self.port.height = size
+        elif kind == 'will' and option != NAWS:
+            self.send(command(DONT, option))
+        elif kind == 'do':
+            if option == COMPRESS2 and self.server.compression:
+                if self.compressor is None:
+                    # Output still queued goes out compressed, after the marker
+                    self.transport.write(Compressor.START)
+                    self.compressor = Compressor(self.server.compression)
+            else:
+                self.send(command(WONT, option))
+        elif kind == 'dont' and option == COMPRESS2 and self.compressor is not None:
+            self.transport.write(self.compressor.finish())
+            self.compressor = None
+        # 'will NAWS' needs no reply (we asked); other 'wont'/'dont' are final
+
+    def send(self, data):
+        """Write to the client, through the MCCP2 stream if there is one."""
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        self.transport.write(data)
+
+    def drain(self):
+        if self.paused:
+            return  # resume_writing() drains
+        data = self.port.take_output()
+        if data and self.transport is not None and not self.transport.is_closing():
+            self.send(data)
+            self.broadcast.publish(data)
+            self._ping()
+
+    def _ping(self):
+        """Ask for a TIMING-MARK behind the output just sent; the reply
+        times the round trip. Clients that never answer are asked once."""
+        now = time.monotonic()
+        if self._ping_sent is None and now - self._pinged >= PING_INTERVAL:
+            self.send(command(DO, TIMING_MARK))
+            self._ping_sent = self._pinged = now
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+        self.drain()
+
+    # Spectating (event loop side)
+
+    def spectate(self, player):
+        """Start showing `player`'s screen on this connection."""
+        if self.transport.is_closing():
+            return
+        if player.transport is None or player.transport.is_closing():
+            self.send(b'\r\nThat player just left.\r\n')
+            self.close()
+            return
+        if self.compressor is not None:
+            # Viewers share plain bytes, so this client's stream ends here
+            self.transport.write(self.compressor.finish())
+            self.compressor = None
+        self.thread = None
+        self.watching = player.broadcast
+        self.watching.flush()  # Older bursts are already in the keyframe
+        self.watching.viewers.add(self)
+        self.transport.write(self.watching.keyframe())
+
+    def show(self, data, broadcast):
+        """One frame of the watched screen; behind viewers skip to the latest."""
+        transport = self.transport
+        if transport.is_closing():
+            return
+        backlog = transport.get_write_buffer_size()
+        if self.lagging:
+            if backlog:
+                broadcast.skipped += 1
+                return
+            self.lagging = False
+            transport.write(broadcast.keyframe())  # Already includes the frame
+        elif backlog > SPECTATOR_LAG:
+            self.lagging = True
+            broadcast.skipped += 1
+        else:
+            transport.write(data)
+
+    def stats(self):
+        port = self.port
+        return {
+            'id': self.id,
+            'profile': self.profile,
+            'cpu': round(port.cpu, 4),
+            'queued': port.queue_depth(),
+            'output': port.queued_bytes,
+            'frames_dropped': port.frames_dropped,
+            'commands_dropped': port.commands_dropped,
+            'asleep': self.asleep,
+            'compressed': self.compressor is not None,
+            'rtt': None if port.rtt is None else round(port.rtt, 4),
+            'viewers': len(self.broadcast.viewers),
+            'watching': self.watching is not None,
+        }
+
+    def close(self):
+        if self.transport is not None and not self.transport.is_closing():
+            self.paused = False  # Whatever is left goes out before the close
+            self.drain()
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        self.port.deliver(None)
+        self.server.release(self)
+
+    # Session thread side
+
+    def _run(self):
+        try:
+            self.port.take_turn()
+            self.server.play(self)
+        except Disconnected:
+            pass
+        except Exception as e:
+            # A bug in one session must not take the host down
+            self.server.errors += 1
+            try:
+                self.port.print(f'\r\nInternal error ({type(e).__name__}); disconnecting.')
+            except Disconnected:
+                pass
+        finally:
+            self.port.yield_turn()
+            if self.port.hibernated:
+                self.loop.call_soon_threadsafe(self._fell_asleep)
+            elif self.profile is None and self.port.watch is not None:
+                self.loop.call_soon_threadsafe(self.spectate, self.port.watch)
+            else:
+                self.port.close()
+
+
+class GameServer:
+    """Accepts telnet connections and runs a game session per player.
+
+    Saves go to a SqliteStore profile per player when `store` is given,
+    otherwise to a directory per profile under `saves_dir`. A profile can
+    only be in one session at a time, across every worker process that
+    shares the saves (see supervisor.py). `idle_timeout` seconds at a
+    resume point hibernates a session; 0 keeps every session resident.
+
+    `max_running` session threads run game code at once; `max_queued`
+    input lines wait per session before more are dropped. A session with
+    over `output_limit` bytes unsent blocks, and is disconnected after
+    `slow_timeout` seconds without its client catching up.
+
+    Clients that accept MCCP2 get their output as a zlib stream at level
+    `compression`; 0 stops offering it. Spectators get a player's output
+    in frames gathered over `spectator_tick` seconds.
+    """
+
+    def __init__(self, host='127.0.0.1', port=4000, store=None, saves_dir='saves',
+                 speed=1.0, max_sessions=5000, idle_timeout=600.0, max_running=4,
+                 max_queued=16, output_limit=256 * 1024, slow_timeout=30.0,
+                 compression=6, spectator_tick=0.05):
+        self.host = host
+        self.port = port
+        self.store = store
+        self.saves_dir = saves_dir
+        self.speed = speed
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_queued = max_queued
+        self.output_limit = output_limit
+        self.slow_timeout = slow_timeout
+        self.compression = compression
+        self.spectator_tick = spectator_tick
+        self.scheduler = Scheduler(max_running)
+        self.sessions = {}
+        self.profiles = set()  # Profiles currently playing
+        self.players = {}  # Profile -> its Session, for spectators
+        self.connections = 0
+        self.errors = 0
+        self.hibernations = 0
+        self.wakeups = 0
+        self.slow_disconnects = 0
+        self.lock_dir = os.path.join(
+            os.path.dirname(os.path.abspath(store.path)) if store is not None else saves_dir,
+            '.locks')
+        self.draining = False
+        self.loop = None
+        self._server = None
+        self._sweeper = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    async def start(self, sock=None, reuse_port=None):
+        """Listen on host:port, or on an already bound `sock`."""
+        self.loop = asyncio.get_running_loop()
+        if sock is not None:
+            self._server = await self.loop.create_server(
+                lambda: Session(self), sock=sock, backlog=1024)
+        else:
+            self._server = await self.loop.create_server(
+                lambda: Session(self), self.host, self.port, backlog=1024,
+                reuse_port=reuse_port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.idle_timeout:
+            self._sweep()
+        return self
+
+    def _sweep(self):
+        """Ask sessions idle at a resume point to hibernate; reschedules itself."""
+        now = time.monotonic()
+        for session in self.sessions.values():
+            port = session.port
+            if (port.waiting and port.resume is not None and not port.sleep_pending
+                    and now - port.last_input >= self.idle_timeout):
+                port.request_sleep()
+        interval = min(5.0, max(0.05, self.idle_timeout / 4))
+        self._sweeper = self.loop.call_later(interval, self._sweep)
+
+    def _stop_sweeping(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting and hang up on everyone."""
+        self._stop_sweeping()
+        self._server.close()
+        for session in list(self.sessions.values()):
+            session.close()
+        await self._server.wait_closed()
+
+    async def drain(self, timeout=30.0, notice='Server restarting - your progress is saved.'):
+        """Stop accepting, give sessions `timeout` seconds to finish, then
+        hang up on the rest once their saves are flushed."""
+        self.draining = True
+        self._stop_sweeping()
+        self._server.close()
+        deadline = time.monotonic() + timeout
+        while self.sessions and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        threads = [s.thread for s in self.sessions.values() if s.thread is not None]
+        for session in list(self.sessions.values()):
+            session.send(f'\r\n{notice}\r\n'.encode('utf-8'))
+            session.close()
+        await self.loop.run_in_executor(None, _join_all, threads, 10.0)
+        await self.loop.run_in_executor(None, shared_worker().flush)
+
+    def admit(self, session):
+        if len(self.sessions) >= self.max_sessions:
+            return False
+        self._next_id += 1
+        self.connections += 1
+        session.id = self._next_id
+        self.sessions[session.id] = session
+        return True
+
+    def release(self, session):
+        self.sessions.pop(session.id, None)
+        if session.watching is not None:
+            session.watching.viewers.discard(session)
+        session.broadcast.flush()
+        for viewer in list(session.broadcast.viewers):
+            viewer.send(b'\r\n[The player has left.]\r\n')
+            viewer.close()
+        with self._lock:
+            if self.players.get(session.profile) is session:
+                del self.players[session.profile]
+            if session._profile_lock is not None:
+                session._profile_lock.close()  # Releases the flock
+                session._profile_lock = None
+            self.profiles.discard(session.profile)
+
+    def stats(self):
+        sessions = list(self.sessions.values())
+        waiting = sum(s.port.waiting for s in sessions)
+        asleep = sum(s.asleep for s in sessions)
+        depths = [s.port.queue_depth() for s in sessions]
+        return {
+            'sessions': len(sessions),
+            'waiting': waiting,
+            'asleep': asleep,
+            'busy': len(sessions) - waiting - asleep,
+            'turn_queue': self.scheduler.waiting(),
+            'queued': sum(depths),
+            'max_queued': max(depths, default=0),
+            'cpu': round(sum(s.port.cpu for s in sessions), 4),
+            'frames_dropped': sum(s.port.frames_dropped for s in sessions),
+            'commands_dropped': sum(s.port.commands_dropped for s in sessions),
+            'slow_disconnects': self.slow_disconnects,
+            'compressed': sum(s.compressor is not None for s in sessions),
+            'spectators': sum(s.watching is not None for s in sessions),
+            'connections': self.connections,
+            'errors': self.errors,
+            'hibernations': self.hibernations,
+            'wakeups': self.wakeups,
+        }
+
+    def session_stats(self):
+        """Per-session CPU time, queue depths and drops, busiest first."""
+        return sorted((s.stats() for s in self.sessions.values()),
+                      key=lambda row: row['cpu'], reverse=True)
+
+    # Session thread side
+
+    def _lock_profile(self, name):
+        """Open lock file holding an exclusive flock on `name`, or None if
+        another process has it. The kernel drops the lock if we crash."""
+        os.makedirs(self.lock_dir, exist_ok=True)
+        f = open(os.path.join(self.lock_dir, name + '.lock'), 'a')
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return None
+        return f
+
+    def _claim_profile(self, session):
+        """The profile this session plays, or None once it has picked a
+        player to watch instead (left in port.watch)."""
+        port = session.port
+        while True:
+            name = port.input('Profile name: ').strip()
+            if name.lower().startswith('watch '):
+                with self._lock:
+                    player = self.players.get(name[6:].strip())
+                if player is not None:
+                    port.print('Watching. Type q and Enter to stop.')
+                    port.watch = player
+                    return None
+                port.print('Nobody here is playing as that.')
+                continue
+            if not PROFILE_NAME.match(name):
+                port.print('Use up to 24 letters, digits, - or _.')
+                continue
+            with self._lock:
+                if name not in self.profiles:
+                    lock = self._lock_profile(name) if fcntl is not None else None
+                    if fcntl is None or lock is not None:
+                        self.profiles.add(name)
+                        self.players[name] = session
+                        session._profile_lock = lock
+                        return name
+            port.print('That profile is already playing.')
+
+    def saver_for(self, profile):
+        if self.store is not None:
+            return self.store.saver(profile)
+        directory = os.path.join(self.saves_dir, profile)
+        os.makedirs(directory, exist_ok=True)
+        return SaveLoad(directory=directory)
+
+    def play(self, session):
+        """Run one player's game on their session thread, picking up where
+        a hibernated session of the profile stopped."""
+        port = session.port
+        if session.profile is None:
+            session.profile = self._claim_profile(session)
+            if session.profile is None:
+                return  # Spectating: the connection stays, the thread ends
+        clock = make_clock(self.speed)
+        if not isinstance(clock, VirtualClock):
+            clock = TurnClock(clock, port)  # Instant pauses aren't worth a turn
+        engine = GameEngine(clock=clock, io=port, saver=self.saver_for(session.profile))
+        if self.idle_timeout:
+            port.hibernate = engine.hibernate
+        try:
+            engine.run(resume=True)
+        finally:
+            port.hibernate = None  # Nothing may keep a sleeping engine alive
+
+
+def _join_all(threads, timeout):
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Host TERMINAL.EXIT over telnet.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4000)
+    parser.add_argument('--db', help='SQLite save store (default: a directory per profile)')
+    parser.add_argument('--saves', default='saves', help='Save directory when --db is not given')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Pacing multiplier (0 = instant)')
+    parser.add_argument('--max-sessions', type=int, default=5000)
+    parser.add_argument('--idle-timeout', type=float, default=600.0,
+                        help='Seconds idle before a session is hibernated (0 = never)')
+    parser.add_argument('--max-running', type=int, default=4,
+                        help='Sessions running game code at once')
+    parser.add_argument('--slow-timeout', type=float, default=30.0,
+                        help='Seconds a stuck client keeps its session')
+    parser.add_argument('--compression', type=int, default=6, choices=range(10), metavar='LEVEL',
+                        help='MCCP2 zlib level offered to clients (0 = off)')
+    parser.add_argument('--spectator-tick', type=float, default=0.05,
+                        help='Seconds of output gathered into each spectator frame')
+    args = parser.parse_args(argv)
+
+    store = None
+    if args.db:
+        from .sqlite_store import SqliteStore
+        store = SqliteStore(args.db)
+    server = GameServer(args.host, args.port, store=store, saves_dir=args.saves,
+                        speed=args.speed, max_sessions=args.max_sessions,
+                        idle_timeout=args.idle_timeout, max_running=args.max_running,
+                        slow_timeout=args.slow_timeout, compression=args.compression,
+                        spectator_tick=args.spectator_tick)
+
+    async def serve():
+        await server.start()
+        print(f'Listening on {server.host}:{server.port}', flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shared_worker().flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
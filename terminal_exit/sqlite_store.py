@@ -0,0 +1,249 @@
+"""
+SQLite save store for TERMINAL.EXIT hosts with many player profiles.
+One database (WAL mode) holds every profile's slots and journals.
+`SqliteSaveLoad` has the same interface as `SaveLoad`, so the engine,
+journal and autosave worker use it unchanged.
+
+Each thread gets its own connection from the store's pool; SQL is kept
+in module constants so sqlite3's statement cache reuses the prepared
+statements. Several saves can share one transaction via `transaction()`
+or `save_many()`.
+"""
+import json
+import lzma
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+from .serialization import encode, decode, summarize
+from .compression import codec, decompress
+from .integrity import BlockError, frame, unframe
+from .save_load import SaveError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    slot       INTEGER NOT NULL,
+    header     TEXT NOT NULL,
+    data       BLOB NOT NULL,
+    saved_at   REAL NOT NULL,
+    PRIMARY KEY (profile_id, slot)
+);
+CREATE TABLE IF NOT EXISTS journal (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    slot       INTEGER NOT NULL,
+    line       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_by_slot ON journal (profile_id, slot, id);
+"""
+
+_GET_PROFILE = 'SELECT id FROM profiles WHERE name = ?'
+_ADD_PROFILE = 'INSERT OR IGNORE INTO profiles (name, created) VALUES (?, ?)'
+_LIST_PROFILES = 'SELECT name FROM profiles ORDER BY name'
+_PUT_SLOT = ('INSERT OR REPLACE INTO slots (profile_id, slot, header, data, saved_at) '
+             'VALUES (?, ?, ?, ?, ?)')
+_GET_SLOT = 'SELECT data FROM slots WHERE profile_id = ? AND slot = ?'
+_GET_HEADER = 'SELECT header FROM slots WHERE profile_id = ? AND slot = ?'
+_LIST_HEADERS = 'SELECT slot, header FROM slots WHERE profile_id = ? AND slot >= 0 ORDER BY slot'
+_DEL_SLOT = 'DELETE FROM slots WHERE profile_id = ? AND slot = ?'
+_ADD_LINE = 'INSERT INTO journal (profile_id, slot, line) VALUES (?, ?, ?)'
+_GET_LINES = 'SELECT line FROM journal WHERE profile_id = ? AND slot = ? ORDER BY id'
+_DEL_LINES = 'DELETE FROM journal WHERE profile_id = ? AND slot = ?'
+
+
+class SqliteStore:
+    """A WAL-mode database shared by every profile, pooled per thread."""
+
+    def __init__(self, path, busy_timeout=10.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._all = []
+        self._all_guard = threading.Lock()
+        self._profile_ids = {}
+        try:
+            self.connection().executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise SaveError(f'Could not set up {self.path}: {e}') from e
+
+    def connection(self):
+        """This thread's connection, opened on first use."""
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            try:
+                db = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                     isolation_level=None, cached_statements=64,
+                                     check_same_thread=False)
+                db.execute('PRAGMA journal_mode=WAL')
+                db.execute('PRAGMA synchronous=NORMAL')
+                db.execute('PRAGMA foreign_keys=ON')
+            except sqlite3.Error as e:
+                raise SaveError(f'Could not open {self.path}: {e}') from e
+            # Each connection is only used by its own thread; close() may
+            # run elsewhere, hence check_same_thread=False above
+            self._local.db = db
+            self._local.depth = 0
+            with self._all_guard:
+                self._all.append(db)
+        return db
+
+    @contextmanager
+    def transaction(self):
+        """One write transaction; nested uses join the outer one."""
+        db = self.connection()
+        outer = self._local.depth == 0
+        try:
+            if outer:
+                # IMMEDIATE takes the write lock up front, so concurrent
+                # writers queue on busy_timeout instead of deadlocking
+                db.execute('BEGIN IMMEDIATE')
+            self._local.depth += 1
+            try:
+                yield db
+            finally:
+                self._local.depth -= 1
+            if outer:
+                db.execute('COMMIT')
+        except BaseException as e:
+            if outer and db.in_transaction:
+                db.execute('ROLLBACK')
+            if isinstance(e, sqlite3.Error):
+                raise SaveError(f'Save database error: {e}') from e
+            raise
+
+    def profile_id(self, name):
+        """Row id for a profile, created on first use."""
+        pid = self._profile_ids.get(name)
+        if pid is None:
+            with self.transaction() as db:
+                db.execute(_ADD_PROFILE, (name, time.time()))
+                pid = db.execute(_GET_PROFILE, (name,)).fetchone()[0]
+            self._profile_ids[name] = pid
+        return pid
+
+    def profiles(self):
+        return [row[0] for row in self.connection().execute(_LIST_PROFILES)]
+
+    def saver(self, profile, **options):
+        """A SaveLoad-compatible view of one profile."""
+        return SqliteSaveLoad(self, profile, **options)
+
+    def save_many(self, saves):
+        """Write [(saver, data)] in a single transaction."""
+        # Encode first so the write lock is only held for the inserts
+        rows = [saver._row(data) for saver, data in saves]
+        with self.transaction() as db:
+            db.executemany(_PUT_SLOT, rows)
+
+    def close(self):
+        """Close every pooled connection (call once all threads are done)."""
+        with self._all_guard:
+            for db in self._all:
+                db.close()
+            self._all.clear()
+        self._local = threading.local()
+
+
+class SqliteSaveLoad:
+    """Same interface as SaveLoad, backed by one profile in a SqliteStore."""
+
+    def __init__(self, store, profile, fmt='binary', slot=0, compression='none'):
+        self.store = store
+        self.profile = profile
+        self.fmt = fmt
+        self.slot = slot
+        self.compression = compression
+        self._compress = codec(compression)
+        self.recovered = None  # No backups here; kept for SaveLoad parity
+        self._pid = store.profile_id(profile)
+
+    def _key(self, slot):
+        return self._pid, self.slot if slot is None else slot
+
+    def _row(self, data, slot=None, name=None):
+        """Parameters for _PUT_SLOT. Raises SaveError."""
+        pid, slot = self._key(slot)
+        if name is None:
+            old = self.read_header(slot)
+            name = old['name'] if old else f'Slot {slot}'
+        try:
+            header = dict(summarize(data), name=name, saved_at=int(time.time()))
+            blob = frame(self._compress(encode(data, self.fmt)))
+        except (TypeError, ValueError, KeyError) as e:
+            raise SaveError(f'Could not encode save: {e}') from e
+        return pid, slot, json.dumps(header), blob, time.time()
+
+    def save(self, data, slot=None, name=None):
+        """Write a slot in one transaction. Raises SaveError."""
+        row = self._row(data, slot, name)
+        with self.store.transaction() as db:
+            db.execute(_PUT_SLOT, row)
+        return True
+
+    def load(self, slot=None):
+        """Return the saved state, None if there is no save. Raises SaveError."""
+        try:
+            row = self.store.connection().execute(_GET_SLOT, self._key(slot)).fetchone()
+            return decode(decompress(unframe(row[0]))) if row else None
+        except sqlite3.Error as e:
+            raise SaveError(f'Save database error: {e}') from e
+        except BlockError as e:
+            raise SaveError(f'Save {self.profile}/{slot} is corrupt: {e}') from e
+        except (ValueError, IndexError, KeyError, zlib.error, lzma.LZMAError) as e:
+            raise SaveError(f'Save {self.profile}/{slot} is unreadable: {e}') from e
+
+    def read_header(self, slot=None):
+        """Slot summary without touching the save body. Raises SaveError."""
+        try:
+            row = self.store.connection().execute(_GET_HEADER, self._key(slot)).fetchone()
+            return json.loads(row[0]) if row else None
+        except sqlite3.Error as e:
+            raise SaveError(f'Save database error: {e}') from e
+        except (TypeError, ValueError) as e:
+            raise SaveError(f'Save header {self.profile}/{slot} is unreadable: {e}') from e
+
+    def list_headers(self):
+        """[(slot, header)] for the load menu. Raises SaveError."""
+        try:
+            rows = self.store.connection().execute(_LIST_HEADERS, (self._pid,))
+            return [(slot, json.loads(header)) for slot, header in rows]
+        except sqlite3.Error as e:
+            raise SaveError(f'Save database error: {e}') from e
+        except (TypeError, ValueError) as e:
+            raise SaveError(f'Save headers of {self.profile} are unreadable: {e}') from e
+
+    def list_slots(self):
+        return [slot for slot, _ in self.list_headers()]
+
+    def append_journal(self, lines, slot=None, durable=False):
+        # Durability comes from the transaction; `durable` is accepted for
+        # interface compatibility
+        pid, slot = self._key(slot)
+        with self.store.transaction() as db:
+            db.executemany(_ADD_LINE, [(pid, slot, line) for line in lines])
+
+    def read_journal(self, slot=None):
+        """All journal lines, oldest first. Raises SaveError."""
+        try:
+            rows = self.store.connection().execute(_GET_LINES, self._key(slot))
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            raise SaveError(f'Save database error: {e}') from e
+
+    def reset_journal(self, slot=None):
+        with self.store.transaction() as db:
+            db.execute(_DEL_LINES, self._key(slot))
+
+    def delete(self, slot=None):
+        """Remove a slot and its journal."""
+        with self.store.transaction() as db:
+            db.execute(_DEL_SLOT, self._key(slot))
+            db.execute(_DEL_LINES, self._key(slot))
@@ -0,0 +1,210 @@
+"""
+Streaming save export/import for very large worlds.
+Instead of building one state dict, export writes one small JSON record
+per line (NDJSON): game state first, then the rooms near the player,
+then the rest, so memory use does not grow with the world. Import reads it
+back the same way, and can stop once the rooms near the player are in
+so play starts while the far regions are still being read.
+
+Records:
+    ["meta", {version, layout, current, playtime, player}]
+    ["ai", {name, mood, upgrades, bond}]
+    ["item", [name, desc, item_type, key]]
+    ["said", text]
+    ["room", name, visited, cleared, examined or null, items or null]
+    ["ready"]        -- everything needed to start playing is above
+    ["end", rooms]   -- room count, to catch truncated files
+"""
+import gzip
+import json
+import os
+
+from .inventory import Item
+from .serialization import SCHEMA_VERSION
+
+NEAR_RADIUS = 3  # Rooms this close to the player load before play starts
+
+
+def _open(path, mode, gz=None):
+    """Plain or gzip file; by default decided by the extension."""
+    if path.endswith('.gz') if gz is None else gz:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _line(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def iter_records(engine, near=NEAR_RADIUS):
+    """Yield export records one at a time."""
+    world, ai = engine.world, engine.ai
+    yield ['meta', {
+        'version': SCHEMA_VERSION,
+        'layout': world.layout_id(),
+        'current': world.current_room.name,
+        'playtime': engine.playtime(),
+        'player': dict(engine.player_state),
+    }]
+    yield ['ai', {'name': ai.name, 'mood': ai.mood,
+                  'upgrades': list(ai.upgrades), 'bond': ai.bond}]
+    for item in engine.inventory.items:
+        yield ['item', [item.name, item.desc, item.item_type, item.key]]
+    for text in ai.dialogue_history:
+        yield ['said', text]
+    ready = False
+    for distance, room in world.rooms_by_distance(world.current_room, near):
+        if not ready and distance is None:
+            yield ['ready']
+            ready = True
+        yield ['room', room.name, room._visited, room._cleared,
+               room._examined or None, room._items or None]
+    if not ready:
+        yield ['ready']
+    yield ['end', len(world.rooms)]
+
+
+def export_stream(engine, path, near=NEAR_RADIUS):
+    """Write the engine's state to `path` record by record, atomically."""
+    tmp = path + '.tmp'
+    try:
+        with _open(tmp, 'w', gz=path.endswith('.gz')) as f:
+            for record in iter_records(engine, near):
+                f.write(_line(record))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+class StreamLoader:
+    """Incrementally applies an exported stream to an engine.
+
+    `until_ready()` loads everything play needs; after that, `step()`
+    reads a few more records at a time and `ensure()` reads ahead until
+    particular rooms are in. Writes go straight to the objects, so no
+    journal events are emitted while loading.
+    """
+
+    def __init__(self, engine, path):
+        self.engine = engine
+        self.path = path
+        self.rooms_loaded = 0
+        self.done = False
+        self.ready = False
+        self._file = _open(path, 'r')
+        # Check the header before touching the engine
+        first = self._read()
+        if first[0] != 'meta':
+            self.close()
+            raise ValueError(f'{path} is not a TERMINAL.EXIT export')
+        self._check(first[1])
+        self._reset()
+        self._apply(first)
+
+    def _reset(self):
+        engine = self.engine
+        engine.world.begin_loading()
+        engine.inventory.items = []
+        engine.ai.dialogue_history = []
+
+    def _read(self):
+        line = self._file.readline()
+        if not line:
+            self.close()
+            raise ValueError(f'{self.path} ends before its end record')
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            self.close()
+            raise ValueError(f'{self.path}: bad record: {e}') from e
+
+    def _check(self, meta):
+        if meta['version'] > SCHEMA_VERSION:
+            self.close()
+            raise ValueError(f"Save version {meta['version']} is newer than this game")
+        if meta['layout'] != self.engine.world.layout_id():
+            self.close()
+            raise ValueError('Save was made for a different world layout')
+
+    def _next(self):
+        record = self._read()
+        try:
+            self._apply(record)
+        except (KeyError, IndexError, TypeError) as e:
+            self.close()
+            raise ValueError(f'{self.path}: bad record {record!r:.60}: {e}') from e
+
+    def _apply(self, record):
+        kind = record[0]
+        engine = self.engine
+        if kind == 'room':
+            _, name, visited, cleared, examined, items = record
+            room = engine.world.rooms[name]
+            if visited or cleared or examined or items:
+                room.visited = visited
+                room.encounter_cleared = cleared
+                if examined:
+                    room.examined_objects = examined
+                if items:
+                    room.items = items
+            room.loaded = True
+            self.rooms_loaded += 1
+        elif kind == 'said':
+            engine.ai.dialogue_history.append(record[1])
+        elif kind == 'item':
+            engine.inventory.items.append(Item(*record[1]))
+        elif kind == 'ready':
+            self.ready = True
+        elif kind == 'meta':
+            meta = record[1]
+            engine.player_state.update(meta['player'])
+            engine.world.current_room = engine.world.rooms[meta['current']]
+            engine.resume_playtime(meta['playtime'])
+        elif kind == 'ai':
+            ai = engine.ai
+            data = record[1]
+            ai.name, ai.mood = data['name'], data['mood']
+            ai.upgrades = list(data['upgrades'])
+            ai._bond = data['bond']
+            ai.refresh_modifiers()
+        elif kind == 'end':
+            self.close()
+            if record[1] != self.rooms_loaded:
+                raise ValueError(f'{self.path}: expected {record[1]} rooms, '
+                                 f'read {self.rooms_loaded}')
+        else:
+            raise ValueError(f'{self.path}: unknown record {kind!r}')
+
+    def until_ready(self):
+        while not self.ready and not self.done:
+            self._next()
+        return self
+
+    def step(self, records=500):
+        """Read up to `records` more. Returns True while more remain."""
+        for _ in range(records):
+            if self.done:
+                break
+            self._next()
+        return not self.done
+
+    def ensure(self, rooms):
+        """Read ahead until every room in `rooms` is loaded."""
+        while not self.done and not all(r.loaded for r in rooms):
+            self._next()
+
+    def finish(self):
+        while not self.done:
+            self._next()
+        return self.engine
+
+    def close(self):
+        self.done = self.ready = True
+        self.engine.world.end_loading()
+        self._file.close()
+
+
+def import_stream(engine, path):
+    """Load a whole exported stream into `engine`."""
+    return StreamLoader(engine, path).finish()
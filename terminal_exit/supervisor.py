@@ -0,0 +1,395 @@
+"""
+Pre-fork supervisor for the TERMINAL.EXIT telnet host.
+One server process is held to a single core by the GIL, so the
+supervisor forks N workers (default: one per core), each running its
+own GameServer. On Linux every worker listens on its own SO_REUSEPORT
+socket and the kernel spreads new connections across them; elsewhere
+the workers share one inherited listening socket.
+
+Game modules (room layouts, enemy templates, art tables) are imported
+before forking and moved out of the garbage collector's reach with
+gc.freeze(), so their pages stay shared copy-on-write between workers.
+
+    python -m terminal_exit.supervisor --workers 4 --port 4000 --db saves.db
+
+Each worker's first stats report means its socket is listening; the
+supervisor logs "Listening" once the first generation has reported.
+
+Signals: SIGHUP forks a fresh set of workers and drains the old ones;
+SIGTERM/SIGINT drains everyone and exits; SIGUSR1 prints a status line.
+Crashed workers are restarted (with backoff if they keep crashing).
+Because the port is shared, a new supervisor can also be started next
+to an old one, which is then sent SIGTERM: an upgrade without downtime.
+"""
+import argparse
+import gc
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+
+REPORT_EVERY = 1.0    # Seconds between worker stat reports
+MAX_BACKOFF = 30.0    # Longest wait before restarting a crashing worker
+HEALTHY_AFTER = 5.0   # A worker that lived this long resets the backoff
+
+
+def preload():
+    """Import everything sessions share, then freeze it for copy-on-write."""
+    from . import (ai_companion, ascii_art, combat_system, content, effects,  # noqa: F401
+                   game_engine, interactive_intro, server, tactics,
+                   upgrades, world_manager)
+    gc.collect()
+    # Frozen objects are never scanned by collections, so the workers'
+    # collectors don't write to (and un-share) these pages
+    gc.freeze()
+
+
+def _listen(host, port):
+    """(socket, reuse_port). With reuse_port the socket only reserves the
+    port (workers bind their own); otherwise workers accept from it."""
+    reuse = hasattr(socket, 'SO_REUSEPORT') and sys.platform.startswith('linux')
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    if not reuse:
+        sock.listen(1024)
+        sock.setblocking(False)
+    return sock, reuse
+
+
+# ═══════════════════════════════════════════════════════════════
+# WORKER (runs in the forked child)
+# ═══════════════════════════════════════════════════════════════
+
+async def _serve(sock, reuse, host, port, options, stats_fd, drain_timeout):
+    import asyncio
+    from .server import GameServer
+
+    options = dict(options)
+    db = options.pop('db', None)
+    if db:
+        from .sqlite_store import SqliteStore
+        options['store'] = SqliteStore(db)  # Connections must not cross a fork
+    server = GameServer(host, port, **options)
+    if reuse:
+        await server.start(reuse_port=True)
+    else:
+        await server.start(sock=sock)
+
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    loop.add_signal_handler(signal.SIGTERM, stopping.set)
+
+    def report():
+        line = json.dumps(dict(server.stats(), pid=os.getpid(),
+                               draining=server.draining)) + '\n'
+        try:
+            os.write(stats_fd, line.encode())  # < PIPE_BUF, so atomic
+        except (BlockingIOError, BrokenPipeError):
+            pass  # Supervisor is behind or gone; the next report will do
+
+    while not stopping.is_set():
+        report()
+        try:
+            await asyncio.wait_for(stopping.wait(), REPORT_EVERY)
+        except asyncio.TimeoutError:
+            pass
+    report()
+    drain = asyncio.ensure_future(server.drain(drain_timeout))
+    while not drain.done():
+        await asyncio.wait([drain], timeout=REPORT_EVERY)
+        report()
+    await drain
+
+
+def _worker(sock, reuse, host, port, options, stats_fd, drain_timeout):
+    import asyncio
+    signal.set_wakeup_fd(-1)
+    for name in ('SIGINT', 'SIGHUP', 'SIGUSR1'):
+        signal.signal(getattr(signal, name), signal.SIG_IGN)
+    for name in ('SIGTERM', 'SIGCHLD'):
+        signal.signal(getattr(signal, name), signal.SIG_DFL)
+    os.set_blocking(stats_fd, False)
+    asyncio.run(_serve(sock, reuse, host, port, options, stats_fd, drain_timeout))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SUPERVISOR
+# ═══════════════════════════════════════════════════════════════
+
+class Worker:
+    def __init__(self, pid, generation):
+        self.pid = pid
+        self.generation = generation
+        self.started = time.monotonic()
+        self.stats = {}
+        self.ready = False  # Has reported, so its server is accepting
+        self.stopping = False  # Sent SIGTERM; draining
+
+
+class Supervisor:
+    """Forks and looks after the worker processes."""
+
+    def __init__(self, host='127.0.0.1', port=4000, workers=None, options=None,
+                 drain_timeout=30.0, report_interval=0.0, out=None):
+        self.host = host
+        self.port = port
+        self.size = workers or os.cpu_count() or 1
+        self.options = options or {}
+        self.drain_timeout = drain_timeout
+        self.report_interval = report_interval  # 0: only on SIGUSR1
+        self.out = out or sys.stdout
+        self.workers = {}
+        self.generation = 0
+        self.restarts = 0
+        self.stopping = False
+        self._backoff = 0.0
+        self._respawn_at = []  # Monotonic times at which to start a replacement
+        self._signals = []
+        self._sock = None
+        self._reuse = False
+
+    def start(self):
+        self._sock, self._reuse = _listen(self.host, self.port)
+        self.port = self._sock.getsockname()[1]
+        preload()
+        self._stats_r, self._stats_w = os.pipe()
+        os.set_blocking(self._stats_r, False)
+        self._stats_buffer = b''
+        for _ in range(self.size):
+            self._spawn()
+        return self
+
+    def wait_ready(self, timeout=30.0):
+        """Wait until every worker has reported (its server has started).
+        False if one exited or `timeout` passed first."""
+        deadline = time.monotonic() + timeout
+        while not all(w.ready for w in self.workers.values()):
+            left = deadline - time.monotonic()
+            if left <= 0 or self._respawn_at:
+                return False
+            if select.select([self._stats_r], [], [], min(left, 0.25))[0]:
+                self._read_stats()
+            self._reap()
+        return True
+
+    def _spawn(self):
+        self.out.flush()  # Don't let the child inherit unwritten output
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(self._stats_r)
+                _worker(self._sock, self._reuse, self.host, self.port, self.options,
+                        self._stats_w, self.drain_timeout)
+                code = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        self.workers[pid] = Worker(pid, self.generation)
+        return pid
+
+    # Control
+
+    def reload(self):
+        """Fork a new generation, then drain the old one."""
+        old = [w for w in self.workers.values() if not w.stopping]
+        self.generation += 1
+        self._respawn_at.clear()
+        for _ in range(self.size):
+            self._spawn()
+        for worker in old:
+            self._terminate(worker)
+
+    def stop(self):
+        self.stopping = True
+        for worker in self.workers.values():
+            if not worker.stopping:
+                self._terminate(worker)
+
+    def _terminate(self, worker):
+        worker.stopping = True
+        try:
+            os.kill(worker.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    # Bookkeeping
+
+    def _read_stats(self):
+        while True:
+            try:
+                chunk = os.read(self._stats_r, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            self._stats_buffer += chunk
+        *lines, self._stats_buffer = self._stats_buffer.split(b'\n')
+        for line in lines:
+            try:
+                stats = json.loads(line)
+            except ValueError:
+                continue
+            worker = self.workers.get(stats.pop('pid', None))
+            if worker is not None:
+                worker.stats = stats
+                if not worker.ready:
+                    worker.ready = True
+                    self._log(f'worker {worker.pid} ready')
+
+    def _reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is None or worker.stopping or self.stopping:
+                continue
+            # Unexpected exit: replace it, backing off if it died young
+            lived = time.monotonic() - worker.started
+            code = os.waitstatus_to_exitcode(status)
+            self._backoff = 0.0 if lived > HEALTHY_AFTER else min(
+                MAX_BACKOFF, max(0.5, self._backoff * 2))
+            self._respawn_at.append(time.monotonic() + self._backoff)
+            self._log(f'worker {pid} exited ({code}) after {lived:.1f}s; '
+                      f'restarting in {self._backoff:.1f}s')
+
+    def _respawn_due(self):
+        now = time.monotonic()
+        due = [t for t in self._respawn_at if t <= now]
+        self._respawn_at = [t for t in self._respawn_at if t > now]
+        for _ in due:
+            self.restarts += 1
+            self._spawn()
+
+    def status(self):
+        """{pid: latest stats} for every live worker."""
+        return {pid: dict(w.stats, generation=w.generation, stopping=w.stopping)
+                for pid, w in self.workers.items()}
+
+    def status_line(self):
+        parts = []
+        total = 0
+        for pid, w in sorted(self.workers.items()):
+            sessions = w.stats.get('sessions', 0)
+            total += sessions
+            flag = ' draining' if w.stopping else ''
+            parts.append(f"{pid}: {sessions} ({w.stats.get('busy', 0)} busy, "
+                         f"{w.stats.get('asleep', 0)} asleep){flag}")
+        return (f'status: {len(self.workers)} workers, {total} sessions, '
+                f'{self.restarts} restarts | ' + ' | '.join(parts))
+
+    def _log(self, text):
+        print(f'[supervisor] {text}', file=self.out, flush=True)
+
+    # Main loop
+
+    def _on_signal(self, signum, frame):
+        self._signals.append(signum)
+
+    def run(self):
+        """Supervise until stopped and every worker has exited."""
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        signal.set_wakeup_fd(wake_w)
+        for name in ('SIGHUP', 'SIGTERM', 'SIGINT', 'SIGUSR1', 'SIGCHLD'):
+            signal.signal(getattr(signal, name), self._on_signal)
+        next_report = time.monotonic() + self.report_interval
+        kill_at = None
+        try:
+            while self.workers or not self.stopping:
+                readable, _, _ = select.select([self._stats_r, wake_r], [], [], 0.25)
+                if wake_r in readable:
+                    try:
+                        os.read(wake_r, 512)
+                    except BlockingIOError:
+                        pass
+                if self._stats_r in readable:
+                    self._read_stats()
+                for signum in self._signals:
+                    if signum == signal.SIGHUP and not self.stopping:
+                        self._log('reloading')
+                        self.reload()
+                    elif signum in (signal.SIGTERM, signal.SIGINT) and not self.stopping:
+                        self._log('draining')
+                        self.stop()
+                        kill_at = time.monotonic() + self.drain_timeout + 15
+                    elif signum == signal.SIGUSR1:
+                        self._log(self.status_line())
+                self._signals.clear()
+                self._reap()
+                if not self.stopping:
+                    self._respawn_due()
+                elif kill_at is not None and time.monotonic() > kill_at:
+                    for pid in self.workers:
+                        os.kill(pid, signal.SIGKILL)
+                    kill_at = None
+                if self.report_interval and time.monotonic() >= next_report:
+                    self._log(self.status_line())
+                    next_report = time.monotonic() + self.report_interval
+        finally:
+            signal.set_wakeup_fd(-1)
+            os.close(wake_r)
+            os.close(wake_w)
+            self._sock.close()
+        self._log('stopped')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Host TERMINAL.EXIT on every core.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4000)
+    parser.add_argument('--workers', type=int, help='Worker processes (default: one per core)')
+    parser.add_argument('--db', help='SQLite save store (default: a directory per profile)')
+    parser.add_argument('--saves', default='saves', help='Save directory when --db is not given')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Pacing multiplier (0 = instant)')
+    parser.add_argument('--max-sessions', type=int, default=5000, help='Per worker')
+    parser.add_argument('--idle-timeout', type=float, default=600.0,
+                        help='Seconds idle before a session is hibernated (0 = never)')
+    parser.add_argument('--max-running', type=int, default=4,
+                        help='Sessions running game code at once, per worker')
+    parser.add_argument('--slow-timeout', type=float, default=30.0,
+                        help='Seconds a stuck client keeps its session')
+    parser.add_argument('--compression', type=int, default=6, choices=range(10), metavar='LEVEL',
+                        help='MCCP2 zlib level offered to clients (0 = off)')
+    parser.add_argument('--spectator-tick', type=float, default=0.05,
+                        help='Seconds of output gathered into each spectator frame')
+    parser.add_argument('--drain-timeout', type=float, default=30.0,
+                        help='Seconds sessions get to finish on reload/stop')
+    parser.add_argument('--report', type=float, default=0.0,
+                        help='Print per-worker session counts every N seconds')
+    args = parser.parse_args(argv)
+    if not hasattr(os, 'fork'):
+        parser.error('needs os.fork(); run terminal_exit.server instead')
+
+    supervisor = Supervisor(args.host, args.port, args.workers, options={
+        'db': args.db, 'saves_dir': args.saves, 'speed': args.speed,
+        'max_sessions': args.max_sessions, 'idle_timeout': args.idle_timeout,
+        'max_running': args.max_running, 'slow_timeout': args.slow_timeout,
+        'compression': args.compression, 'spectator_tick': args.spectator_tick,
+    }, drain_timeout=args.drain_timeout, report_interval=args.report)
+    supervisor.start()
+    if supervisor.wait_ready():
+        supervisor._log(f'Listening on {supervisor.host}:{supervisor.port} '
+                        f'with {supervisor.size} workers')
+    else:
+        supervisor._log('workers failed to start; retrying')
+    supervisor.run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
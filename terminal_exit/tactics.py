@@ -0,0 +1,298 @@
+"""
+Tactical Advisor solver for TERMINAL.EXIT.
+Models a fight as a Markov decision process over (player HP, enemy HP,
+potions) using the same damage rolls as CombatSystem, and solves it once
+per enemy template so advice during play is a table lookup.
+"""
+import threading
+from collections import OrderedDict
+
+from .combat_system import ENEMIES, StrikeBar
+
+
+ACTIONS = ('attack', 'analyze', 'item', 'mercy')
+ACTION_CHOICES = {'attack': '1', 'analyze': '2', 'item': '3', 'mercy': '4'}
+
+BAR_WIDTH = 30
+BASE_STARTS = range(10, 17)   # CombatSystem picks randint(10, 16)
+DEFAULT_POTION_CAP = 5
+DEFAULT_SKILL = 0.5
+TIE = 1e-9   # Prefer earlier actions unless a later one is really better
+
+
+def _uniform(lo, hi, shift=0):
+    """Distribution of randint(lo, hi) + shift as {value: probability}."""
+    p = 1.0 / (hi - lo + 1)
+    return {v + shift: p for v in range(lo, hi + 1)}
+
+
+def _mix(*weighted):
+    """Combine (weight, distribution) pairs into one distribution."""
+    out = {}
+    for weight, dist in weighted:
+        for value, p in dist.items():
+            out[value] = out.get(value, 0.0) + weight * p
+    return out
+
+
+def strike_odds(mods, skill=DEFAULT_SKILL):
+    """Chance of (base hit, bonus hit, miss) on the attack minigame.
+
+    With skill 0 the key press lands at a uniformly random moment of the
+    cursor's bounce; with skill 1 it always lands in the best zone.
+    """
+    # One full bounce visits the end positions once and the rest twice
+    weights = [2] * BAR_WIDTH
+    weights[0] = weights[-1] = 1
+    total = float(sum(weights)) * len(BASE_STARTS)
+
+    counts = {None: 0, 'base': 0, 'bonus': 0}
+    for base_start in BASE_STARTS:
+        bar = StrikeBar.build(BAR_WIDTH, base_start,
+                              mods.base_zone_width, mods.bonus_zones)
+        for pos, w in enumerate(weights):
+            counts[bar.result_at(pos)] += w
+
+    best = 'bonus' if counts['bonus'] else 'base'
+    odds = {k: (1 - skill) * v / total for k, v in counts.items()}
+    odds[best] += skill
+    return odds['base'], odds['bonus'], odds[None]
+
+
+class FightModel:
+    """Damage distributions for one enemy and modifier table."""
+
+    def __init__(self, enemy, mods, max_player_hp=100, mercy_threshold=30,
+                 skill=DEFAULT_SKILL):
+        self.enemy_hp = enemy.max_hp
+        self.max_player_hp = max_player_hp
+        self.mercy_hp = enemy.max_hp * mercy_threshold / 100
+        self.heal = 30 + mods.heal_bonus
+        self.mercy_chance = min(1.0, mods.mercy_chance)
+
+        p_base, p_bonus, p_miss = strike_odds(mods, skill)
+        strike = 12 + mods.strike_damage
+        self.attack = _mix(
+            (p_base, _uniform(1, 6, strike)),
+            (p_bonus, _uniform(5, 12, strike)),
+            (p_miss, _uniform(2, 5)),
+        )
+        self.analyze = _uniform(4, 9, mods.analyze_damage)
+
+        hits = {}
+        for raw, p in _uniform(5, 12).items():
+            dmg = max(1, raw - mods.mitigation)
+            hits[dmg] = hits.get(dmg, 0.0) + p
+        self.enemy_hit = hits
+
+    def key(self):
+        """Hashable summary used to share solved tables."""
+        return (self.enemy_hp, self.max_player_hp, self.mercy_hp, self.heal,
+                self.mercy_chance, tuple(sorted(self.attack.items())),
+                tuple(sorted(self.analyze.items())),
+                tuple(sorted(self.enemy_hit.items())))
+
+    def expected_damage(self):
+        """Mean damage dealt by each damaging action and taken per enemy turn."""
+        mean = lambda dist: sum(v * p for v, p in dist.items())
+        return {
+            'attack': mean(self.attack),
+            'analyze': mean(self.analyze),
+            'enemy': mean(self.enemy_hit),
+        }
+
+
+class TacticsTable:
+    """Solved optimal action and win probability for every fight state.
+
+    The fight always progresses: attacking and analyzing lower enemy HP,
+    potions run out, and failed mercy costs player HP. So the table is
+    filled bottom-up in one pass (enemy HP, then potions, then player HP),
+    each state reading only states that are already solved. The 30-turn
+    stalemate cap is not modelled. Fleeing never wins, so it is not an
+    option here.
+    """
+
+    def __init__(self, model, potion_cap=DEFAULT_POTION_CAP):
+        self.model = model
+        self.potion_cap = potion_cap
+        self.expected_damage = model.expected_damage()
+        self._solve()
+
+    def _index(self, php, ehp, potions):
+        return (ehp * (self.potion_cap + 1) + potions) * (self.h + 1) + php
+
+    def _solve(self):
+        m = self.model
+        h = self.h = m.max_player_hp
+        e_max = m.enemy_hp
+        pots = self.potion_cap + 1
+        row = h + 1
+        size = (e_max + 1) * pots * row
+        win = [0.0] * size
+        best = bytearray(size)
+        # after[idx]: win chance once the enemy has swung, from state idx
+        after = [0.0] * size
+
+        attack = list(m.attack.items())
+        analyze = list(m.analyze.items())
+        enemy_hit = list(m.enemy_hit.items())
+        heal = m.heal
+
+        for ehp in range(1, e_max + 1):
+            can_mercy = ehp <= m.mercy_hp
+            for potions in range(pots):
+                base = (ehp * pots + potions) * row
+                for php in range(1, h + 1):
+                    # Enemy swings at this state (needs lower php, solved)
+                    swing = 0.0
+                    for dmg, p in enemy_hit:
+                        if php > dmg:
+                            swing += p * win[base + php - dmg]
+                    after[base + php] = swing
+
+                    q = 0.0
+                    for dmg, p in attack:
+                        left = ehp - dmg
+                        q += p if left <= 0 else p * after[(left * pots + potions) * row + php]
+                    qs = [q]
+
+                    q = 0.0
+                    for dmg, p in analyze:
+                        left = ehp - dmg
+                        q += p if left <= 0 else p * after[(left * pots + potions) * row + php]
+                    qs.append(q)
+
+                    if potions:
+                        healed = min(h, php + heal)
+                        qs.append(after[(ehp * pots + potions - 1) * row + healed])
+                    else:
+                        qs.append(-1.0)
+
+                    if can_mercy:
+                        mc = m.mercy_chance
+                        qs.append(mc + (1 - mc) * swing)
+
+                    value = max(qs)
+                    choice = 0
+                    while qs[choice] < value - TIE:
+                        choice += 1
+                    win[base + php] = value
+                    best[base + php] = choice
+
+        self._win = win
+        self._best = best
+
+    def lookup(self, player_hp, enemy_hp, potions):
+        """Return (best action, win probability) for a fight state."""
+        if enemy_hp <= 0:
+            return None, 1.0
+        if player_hp <= 0:
+            return None, 0.0
+        player_hp = min(player_hp, self.h)
+        enemy_hp = min(enemy_hp, self.model.enemy_hp)
+        potions = min(potions, self.potion_cap)
+        idx = self._index(player_hp, enemy_hp, potions)
+        return ACTIONS[self._best[idx]], self._win[idx]
+
+
+TABLE_CACHE = 32   # Solved tables kept (about 0.6 MB each)
+FIGHT_CACHE = 256  # Fight setups remembered -> their table
+
+
+class _LRU:
+    """Small thread-safe least-recently-used map."""
+
+    def __init__(self, size):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def __len__(self):
+        return len(self._items)
+
+
+_TABLES = _LRU(TABLE_CACHE)
+_BY_FIGHT = _LRU(FIGHT_CACHE)
+
+
+def _mods_key(mods):
+    """Modifier tables that compare equal share solved fights."""
+    return tuple(getattr(mods, name) for name in mods.__slots__)
+
+
+def get_table(enemy_key, mods, potions=0, max_player_hp=100,
+              mercy_threshold=30, skill=DEFAULT_SKILL):
+    """Solved table for an enemy template, shared across fights."""
+    cap = max(DEFAULT_POTION_CAP, potions)
+    fight = (enemy_key, _mods_key(mods), cap, max_player_hp, mercy_threshold, skill)
+    table = _BY_FIGHT.get(fight)
+    if table is None:
+        model = FightModel(ENEMIES[enemy_key], mods, max_player_hp,
+                           mercy_threshold, skill)
+        key = (model.key(), cap)
+        table = _TABLES.get(key)
+        if table is None:
+            table = TacticsTable(model, cap)
+            _TABLES.put(key, table)
+        _BY_FIGHT.put(fight, table)
+    return table
+
+
+def precompute(mods, **kwargs):
+    """Solve every enemy template up front (e.g. when advice unlocks)."""
+    return {key: get_table(key, mods, **kwargs) for key in ENEMIES}
+
+
+_warm_lock = threading.Lock()
+_warm_pending = OrderedDict()  # Modifier tables waiting to be precomputed
+_warm_thread = None
+
+
+def warm(mods):
+    """precompute() on a background thread, so the first advice in each
+    fight is a lookup rather than a solve on the game thread. Requests
+    for equal tables are merged; only the latest few are kept."""
+    global _warm_thread
+    with _warm_lock:
+        _warm_pending[_mods_key(mods)] = mods
+        while len(_warm_pending) > 8:
+            _warm_pending.popitem(last=False)
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(target=_warm_loop, name='tactics-warm',
+                                            daemon=True)
+            _warm_thread.start()
+
+
+def _warm_loop():
+    global _warm_thread
+    while True:
+        with _warm_lock:
+            if not _warm_pending:
+                _warm_thread = None
+                return
+            _, mods = _warm_pending.popitem(last=False)
+        precompute(mods)
+
+
+def advise(combat):
+    """Best action and win probability for a live CombatSystem."""
+    table = get_table(combat.enemy_key, combat.ai.modifiers,
+                      combat.potion_count(), combat.max_player_hp,
+                      combat.mercy_threshold)
+    return table.lookup(combat.player_hp, combat.current_enemy.hp,
+                        combat.potion_count())
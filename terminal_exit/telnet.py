@@ -0,0 +1,158 @@
+"""
+Telnet protocol handling for the TERMINAL.EXIT host.
+Just enough of RFC 854 for a line-based game: option negotiation is
+separated from the data stream, NAWS (RFC 1073) window-size reports are
+decoded, MCCP2 output compression is offered, TIMING-MARK (RFC 860)
+replies time the round trip, and everything else the client offers is
+politely refused.
+"""
+import struct
+import zlib
+
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+SE = 240
+
+TIMING_MARK = 6  # Answered once the client has processed what came before
+NAWS = 31  # Negotiate About Window Size
+COMPRESS2 = 86  # MCCP2: everything the server sends becomes one zlib stream
+
+_VERBS = {DO: 'do', DONT: 'dont', WILL: 'will', WONT: 'wont'}
+
+
+def command(verb, option):
+    """IAC <verb> <option> bytes, e.g. command(DO, NAWS)."""
+    return bytes((IAC, verb, option))
+
+
+def subnegotiation(option, payload):
+    return bytes((IAC, SB, option)) + payload.replace(b'\xff', b'\xff\xff') + bytes((IAC, SE))
+
+
+def parse_naws(payload):
+    """(width, height) from a NAWS payload, or None if malformed."""
+    if len(payload) != 4:
+        return None
+    return struct.unpack('>HH', payload)
+
+
+class Compressor:
+    """The server side of one MCCP2 stream.
+
+    A single zlib context lasts for the whole connection, so borders,
+    banners and screens the client has already been sent come back as
+    short back-references. Each chunk is sync-flushed so the client can
+    show it straight away.
+    """
+
+    START = subnegotiation(COMPRESS2, b'')  # Sent plain; the stream follows it
+
+    def __init__(self, level=6):
+        self._z = zlib.compressobj(level)
+        self.raw = 0     # Bytes in
+        self.sent = 0    # Bytes out
+
+    def compress(self, data):
+        out = self._z.compress(data) + self._z.flush(zlib.Z_SYNC_FLUSH)
+        self.raw += len(data)
+        self.sent += len(out)
+        return out
+
+    def finish(self):
+        """End the stream; what follows goes out uncompressed."""
+        out = self._z.flush(zlib.Z_FINISH)
+        self.sent += len(out)
+        return out
+
+
+class Decompressor:
+    """The client side of MCCP2, for tests and benchmarks: feed raw
+    socket bytes, get telnet bytes back."""
+
+    def __init__(self):
+        self._z = None
+        self._plain = b''  # Uncompressed bytes that may hold the start marker
+
+    def feed(self, chunk):
+        if self._z is None:
+            data = self._plain + chunk
+            at = data.find(Compressor.START)
+            if at < 0:
+                # Hold back a tail that could be the start of the marker
+                keep = next((k for k in range(len(Compressor.START) - 1, 0, -1)
+                             if data.endswith(Compressor.START[:k])), 0)
+                self._plain = data[len(data) - keep:]
+                return data[:len(data) - keep]
+            self._plain = b''
+            self._z = zlib.decompressobj()
+            return data[:at] + self._inflate(data[at + len(Compressor.START):])
+        return self._inflate(chunk)
+
+    def _inflate(self, data):
+        out = self._z.decompress(data)
+        if self._z.eof:
+            # Stream ended: the rest is plain again
+            rest, self._z = self._z.unused_data, None
+            out += self.feed(rest)
+        return out
+
+
+class TelnetParser:
+    """Splits incoming bytes into plain data and telnet events.
+
+    `feed()` returns (data, events); events are ('do'|'dont'|'will'|'wont',
+    option) and ('sb', option, payload). Commands split across reads are
+    carried over to the next feed.
+    """
+
+    MAX_SUBNEGOTIATION = 256
+
+    def __init__(self):
+        self._pending = b''  # Incomplete command from the previous read
+
+    def feed(self, chunk):
+        data = self._pending + chunk if self._pending else chunk
+        self._pending = b''
+        if IAC not in data:
+            return data, []  # Fast path: ordinary typing
+        out = bytearray()
+        events = []
+        i, n = 0, len(data)
+        while i < n:
+            j = data.find(IAC, i)
+            if j < 0:
+                out += data[i:]
+                break
+            out += data[i:j]
+            if j + 1 >= n:
+                self._pending = data[j:]
+                break
+            verb = data[j + 1]
+            if verb == IAC:
+                out.append(IAC)  # Escaped 0xFF
+                i = j + 2
+            elif verb in _VERBS:
+                if j + 2 >= n:
+                    self._pending = data[j:]
+                    break
+                events.append((_VERBS[verb], data[j + 2]))
+                i = j + 3
+            elif verb == SB:
+                end = data.find(bytes((IAC, SE)), j + 2)
+                if end < 0:
+                    if n - j > self.MAX_SUBNEGOTIATION:
+                        i = n  # Runaway subnegotiation: drop it
+                    else:
+                        self._pending = data[j:]
+                    break
+                if end > j + 2:
+                    payload = data[j + 3:end].replace(b'\xff\xff', b'\xff')
+                    events.append(('sb', data[j + 2], payload))
+                i = end + 2
+            else:
+                i = j + 2  # NOP, GA, AYT...: nothing to do for a line game
+        return bytes(out), events
@@ -0,0 +1,271 @@
+"""
+Terminal I/O ports for TERMINAL.EXIT.
+Everything the game shows or reads goes through a port instead of the
+built-in print()/input(), so one process can run many sessions, each on
+its own terminal (stdio, a socket, or memory for tests and bots).
+
+The engine and every scene keep their port in `self.io` and bind it for
+the duration of a scene with `use_port`, which is how the drawing helpers
+in ascii_art find the right terminal.
+"""
+import contextvars
+import os
+import select
+import socket
+import sys
+from collections import deque
+from contextlib import contextmanager
+
+CLEAR = '\033[2J\033[H'
+
+
+class Disconnected(BaseException):
+    """The player's terminal went away.
+
+    Like KeyboardInterrupt it is a BaseException, so it unwinds a session
+    straight through the scenes' broad `except Exception` clauses.
+    """
+
+
+class Hibernated(BaseException):
+    """The host put an idle session to sleep after saving it.
+
+    Raised from an input prompt that named a resume point (see
+    GameEngine.hibernate); the session's thread unwinds and exits.
+    """
+
+
+class Port:
+    """Base port: subclasses implement write() and readline()."""
+
+    width = 80   # Terminal columns
+    height = 24  # Terminal rows
+
+    def write(self, text):
+        raise NotImplementedError
+
+    def readline(self):
+        """One line of input without its newline. Raises Disconnected."""
+        raise NotImplementedError
+
+    def has_input(self):
+        """True if a line can be read without waiting; None if unknown."""
+        return None
+
+    def congested(self):
+        """True while the terminal is behind on output, so animations
+        should skip frames (see frame())."""
+        return False
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    # Built on the primitives above
+
+    def print(self, *values, sep=' ', end='\n', flush=False):
+        self.write(sep.join(str(v) for v in values) + end)
+        if flush:
+            self.flush()
+
+    def input(self, prompt='', resume=None):
+        """Prompt for a line. `resume` names the point the game could be
+        resumed from if the player goes idle here; hosts that hibernate
+        idle sessions use it, other ports ignore it."""
+        if prompt:
+            self.write(prompt)
+        self.flush()
+        return self.readline()
+
+    def clear(self):
+        self.write(CLEAR)
+
+    def frame(self, text):
+        """Write one animation frame, or drop it if the terminal is
+        congested. Returns whether it was written."""
+        if self.congested():
+            return False
+        self.write(text)
+        return True
+
+    def key_pressed(self):
+        """Non-blocking check used by timing games. Consumes the input.
+
+        None means this terminal can't tell (the caller falls back).
+        """
+        ready = self.has_input()
+        if ready:
+            self.readline()
+        return ready
+
+    def key_lag(self):
+        """Seconds since the player pressed the key key_pressed() last
+        reported: how long it waited here plus the round trip that made
+        the screen late. None if this terminal can't tell."""
+        return None
+
+
+class StdioPort(Port):
+    """The process's own terminal."""
+
+    def write(self, text):
+        sys.stdout.write(text)
+
+    def flush(self):
+        sys.stdout.flush()
+
+    def input(self, prompt='', resume=None):
+        # The built-in keeps line editing and history where available
+        try:
+            return input(prompt)
+        except EOFError:
+            raise Disconnected() from None
+
+    def readline(self):
+        return self.input()
+
+    def has_input(self):
+        if os.name == 'nt':
+            try:
+                import msvcrt
+            except ImportError:
+                return None
+            if msvcrt.kbhit():
+                msvcrt.getch()
+                return True
+            return False
+        try:
+            if not sys.stdin.isatty():
+                return None
+            return bool(select.select([sys.stdin], [], [], 0)[0])
+        except (OSError, ValueError):
+            return None
+
+    def key_pressed(self):
+        ready = self.has_input()
+        if ready and os.name != 'nt':
+            sys.stdin.readline()  # Line-buffered: the key came with Enter
+        return ready
+
+    @property
+    def width(self):
+        try:
+            return os.get_terminal_size().columns
+        except OSError:
+            return Port.width
+
+
+class MemoryPort(Port):
+    """Scripted input and captured output, for tests and headless runs."""
+
+    def __init__(self, inputs=(), width=80, height=24):
+        self.inputs = deque(inputs)
+        self.output = []
+        self.width = width
+        self.height = height
+        self.closed = False
+
+    def feed(self, *lines):
+        self.inputs.extend(lines)
+
+    def write(self, text):
+        self.output.append(text)
+
+    def readline(self):
+        if not self.inputs:
+            raise Disconnected()
+        return self.inputs.popleft()
+
+    def has_input(self):
+        return bool(self.inputs)
+
+    def text(self):
+        """Everything written so far."""
+        return ''.join(self.output)
+
+    def close(self):
+        self.closed = True
+
+
+class NullPort(Port):
+    """Discards output; answers every prompt with Enter."""
+
+    def write(self, text):
+        pass
+
+    def readline(self):
+        return ''
+
+    def has_input(self):
+        return False
+
+
+class SocketPort(Port):
+    """A raw line-based TCP connection (e.g. `nc host port`)."""
+
+    def __init__(self, sock, width=80, height=24, encoding='utf-8'):
+        self.sock = sock
+        self.width = width
+        self.height = height
+        self.encoding = encoding
+        self._buffer = b''
+
+    def write(self, text):
+        try:
+            self.sock.sendall(text.replace('\n', '\r\n').encode(self.encoding))
+        except OSError:
+            raise Disconnected() from None
+
+    def _fill(self):
+        try:
+            chunk = self.sock.recv(4096)
+        except OSError:
+            chunk = b''
+        if not chunk:
+            raise Disconnected()
+        self._buffer += chunk
+
+    def readline(self):
+        while b'\n' not in self._buffer:
+            self._fill()
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.rstrip(b'\r').decode(self.encoding, 'replace')
+
+    def has_input(self):
+        if b'\n' in self._buffer:
+            return True
+        try:
+            readable = select.select([self.sock], [], [], 0)[0]
+        except (OSError, ValueError):
+            return False
+        if readable:
+            self._fill()
+        return b'\n' in self._buffer
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+_stdio = StdioPort()
+_current = contextvars.ContextVar('terminal_port', default=_stdio)
+
+
+def current_port():
+    """The port bound for this session (stdio if none is)."""
+    return _current.get()
+
+
+@contextmanager
+def use_port(port):
+    """Route the drawing helpers to `port` inside the block."""
+    token = _current.set(port)
+    try:
+        yield port
+    finally:
+        _current.reset(token)
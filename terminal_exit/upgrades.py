@@ -2,20 +2,19 @@
 AI Upgrade system for TERMINAL.EXIT.
 Upgrades enhance the AI companion's abilities.
 """
+from .content import Record, freeze
 
 
-class Upgrade:
-    """Represents an AI upgrade/module."""
-    
-    def __init__(self, name, category, description, ability=None):
-        self.name = name
-        self.category = category  # 'analysis', 'combat', 'utility', 'progression'
-        self.description = description
-        self.ability = ability  # Function or ability name
+class Upgrade(Record):
+    """Represents an AI upgrade/module (shared, read-only)."""
+
+    # category: 'analysis', 'combat', 'utility', 'progression'
+    # ability: ability name (see effects.EFFECTS)
+    __slots__ = ('name', 'category', 'description', 'ability')
 
 
 # Available upgrades in the game
-UPGRADES = {
+UPGRADES = freeze({
     # Analysis Modules
     'scanner': Upgrade(
         'Basic Scanner',
@@ -95,7 +94,7 @@ UPGRADES = {
         'Restore corrupted areas',
         'recover_data'
     ),
-}
+})
 
 
 def get_upgrade(upgrade_id):
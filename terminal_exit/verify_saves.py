@@ -0,0 +1,32 @@
+"""
+Verify every save, backup and journal in a directory against its
+checksums, without loading any of them into a game.
+
+    python -m terminal_exit.verify_saves saves/
+"""
+import os
+import sys
+import time
+
+from .save_load import verify_directory
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print('usage: python -m terminal_exit.verify_saves DIRECTORY')
+        return 2
+    start = time.perf_counter()
+    results = verify_directory(argv[0])
+    elapsed = time.perf_counter() - start
+    size = sum(os.path.getsize(path) for path, _ in results)
+    bad = [(path, problem) for path, problem in results if problem]
+    for path, problem in bad:
+        print(f'CORRUPT {path}: {problem}')
+    print(f'{len(results)} files, {len(bad)} corrupt, '
+          f'{size / 1e6 / max(elapsed, 1e-9):.0f} MB/s')
+    return 1 if bad else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,132 +1,321 @@
-"""World management with zones and interactive rooms."""
+"""World management with zones and interactive rooms.
+
+The map itself (a BaseWorld of RoomSpecs) is built once and shared by
+every session. A WorldManager only records what its player changed -
+visited, cleared, examined, room items - in a sparse overlay; every
+other lookup falls through to the base, so a new session costs the same
+on a 9-room map as on a 100,000-room one.
+"""
+import weakref
+import zlib
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .content import RoomSpec
+
+
+def _spec_field(name):
+    """Read-only attribute served by the room's shared spec."""
+    return property(lambda self: getattr(self.spec, name))
+
+
+def _unpack_bits(data, count):
+    """Schema-1 room bitset as a '0'/'1' string of length `count`."""
+    return format(int.from_bytes(data, 'little'), f'0{count}b')[::-1][:count]
+
+
+def _progress_field(slot):
+    """Per-session flag; setting it records the room in the overlay."""
+    def get(self):
+        return getattr(self, slot)
+
+    def set(self, value):
+        object.__setattr__(self, slot, value)
+        if self._world is not None:
+            self._world._touch(self)
+    return property(get, set)
+
+
+def _progress_container(slot, factory):
+    """Per-session dict/list, created (and overlaid) on first use."""
+    def get(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            self._set(slot, value)
+        return value
+
+    def set(self, value):
+        self._set(slot, value)
+    return property(get, set)
 
 
 class Room:
-    """Represents a single room/location."""
+    """A room in one session: the shared RoomSpec plus this player's progress.
+
+    Layout fields (name, description, options, ...) read through to the
+    spec and are read-only. Progress fields start at their defaults; the
+    first change puts the room in its world's overlay.
+    """
+    __slots__ = ('spec', '_world', '_visited', '_cleared', '_examined', '_items',
+                 '__weakref__')
+
     def __init__(self, name, description, options=None, neighbors=None, coord=(0, 0), zone='awakening', encounter=None):
-        self.name = name
-        self.description = description
-        self.options = options or []
-        self.neighbors = neighbors or {}
-        self.coord = coord
-        self.zone = zone
-        self.visited = False
-        self.examined_objects = {}  # Track what's been examined
-        self.items = []  # Items available in this room
-        self.encounter = encounter  # Enemy encounter key
-        self.encounter_cleared = False
+        self._start(RoomSpec(name, description, options or (), neighbors or {},
+                             coord, zone, encounter), None)
+
+    @classmethod
+    def from_spec(cls, spec, world=None):
+        room = cls.__new__(cls)
+        room._start(spec, world)
+        return room
+
+    def _start(self, spec, world):
+        self.spec = spec
+        self._world = world
+        self._reset()
+
+    def _reset(self):
+        self._visited = False
+        self._cleared = False
+        self._examined = None  # Track what's been examined
+        self._items = None  # Items available in this room
+
+    def _set(self, slot, value):
+        object.__setattr__(self, slot, value)
+        if self._world is not None:
+            self._world._touch(self)
+
+    def has_progress(self):
+        return bool(self._visited or self._cleared or self._examined or self._items)
+
+    name = _spec_field('name')
+    description = _spec_field('description')
+    options = _spec_field('options')
+    neighbors = _spec_field('neighbors')
+    coord = _spec_field('coord')
+    zone = _spec_field('zone')
+    encounter = _spec_field('encounter')  # Enemy encounter key
+
+    visited = _progress_field('_visited')
+    encounter_cleared = _progress_field('_cleared')
+    examined_objects = _progress_container('_examined', dict)
+    items = _progress_container('_items', list)
+
+    @property
+    def loaded(self):
+        """False while a streamed import has yet to read this room."""
+        return self._world is None or self._world._is_loaded(self.spec)
+
+    @loaded.setter
+    def loaded(self, value):
+        if self._world is not None:
+            self._world._mark_loaded(self.spec, value)
+
+
+# The designed world, shared by every session. Neighbors are kept
+# consistent and bidirectional.
+WORLD = (
+    # AWAKENING POINT - Entry zone, safe area for learning
+    RoomSpec(
+        'Awakening Point',
+        'You stand in a dim corridor. Flickering symbols line corroded walls.\nThe air hums with energy. This is where you woke up.',
+        ['Examine Wall', 'Examine Floor'],
+        {'north': 'Void Corridor'},
+        coord=(0, 0),
+        zone='awakening'
+    ),
+    # VOID CORRIDOR - First exploration area
+    RoomSpec(
+        'Void Corridor',
+        'The corridor stretches deeper. Lights flicker in waves.\nA corrupted console pulses with faint light in the shadows.',
+        ['Examine Console', 'Examine Symbols'],
+        {'south': 'Awakening Point', 'east': 'Junction', 'north': 'Lost Chambers'},
+        coord=(0, 1),
+        zone='awakening',
+        encounter='glitch'
+    ),
+    # LOST CHAMBERS - New area, deeper exploration
+    RoomSpec(
+        'Lost Chambers',
+        'A vast chamber with broken architecture. Vines of corrupted code crawl across walls.\nEverything here feels abandoned, forgotten.',
+        ['Examine Architecture', 'Examine Vines'],
+        {'south': 'Void Corridor', 'north': 'Junction'},
+        coord=(1, 1),
+        zone='awakening'
+    ),
+    # JUNCTION - Branching path
+    RoomSpec(
+        'Junction',
+        'Multiple paths meet here. A humming sound echoes from the East.\nThe air feels different—almost electric.',
+        ['Examine Paths', 'Listen to Hum'],
+        {'west': 'Void Corridor', 'east': 'Data Ruins', 'north': 'Processing Depths', 'south': 'Lost Chambers'},
+        coord=(1, 0),
+        zone='awakening'
+    ),
+    # DATA RUINS - Second zone, more dangerous
+    RoomSpec(
+        'Data Ruins',
+        'Larger chamber filled with broken servers and twisted metal.\nGlowing red error lights pulse like dying heartbeats.',
+        ['Examine Servers', 'Examine Metal'],
+        {'west': 'Junction', 'north': 'Memory Chamber', 'east': 'Corrupted Vault'},
+        coord=(2, 0),
+        zone='data_ruins',
+        encounter='phantom'
+    ),
+    # CORRUPTED VAULT - Hidden chamber
+    RoomSpec(
+        'Corrupted Vault',
+        'An imposing chamber with sealed doors. Strange symbols mark everything.\nYou feel the weight of secrets stored here.',
+        ['Examine Doors', 'Examine Symbols'],
+        {'west': 'Data Ruins'},
+        coord=(3, 0),
+        zone='data_ruins'
+    ),
+    # PROCESSING DEPTHS - Deeper into the system
+    RoomSpec(
+        'Processing Depths',
+        'You descend into chambers of pure machinery. The humming is deafening.\nLiquid drips from above, pooling in strange patterns.',
+        ['Examine Machinery', 'Examine Liquid'],
+        {'south': 'Junction', 'east': 'Memory Chamber', 'north': 'Core Nexus'},
+        coord=(1, 2),
+        zone='processing',
+        encounter='fragment'
+    ),
+    # CORE NEXUS - Central hub
+    RoomSpec(
+        'Core Nexus',
+        'You stand before immense crystalline structures pulsing with power.\nThe air itself seems alive with energy.',
+        ['Examine Crystals', 'Feel Energy'],
+        {'south': 'Memory Chamber', 'west': 'Processing Depths'},
+        coord=(2, 2),
+        zone='processing'
+    ),
+    # MEMORY CHAMBER - Lore location
+    RoomSpec(
+        'Memory Chamber',
+        'Hundreds of data crystals line the walls, each pulsing with stored information.\nA feeling of profound loneliness fills this space.',
+        ['Examine Crystals', 'Examine Information'],
+        {'south': 'Data Ruins', 'west': 'Processing Depths', 'north': 'Core Nexus'},
+        coord=(3, 2),
+        zone='processing',
+        encounter='echo'
+    ),
+)
+
+
+class BaseWorld:
+    """The shared map: room specs in layout order plus lookup tables."""
+
+    def __init__(self, specs):
+        self.specs = tuple(specs)
+        self.index = MappingProxyType({spec.name: i for i, spec in enumerate(self.specs)})
+        by_coord = {}
+        for spec in self.specs:
+            by_coord.setdefault(spec.coord, spec)  # First wins, as before
+        self.by_coord = MappingProxyType(by_coord)
+        # Same value as crc32('\n'.join(names)), without building the string
+        crc, first = 0, True
+        for spec in self.specs:
+            if not first:
+                crc = zlib.crc32(b'\n', crc)
+            crc = zlib.crc32(spec.name.encode('utf-8'), crc)
+            first = False
+        self.layout = crc
+
+    @classmethod
+    def default(cls):
+        """The game's own map, built on first use."""
+        global _default_base
+        if _default_base is None:
+            _default_base = cls(WORLD)
+        return _default_base
+
+
+_default_base = None
+
+
+class RoomMap(Mapping):
+    """Read-only name -> Room view of a session's world."""
+
+    __slots__ = ('_world',)
+
+    def __init__(self, world):
+        self._world = world
+
+    def __getitem__(self, name):
+        return self._world.room(name)
+
+    def __iter__(self):
+        return (spec.name for spec in self._world.base.specs)
+
+    def __len__(self):
+        return len(self._world.base.specs)
+
+    def __contains__(self, name):
+        return name in self._world.base.index
 
 
 class WorldManager:
     """Manages the game world structure."""
-    def __init__(self):
-        self.rooms = {}
-        self._build_world()
-        self.current_room = self.rooms['Awakening Point']
+    def __init__(self, base=None):
+        self.base = base or BaseWorld.default()
+        self.rooms = RoomMap(self)
+        self.listener = None  # Called as listener(kind, data) on changes
+        self._overlay = {}  # name -> Room the player changed (the session's diff)
+        self._views = None  # name -> Room handed out but unchanged (weak)
+        self._loaded = None  # Bitset of rooms read so far by a streamed import
+        self.current_room = self.room('Awakening Point')
         self.current_room.visited = True
 
-    def _build_world(self):
-        """Build the game world structure with consistent map connections."""
-        
-        # AWAKENING POINT - Entry zone, safe area for learning
-        awakening = Room(
-            'Awakening Point',
-            'You stand in a dim corridor. Flickering symbols line corroded walls.\nThe air hums with energy. This is where you woke up.',
-            ['Examine Wall', 'Examine Floor'],
-            coord=(0, 0),
-            zone='awakening'
-        )
-        
-        # VOID CORRIDOR - First exploration area
-        void = Room(
-            'Void Corridor',
-            'The corridor stretches deeper. Lights flicker in waves.\nA corrupted console pulses with faint light in the shadows.',
-            ['Examine Console', 'Examine Symbols'],
-            coord=(0, 1),
-            zone='awakening',
-            encounter='glitch'
-        )
-        
-        # LOST CHAMBERS - New area, deeper exploration
-        lost = Room(
-            'Lost Chambers',
-            'A vast chamber with broken architecture. Vines of corrupted code crawl across walls.\nEverything here feels abandoned, forgotten.',
-            ['Examine Architecture', 'Examine Vines'],
-            coord=(1, 1),
-            zone='awakening'
-        )
-        
-        # JUNCTION - Branching path
-        junction = Room(
-            'Junction',
-            'Multiple paths meet here. A humming sound echoes from the East.\nThe air feels different—almost electric.',
-            ['Examine Paths', 'Listen to Hum'],
-            coord=(1, 0),
-            zone='awakening'
-        )
-        
-        # DATA RUINS - Second zone, more dangerous
-        data_ruins = Room(
-            'Data Ruins',
-            'Larger chamber filled with broken servers and twisted metal.\nGlowing red error lights pulse like dying heartbeats.',
-            ['Examine Servers', 'Examine Metal'],
-            coord=(2, 0),
-            zone='data_ruins',
-            encounter='phantom'
-        )
-        
-        # CORRUPTED VAULT - Hidden chamber
-        vault = Room(
-            'Corrupted Vault',
-            'An imposing chamber with sealed doors. Strange symbols mark everything.\nYou feel the weight of secrets stored here.',
-            ['Examine Doors', 'Examine Symbols'],
-            coord=(3, 0),
-            zone='data_ruins'
-        )
-        
-        # PROCESSING DEPTHS - Deeper into the system
-        processing = Room(
-            'Processing Depths',
-            'You descend into chambers of pure machinery. The humming is deafening.\nLiquid drips from above, pooling in strange patterns.',
-            ['Examine Machinery', 'Examine Liquid'],
-            coord=(1, 2),
-            zone='processing',
-            encounter='fragment'
-        )
-        
-        # CORE NEXUS - Central hub
-        nexus = Room(
-            'Core Nexus',
-            'You stand before immense crystalline structures pulsing with power.\nThe air itself seems alive with energy.',
-            ['Examine Crystals', 'Feel Energy'],
-            coord=(2, 2),
-            zone='processing'
-        )
-        
-        # MEMORY CHAMBER - Lore location
-        memory = Room(
-            'Memory Chamber',
-            'Hundreds of data crystals line the walls, each pulsing with stored information.\nA feeling of profound loneliness fills this space.',
-            ['Examine Crystals', 'Examine Information'],
-            coord=(3, 2),
-            zone='processing',
-            encounter='echo'
-        )
-        
-        # Set up CONSISTENT bidirectional connections
-        awakening.neighbors = {'north': 'Void Corridor'}
-        void.neighbors = {'south': 'Awakening Point', 'east': 'Junction', 'north': 'Lost Chambers'}
-        lost.neighbors = {'south': 'Void Corridor', 'north': 'Junction'}
-        junction.neighbors = {'west': 'Void Corridor', 'east': 'Data Ruins', 'north': 'Processing Depths', 'south': 'Lost Chambers'}
-        data_ruins.neighbors = {'west': 'Junction', 'north': 'Memory Chamber', 'east': 'Corrupted Vault'}
-        vault.neighbors = {'west': 'Data Ruins'}
-        processing.neighbors = {'south': 'Junction', 'east': 'Memory Chamber', 'north': 'Core Nexus'}
-        nexus.neighbors = {'south': 'Memory Chamber', 'west': 'Processing Depths'}
-        memory.neighbors = {'south': 'Data Ruins', 'west': 'Processing Depths', 'north': 'Core Nexus'}
-        
-        # Add rooms to world
-        for room in [awakening, void, lost, junction, data_ruins, vault, processing, nexus, memory]:
-            self.rooms[room.name] = room
+    def room(self, name):
+        """This session's Room for `name`. Raises KeyError."""
+        room = self._overlay.get(name)
+        if room is not None:
+            return room
+        if self._views is None:
+            self._views = weakref.WeakValueDictionary()
+        room = self._views.get(name)
+        if room is None:
+            # Same object for as long as anyone holds it
+            room = Room.from_spec(self.base.specs[self.base.index[name]], self)
+            self._views[name] = room
+        return room
+
+    def _touch(self, room):
+        self._overlay[room.spec.name] = room
+
+    def _is_loaded(self, spec):
+        if self._loaded is None:
+            return True
+        i = self.base.index[spec.name]
+        return bool(self._loaded[i >> 3] & (1 << (i & 7)))
+
+    def _mark_loaded(self, spec, value):
+        if self._loaded is None:
+            return
+        i = self.base.index[spec.name]
+        if value:
+            self._loaded[i >> 3] |= 1 << (i & 7)
+        else:
+            self._loaded[i >> 3] &= ~(1 << (i & 7))
+
+    def begin_loading(self):
+        """Forget all progress and mark every room not yet loaded."""
+        self.reset_progress()
+        self._loaded = bytearray((len(self.base.specs) + 7) // 8)
+
+    def end_loading(self):
+        self._loaded = None
+
+    def reset_progress(self):
+        """Back to a fresh world (current room aside)."""
+        for room in list(self._overlay.values()):
+            room._reset()
+        if self._views is not None:
+            for room in list(self._views.values()):
+                room._reset()
+        self._overlay.clear()
 
     def move(self, direction):
         """Move in a direction using up/down/left/right.
@@ -158,11 +347,7 @@ class WorldManager:
         target_coord = (target_x, target_y)
         
         # Find room at target coordinate
-        target_room = None
-        for room in self.rooms.values():
-            if room.coord == target_coord:
-                target_room = room
-                break
+        target_room = self.room_at(target_coord)
         
         if target_room is None:
             msg = "You've hit a wall! There's nothing in that direction."
@@ -171,32 +356,128 @@ class WorldManager:
         # Move to the new room
         self.current_room = target_room
         self.current_room.visited = True
+        self._emit('room_visited', {'room': target_room.name})
         return True, f"You move {direction}...", target_room
 
+    def room_at(self, coord):
+        """Room at a map coordinate, or None."""
+        spec = self.base.by_coord.get(coord)
+        return None if spec is None else self.room(spec.name)
+
+    def adjacent(self, room):
+        """Rooms one step up/down/left/right of `room`."""
+        x, y = room.coord
+        found = (self.room_at(c) for c in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)))
+        return [r for r in found if r is not None]
+
+    def rooms_by_distance(self, start, radius):
+        """Yield (distance, room): rooms within `radius` map steps of
+        `start` nearest first, then every other room as (None, room).
+
+        Uses only the shared coordinate index, so no extra memory per room.
+        """
+        x0, y0 = start.coord
+        for d in range(radius + 1):
+            for dx in range(-d, d + 1):
+                dy = d - abs(dx)
+                for coord in ((x0 + dx, y0 + dy), (x0 + dx, y0 - dy))[:2 if dy else 1]:
+                    room = self.room_at(coord)
+                    if room is not None:
+                        yield d, room
+        by_coord = self.base.by_coord
+        for spec in self.base.specs:
+            x, y = spec.coord
+            if abs(x - x0) + abs(y - y0) > radius or by_coord[spec.coord] is not spec:
+                yield None, self.room(spec.name)
+
+    def clear_encounter(self, room):
+        """Mark a room's encounter as done so it never triggers again."""
+        room.encounter_cleared = True
+        self._emit('encounter_cleared', {'room': room.name})
+
+    def _emit(self, kind, data):
+        if self.listener is not None:
+            self.listener(kind, data)
+
+    def layout_id(self):
+        """Checksum of the room order, so saves can detect a changed map."""
+        return self.base.layout
+
+    def delta(self):
+        """The overlay as {name: [visited, cleared, examined, items]} for
+        every room the player changed; None for an untouched container."""
+        return {
+            name: [room._visited, room._cleared,
+                   dict(room._examined) if room._examined else None,
+                   list(room._items) if room._items else None]
+            for name, room in self._overlay.items() if room.has_progress()
+        }
+
+    def apply_delta(self, delta):
+        """Replace all progress with a `delta()`."""
+        self.reset_progress()
+        for name, (visited, cleared, examined, items) in delta.items():
+            room = self.room(name)
+            room._visited, room._cleared = visited, cleared
+            room._examined = dict(examined) if examined else None
+            room._items = list(items) if items else None
+            self._touch(room)
+
+    def to_state(self):
+        """Room progress as a sparse delta over the shared map."""
+        return {
+            'layout': self.layout_id(),
+            'current': self.current_room.name,
+            'delta': self.delta(),
+        }
+
+    def load_state(self, state):
+        """Restore room progress saved by `to_state` (or older bitset saves)."""
+        if state['layout'] != self.layout_id():
+            raise ValueError('Save was made for a different world layout')
+        delta = state.get('delta')
+        if delta is None:
+            delta = legacy_delta(state, self.base)
+        self.apply_delta(delta)
+        self.current_room = self.rooms[state['current']]
+
     def render_minimap(self):
         """Render a minimap of visited areas."""
-        coords = [r.coord for r in self.rooms.values()]
-        xs = [c[0] for c in coords]
-        ys = [c[1] for c in coords]
+        by_coord = self.base.by_coord
+        xs = [c[0] for c in by_coord]
+        ys = [c[1] for c in by_coord]
         minx, maxx = min(xs), max(xs)
         miny, maxy = min(ys), max(ys)
         rows = []
         for y in range(miny, maxy + 1):
             row = ''
             for x in range(minx, maxx + 1):
-                found = None
-                for r in self.rooms.values():
-                    if r.coord == (x, y):
-                        found = r
-                        break
-                if found is None:
+                spec = by_coord.get((x, y))
+                if spec is None:
                     row += '   '
                 else:
-                    if self.current_room is found:
+                    found = self._overlay.get(spec.name)
+                    if self.current_room.spec is spec:
                         row += ' ◉ '  # Current position
-                    elif found.visited:
+                    elif found is not None and found.visited:
                         row += ' · '  # Visited
                     else:
                         row += ' ? '  # Unvisited
             rows.append(row)
         return rows
+
+
+def legacy_delta(state, base):
+    """Delta for a schema-1 world state (bitsets in layout order)."""
+    count = len(base.specs)
+    visited = _unpack_bits(state['visited'], count)
+    cleared = _unpack_bits(state['cleared'], count)
+    delta = {}
+    for spec, v, c in zip(base.specs, visited, cleared):
+        if v == '1' or c == '1':
+            delta[spec.name] = [v == '1', c == '1', None, None]
+    for name, extra in state['rooms'].items():
+        entry = delta.setdefault(name, [False, False, None, None])
+        entry[2] = dict(extra['examined']) or None
+        entry[3] = list(extra['items']) or None
+    return delta
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for the background autosave worker."""
+
+import faulthandler
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+
+from terminal_exit.autosave import AutosaveWorker, install_signal_handlers
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.save_load import SaveError
+
+
+class _Target:
+    """Counts flushes; can be told to fail."""
+
+    def __init__(self, fail=0):
+        self.flushes = 0
+        self.fail = fail
+
+    def flush(self):
+        if self.fail:
+            self.fail -= 1
+            raise SaveError('disk full')
+        self.flushes += 1
+
+
+def test_bursts_coalesce():
+    print("\n🔧 Testing write coalescing...")
+    worker = AutosaveWorker(interval=60)
+    target = _Target()
+    for _ in range(100):
+        worker.mark_dirty(target)
+    assert worker.queue_depth() == 1
+    worker.stop()
+    assert target.flushes == 1
+    m = worker.metrics()
+    assert m['coalesced'] == 99 and m['writes'] == 1 and m['queue_depth'] == 0
+    print(f"   ✓ 100 changes -> 1 write ({m['write_ms_avg']:.3f} ms)")
+
+
+def test_batches_bound_writes_per_pass():
+    print("\n🔧 Testing cross-session batching...")
+    worker = AutosaveWorker(interval=60, max_batch=4)
+    sessions = [_Target() for _ in range(10)]
+    for target in sessions:
+        worker.mark_dirty(target)
+    assert worker._pass() == 4
+    assert worker.queue_depth() == 6
+    worker.stop()
+    assert all(t.flushes == 1 for t in sessions)
+    print("   ✓ At most max_batch writes per pass")
+
+
+def test_failed_flush_is_retried():
+    print("\n🔧 Testing retry after a failed write...")
+    worker = AutosaveWorker(interval=60)
+    target = _Target(fail=1)
+    worker.mark_dirty(target)
+    worker.flush()
+    assert worker.errors == 1 and worker.queue_depth() == 1
+    worker.flush()
+    assert target.flushes == 1 and worker.queue_depth() == 0
+    worker.stop()
+    print("   ✓ Failed session stays queued")
+
+
+def test_engine_writes_off_the_game_thread():
+    print("\n🔧 Testing engine autosave...")
+    with tempfile.TemporaryDirectory() as tmp:
+        worker = AutosaveWorker(interval=0.01)
+        engine = GameEngine(autosave=worker)
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        engine.journal.start(engine)
+
+        writers = set()
+        append = engine.saver.append_journal
+
+        def spy(lines, **kw):
+            writers.add(threading.current_thread().name)
+            return append(lines, **kw)
+
+        engine.saver.append_journal = spy
+        for n in range(50):
+            engine.inventory.add_item(f'Gear {n}')
+        worker.stop()
+        assert writers == {'autosave'}, writers
+        assert len(engine.saver.read_journal()) == 50
+        assert worker.writes < 50
+        print(f"   ✓ 50 changes written in {worker.writes} background writes")
+
+
+def test_signal_mid_record_does_not_deadlock():
+    print("\n🔧 Testing SIGTERM while the journal lock is held...")
+    if not hasattr(signal, 'SIGTERM') or os.name != 'posix':
+        print("   - skipped (no POSIX signals)")
+        return
+    saved = signal.getsignal(signal.SIGTERM)
+    faulthandler.dump_traceback_later(20, exit=True)  # A deadlock fails, not hangs
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            worker = AutosaveWorker(interval=60)
+            install_signal_handlers(worker)
+            engine = GameEngine(autosave=worker)
+            engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+            engine.journal.start(engine)
+            engine.inventory.add_item('Gear A')
+            try:
+                with engine.journal._lock:  # As inside Journal.record
+                    os.kill(os.getpid(), signal.SIGTERM)
+                    time.sleep(5)
+            except SystemExit as e:
+                assert e.code == 128 + signal.SIGTERM
+            else:
+                raise AssertionError("SIGTERM must raise SystemExit")
+            worker.stop()  # What atexit does once the stack has unwound
+            assert len(engine.saver.read_journal()) == 1
+    finally:
+        faulthandler.cancel_dump_traceback_later()
+        signal.signal(signal.SIGTERM, saved)
+    print("   ✓ The handler only exits; the flush runs after the lock is released")
+
+
+if __name__ == '__main__':
+    test_bursts_coalesce()
+    test_batches_bound_writes_per_pass()
+    test_failed_flush_is_retried()
+    test_engine_writes_off_the_game_thread()
+    test_signal_mid_record_does_not_deadlock()
+    print("\n✓ Autosave tests passed")
+    sys.exit(0)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Tests for the scripted combat bots."""
+
+import random
+import sys
+from terminal_exit.bots import POLICIES, run_encounters
+
+
+def test_every_policy_finishes_encounters():
+    print("\n🔧 Testing bot policies...")
+    random.seed(3)
+    for name, cls in POLICIES.items():
+        stats = run_encounters(cls(rng=random.Random(3)), count=100)
+        assert stats.encounters == 100
+        assert sum(stats.outcomes.values()) == 100, stats.outcomes
+        assert None not in stats.outcomes, "Encounter ended without an outcome"
+        print(f"   ✓ {name}: {stats.outcomes}")
+
+
+def test_policies_behave_as_named():
+    print("\n🔧 Testing policy behaviour...")
+    random.seed(5)
+    greedy = run_encounters(POLICIES['greedy'](rng=random.Random(5)), count=200)
+    assert greedy.rate('fled') == 0 and greedy.rate('mercy') == 0
+    mercy = run_encounters(POLICIES['mercy'](rng=random.Random(5)), count=200)
+    assert mercy.rate('mercy') > 0.5, mercy.outcomes
+    print("   ✓ Greedy never flees or spares, mercy bot mostly spares")
+
+
+if __name__ == '__main__':
+    test_every_policy_finishes_encounters()
+    test_policies_behave_as_named()
+    print("\n✓ Bot tests passed")
+    sys.exit(0)
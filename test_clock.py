@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Tests for the injectable pacing clocks."""
+
+import contextlib
+import io
+import sys
+import time
+from unittest import mock
+
+from terminal_exit.clock import Clock, ScaledClock, VirtualClock, make_clock
+from terminal_exit.intro_sequence import IntroSequence
+from terminal_exit.ai_companion import AICompanion
+
+
+def test_clock_modes():
+    print("\n🔧 Testing clock modes...")
+    assert type(make_clock(1)) is Clock
+    assert isinstance(make_clock(10), ScaledClock)
+    assert isinstance(make_clock(0), VirtualClock)
+
+    clock = VirtualClock()
+    clock.sleep(2.5)
+    clock.sleep(-1)
+    assert clock.now() == 2.5 and clock.slept == 2.5
+
+    scaled = ScaledClock(50)
+    start = time.monotonic()
+    scaled.sleep(0.5)
+    assert time.monotonic() - start < 0.1, "Scaled sleep should be 50x shorter"
+    print("   ✓ Real, scaled and virtual clocks behave")
+
+
+def test_intro_runs_instantly_on_virtual_clock():
+    print("\n🔧 Testing intro on a virtual clock...")
+    clock = VirtualClock()
+    intro = IntroSequence(AICompanion(), {}, clock=clock)
+    start = time.monotonic()
+    with mock.patch('builtins.input', return_value=''), \
+            mock.patch('os.system'), \
+            contextlib.redirect_stdout(io.StringIO()):
+        intro.play()
+    elapsed = time.monotonic() - start
+    assert intro.completed
+    assert clock.slept > 30, f"Intro should pace ~minutes, got {clock.slept}"
+    assert elapsed < 1.0, f"Intro took {elapsed:.2f}s of real time"
+    print(f"   ✓ Skipped {clock.slept:.0f}s of pauses in {elapsed:.3f}s")
+
+
+if __name__ == '__main__':
+    test_clock_modes()
+    test_intro_runs_instantly_on_virtual_clock()
+    print("\n✓ Clock tests passed")
+    sys.exit(0)
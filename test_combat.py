@@ -2,7 +2,7 @@
 """Quick test of the improved combat system."""
 
 import sys
-from terminal_exit.combat_system import CombatSystem, ENEMIES
+from terminal_exit.combat_system import CombatSystem, ENEMIES, StrikeBar
 from terminal_exit.ai_companion import AICompanion
 from terminal_exit.inventory import Inventory
 
@@ -73,6 +73,21 @@ print("  ✓ Success rate scales with AI bond")
 print("  ✓ Increases bond on success")
 print()
 
+# Test 7: Compiled strike bar
+print("\nTEST 7: Compiled Strike Bar")
+print("-" * 70)
+bar = StrikeBar.build(30, 12, 2, [(2, 5), (11, 8)])
+assert len(bar.lookup) == 30 and len(bar.frames) == 30
+assert bar.result_at(12) == 'base' and bar.result_at(14) == 'base'
+assert bar.result_at(11) == 'bonus' and bar.result_at(19) == 'bonus'
+assert bar.result_at(2) == 'bonus' and bar.result_at(0) is None
+assert bar.template[12:15] == '==='
+assert bar.frames[0] == '\r[▸' + bar.template[1:] + ']'
+print(f"  Template: [{bar.template}]")
+print("  ✓ Position → zone lookup matches the drawn bar")
+print("  ✓ Base zone wins where zones overlap")
+print()
+
 print("="*70)
 print("  ✓ ALL SYSTEMS VALIDATED")
 print("="*70)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Tests for the shared, read-only content tables."""
+
+import sys
+
+from bench_memory import per_session_bytes
+from terminal_exit.ascii_art import FACES, LOCATION_ART
+from terminal_exit.combat_system import ENEMIES, ENEMY_DROPS
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.inventory import Item
+from terminal_exit.upgrades import UPGRADES
+
+
+def _refuses(change):
+    try:
+        change()
+    except (TypeError, AttributeError):
+        return True
+    return False
+
+
+def test_content_is_read_only():
+    print("\n🔧 Testing content tables are read-only...")
+    assert _refuses(lambda: ENEMIES.__setitem__('boss', None))
+    assert _refuses(lambda: setattr(ENEMIES['glitch'], 'max_hp', 1))
+    assert _refuses(lambda: ENEMIES['glitch'].attacks.append('bites'))
+    assert _refuses(lambda: ENEMY_DROPS['echo'].__setitem__('ability', 'x'))
+    assert _refuses(lambda: setattr(UPGRADES['scanner'], 'ability', 'x'))
+    assert _refuses(lambda: FACES['happy'].append('!'))
+    assert _refuses(lambda: LOCATION_ART.pop('Junction'))
+    engine = GameEngine()
+    assert _refuses(lambda: setattr(engine.world.current_room, 'name', 'Elsewhere'))
+    assert _refuses(lambda: engine.world.current_room.neighbors.clear())
+    print("   ✓ Tables, records and room layouts refuse writes")
+
+
+def test_sessions_share_content():
+    print("\n🔧 Testing sessions share content...")
+    a, b = GameEngine(), GameEngine()
+    for name, room in a.world.rooms.items():
+        other = b.world.rooms[name]
+        assert room is not other and room.spec is other.spec
+    a.world.move('down')
+    assert a.world.current_room.visited and not b.world.rooms['Void Corridor'].visited
+    assert Item('Health Potion').name is Item('Health' + ' Potion').name
+    print("   ✓ Rooms share layout specs; progress stays per session")
+
+
+def test_per_session_memory():
+    print("\n🔧 Testing per-session memory...")
+    per_session, _ = per_session_bytes(100)
+    assert per_session < 6 * 1024, f"{per_session:.0f} B per session"
+    print(f"   ✓ {per_session / 1024:.1f} KB per session")
+
+
+if __name__ == '__main__':
+    test_content_is_read_only()
+    test_sessions_share_content()
+    test_per_session_memory()
+    print("\n✓ Content tests passed")
+    sys.exit(0)
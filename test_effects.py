@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the compiled upgrade-effect modifier table."""
+
+import sys
+from terminal_exit.ai_companion import AICompanion
+from terminal_exit.effects import compile_modifiers, ability_for, EFFECTS
+from terminal_exit.upgrades import UPGRADES
+from terminal_exit.combat_system import ENEMY_DROPS
+
+
+def test_every_upgrade_has_an_effect():
+    """Every upgrade that touches combat resolves to an effect entry."""
+    print("\n🔧 Testing upgrade → effect mapping...")
+    for upgrade in UPGRADES.values():
+        assert ability_for(upgrade.name) == upgrade.ability
+    for drop in ENEMY_DROPS.values():
+        assert drop['ability'] in EFFECTS, f"No effect for {drop['ability']}"
+    print("   ✓ All drops and upgrades resolve to abilities")
+
+
+def test_base_table_matches_old_numbers():
+    """With no upgrades the table reproduces the original combat numbers."""
+    print("\n🔧 Testing base modifier table...")
+    mods = compile_modifiers([], 0.5)
+    assert mods.bonus_zones == ()
+    assert mods.mitigation == 2, "Bond 50% should mitigate 2 damage"
+    assert abs(mods.mercy_chance - 0.55) < 1e-9
+    assert mods.flee_chance == 0.3
+    print("   ✓ Mitigation, mercy and flee odds unchanged without upgrades")
+
+
+def test_install_recompiles_once():
+    """Installing upgrades and changing bond refreshes the table."""
+    print("\n🔧 Testing upgrade installation...")
+    ai = AICompanion()
+    before = ai.modifiers
+    ai.install_upgrade('Shield Subroutine')
+    ai.install_upgrade('Pattern Recognition')
+    mods = ai.modifiers
+    assert mods is not before
+    assert mods.mitigation == 2 + int(ai.bond * 4)
+    assert (8, 8) in mods.bonus_zones
+    # Same inputs share one compiled table
+    assert compile_modifiers(ai.upgrades, ai.bond) is mods
+    assert compile_modifiers(ai.upgrades[::-1], ai.bond + 1e-12) is mods
+    ai.bond = 1.0
+    assert ai.modifiers.mitigation == 6
+    print("   ✓ Modifier table compiled on install and bond change")
+
+
+def test_cache_reuses_and_evicts():
+    """Equal inputs share one table; the cache drops old tables past maxsize."""
+    print("\n🔧 Testing the modifier cache...")
+    from terminal_exit.effects import _compile
+    names = ['Shield Subroutine', 'Pattern Recognition']
+    first = compile_modifiers(names, 0.3)
+    assert compile_modifiers(names[::-1], 0.3 + 1e-9) is first
+    limit = _compile.cache_info().maxsize
+    for i in range(limit):
+        compile_modifiers(names, 0.5 + i)
+    assert _compile.cache_info().currsize == limit
+    again = compile_modifiers(names, 0.3)
+    assert again is not first and again.mitigation == first.mitigation
+    print(f"   ✓ Reordered names share a table; the oldest of {limit + 1} is evicted")
+
+
+def test_tables_are_read_only():
+    """A shared table can't be changed by one session under another."""
+    print("\n🔧 Testing shared tables are immutable...")
+    mods = compile_modifiers(['Shield Subroutine'], 0.0)
+    for change in (lambda: setattr(mods, 'mitigation', 99),
+                   lambda: delattr(mods, 'advisor'),
+                   lambda: setattr(mods, 'extra', 1)):
+        try:
+            change()
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("Compiled modifier tables must be read-only")
+    stronger = mods.with_effect(EFFECTS['shield'])
+    assert stronger.mitigation == 4 and mods.mitigation == 2
+    assert compile_modifiers(['Shield Subroutine'], 0.0) is mods
+    print("   ✓ Writes raise; with_effect returns a new table")
+
+
+if __name__ == '__main__':
+    test_every_upgrade_has_an_effect()
+    test_base_table_matches_old_numbers()
+    test_install_recompiles_once()
+    test_cache_reuses_and_evicts()
+    test_tables_are_read_only()
+    print("\n✓ Effect system tests passed")
+    sys.exit(0)
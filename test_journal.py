@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for journaled incremental saves."""
+
+import os
+import sys
+import tempfile
+
+from terminal_exit.game_engine import GameEngine
+from test_saves import _assert_same
+
+
+def _engine_in(tmp):
+    engine = GameEngine()
+    engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+    return engine
+
+
+def _play(engine):
+    engine.world.move('up')
+    engine.world.clear_encounter(engine.world.current_room)
+    engine.inventory.add_item('Health Potion')
+    engine.inventory.add_item('Shield Subroutine', item_type='upgrade')
+    engine.inventory.remove(engine.inventory.items[0])
+    engine.ai.install_upgrade('Shield Subroutine')
+    engine.ai.speak('happy', 'We made it.')
+    engine._set_player('intro_seen', True)
+
+
+def test_replay_matches_live_state():
+    print("\n🔧 Testing journal replay...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine_in(tmp)
+        engine.journal.start(engine)
+        snapshot_size = os.path.getsize(engine.saver.path())
+        _play(engine)
+        engine.journal.flush()
+        # Nothing but the journal was written while playing
+        assert os.path.getsize(engine.saver.path()) == snapshot_size
+        lines = engine.saver.read_journal()
+        assert len(lines) == engine.journal.seq
+        per_entry = os.path.getsize(engine.saver.journal_path()) / len(lines)
+        assert per_entry < 100, per_entry
+
+        fresh = _engine_in(tmp)
+        assert fresh.load_game()
+        _assert_same(engine, fresh)
+        print(f"   ✓ {len(lines)} entries, ~{per_entry:.0f} bytes each, replay matches")
+
+
+def test_compaction_truncates_journal():
+    print("\n🔧 Testing snapshot compaction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine_in(tmp)
+        engine.journal.compact_every = 5
+        engine.journal.start(engine)
+        for n in range(12):
+            engine.inventory.add_item(f'Gear {n}')
+        engine.journal.flush()
+        assert len(engine.saver.read_journal()) == 2
+        assert engine.saver.load()['journal_seq'] == 10
+
+        fresh = _engine_in(tmp)
+        fresh.load_game()
+        assert [i.name for i in fresh.inventory.items] == [f'Gear {n}' for n in range(12)]
+
+        # Continuing after a load keeps numbering past the snapshot
+        fresh.inventory.add_item('Gear 12')
+        fresh.journal.flush()
+        again = _engine_in(tmp)
+        again.load_game()
+        assert len(again.inventory.items) == 13
+    print("   ✓ Journal resets after each snapshot")
+
+
+def test_stale_and_torn_entries_are_skipped():
+    print("\n🔧 Testing crash recovery...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine_in(tmp)
+        engine.journal.start(engine)
+        engine.inventory.add_item('Health Potion')
+        engine.journal.flush()
+        # Snapshot written but journal not yet reset (crash in between)
+        lines = engine.saver.read_journal()
+        engine.journal.compact()
+        engine.saver.append_journal(lines)
+        # Half-written entry at the end
+        with open(engine.saver.journal_path(), 'a') as f:
+            f.write('[2,"item_added",{"ite')
+
+        fresh = _engine_in(tmp)
+        assert fresh.load_game()
+        assert [i.name for i in fresh.inventory.items] == ['Health Potion']
+    print("   ✓ Covered and torn entries are ignored")
+
+
+def test_damaged_entry_stops_replay():
+    print("\n🔧 Testing journal checksums...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine_in(tmp)
+        engine.journal.start(engine)
+        for name in ('Gear A', 'Gear B', 'Gear C'):
+            engine.inventory.add_item(name)
+        engine.journal.flush()
+        path = engine.saver.journal_path()
+        with open(path) as f:
+            lines = f.read().splitlines()
+        lines[1] = lines[1].replace('Gear B', 'Gear X')
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        fresh = _engine_in(tmp)
+        assert fresh.load_game()
+        assert [i.name for i in fresh.inventory.items] == ['Gear A']
+        assert 'entry 2' in fresh.journal.recovered
+        # The repaired state was re-snapshotted and the journal cleared
+        assert fresh.saver.read_journal() == []
+    print("   ✓ Replay stops at the damaged entry")
+
+
+def test_undecodable_entry_is_skipped():
+    print("\n🔧 Testing a journal entry with a bad byte...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine_in(tmp)
+        engine.journal.start(engine)
+        for name in ('Gear A', 'Gear B', 'Gear C'):
+            engine.inventory.add_item(name)
+        engine.journal.flush()
+        path = engine.saver.journal_path()
+        with open(path, 'rb') as f:
+            data = bytearray(f.read())
+        data[data.index(b'Gear B') + 1] = 0xff  # Not valid UTF-8
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        fresh = _engine_in(tmp)
+        assert fresh.load_game()
+        assert [i.name for i in fresh.inventory.items] == ['Gear A']
+        assert 'entry 2' in fresh.journal.recovered
+    print("   ✓ The bad entry fails its checksum; the load recovers")
+
+
+if __name__ == '__main__':
+    test_replay_matches_live_state()
+    test_compaction_truncates_journal()
+    test_stale_and_torn_entries_are_skipped()
+    test_damaged_entry_stops_replay()
+    test_undecodable_entry_is_skipped()
+    print("\n✓ Journal tests passed")
+    sys.exit(0)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for the bulk save migration tool."""
+
+import json
+import os
+import sys
+import tempfile
+
+from terminal_exit import serialization
+from terminal_exit.compression import CODECS
+from terminal_exit.migrate_saves import (_file_saver, discover_files, discover_sqlite,
+                                         estimate, main, run, PROGRESS_FILE)
+from terminal_exit.save_load import SaveLoad
+from terminal_exit.sqlite_store import SqliteStore
+
+LEGACY = {'intro_seen': True, 'tutorial_completed': False,
+          'location': 'awakening_point'}
+
+
+def _corpus(tmp):
+    for n in range(6):
+        with open(os.path.join(tmp, f'legacy_{n}.json'), 'w') as f:
+            json.dump(dict(LEGACY, n=n), f)
+    SaveLoad('binary', directory=tmp, compression='zlib').save(
+        {'version': serialization.SCHEMA_VERSION, 'player': {'n': 'current'}})
+    with open(os.path.join(tmp, 'broken.json'), 'wb') as f:
+        f.write(b'{"intro_seen": tr')
+
+
+def test_directory_migration_is_verified_and_resumable():
+    print("\n🔧 Testing directory migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        _corpus(tmp)
+        tasks = discover_files(tmp)
+        assert len(tasks) == 8
+        progress = os.path.join(tmp, PROGRESS_FILE)
+
+        report = run(tasks, workers=2, progress_path=progress)
+        assert report.counts['migrated'] == 6, report.lines()
+        assert report.counts['current'] == 1 and report.counts['failed'] == 1
+        assert 'broken.json' in report.failures[0][0]
+        for line in report.lines():
+            print(f"   {line}")
+
+        saver = SaveLoad()
+        saver.SAVE_FILE = os.path.join(tmp, 'legacy_3.json')
+        assert saver.load()['version'] == serialization.SCHEMA_VERSION
+        assert saver.load()['player']['n'] == 3
+        assert saver.read_header()['location'] == 'Awakening Point'
+        assert saver.load_file(saver.backup_path(1)) == dict(LEGACY, n=3)
+
+        # A second run only retries the failure
+        again = run(discover_files(tmp), workers=2, progress_path=progress)
+        assert again.counts['skipped'] == 7 and again.counts['failed'] == 1
+
+        # A save replaced since the last run is picked up again
+        with open(saver.SAVE_FILE, 'w') as f:
+            json.dump(LEGACY, f)
+        third = run(discover_files(tmp), workers=2, progress_path=progress)
+        assert third.counts['migrated'] == 1
+    print("   ✓ Migrated, verified, resumed")
+
+
+def test_rewrites_keep_the_codec():
+    print("\n🔧 Testing codec detection for rewrites...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in CODECS:
+            SaveLoad(directory=tmp, compression=name).save(dict(LEGACY, n=name))
+            saver, _ = _file_saver(SaveLoad(directory=tmp).path())
+            assert saver.compression == name, (name, saver.compression)
+    print(f"   ✓ {', '.join(CODECS)} rewritten as written")
+
+
+def test_sqlite_store_and_dry_run():
+    print("\n🔧 Testing SQLite migration and dry run...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, 'saves.db')
+        store = SqliteStore(db)
+        for n in range(5):
+            store.saver(f'p{n}').save(dict(LEGACY, n=n))
+        store.close()
+        tasks = discover_sqlite(db)
+        assert len(tasks) == 5
+
+        est = estimate(tasks, workers=2, sample=3)
+        assert est['sampled'] == 3 and est['need_migration'] == 3
+        assert est['estimated_seconds'] >= 0
+        assert SqliteStore(db).saver('p0').load().get('version') is None  # Untouched
+
+        assert main(['--sqlite', db, '--workers', '2']) == 0
+        store = SqliteStore(db)
+        assert store.saver('p4').load()['player']['n'] == 4
+        assert store.saver('p4').load()['version'] == serialization.SCHEMA_VERSION
+        store.close()
+    print("   ✓ Store migrated; dry run wrote nothing")
+
+
+if __name__ == '__main__':
+    test_directory_migration_is_verified_and_resumable()
+    test_rewrites_keep_the_codec()
+    test_sqlite_store_and_dry_run()
+    print("\n✓ Migration tests passed")
+    sys.exit(0)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Tests for full game-state saving and loading."""
+
+import os
+import sys
+import tempfile
+import threading
+from unittest import mock
+
+from terminal_exit.game_engine import GameEngine
+from terminal_exit import serialization
+from terminal_exit.save_load import SaveLoad, SaveError
+from terminal_exit.terminal_io import MemoryPort
+
+
+def _played_engine():
+    engine = GameEngine()
+    engine.world.move('up')
+    engine.world.current_room.encounter_cleared = True
+    engine.world.current_room.items.append('Data Shard')
+    engine.inventory.add_item('Health Potion')
+    engine.inventory.add_item('Fragment of Corrupted Code', key=True)
+    engine.ai.install_upgrade('Shield Subroutine')
+    engine.ai.dialogue_history.append('We made it.')
+    engine.ai.set_mood('thinking')
+    engine.player_state['intro_seen'] = True
+    return engine
+
+
+def _assert_same(a, b):
+    assert a.world.current_room.name == b.world.current_room.name
+    for name, room in a.world.rooms.items():
+        other = b.world.rooms[name]
+        assert room.visited == other.visited, name
+        assert room.encounter_cleared == other.encounter_cleared, name
+        assert room.items == other.items, name
+    assert [i.name for i in a.inventory.items] == [i.name for i in b.inventory.items]
+    assert [i.key for i in a.inventory.items] == [i.key for i in b.inventory.items]
+    assert a.ai.upgrades == b.ai.upgrades
+    assert a.ai.bond == b.ai.bond and a.ai.mood == b.ai.mood
+    assert a.ai.dialogue_history == b.ai.dialogue_history
+    assert a.ai.modifiers.mitigation == b.ai.modifiers.mitigation
+    assert a.player_state == b.player_state
+
+
+def test_round_trip_both_formats():
+    print("\n🔧 Testing save round trips...")
+    engine = _played_engine()
+    state = serialization.capture(engine)
+    for fmt in ('json', 'binary'):
+        data = serialization.encode(state, fmt)
+        restored = serialization.restore(GameEngine(), serialization.decode(data))
+        _assert_same(engine, restored)
+        print(f"   ✓ {fmt}: {len(data)} bytes")
+    assert len(serialization.encode(state, 'binary')) < len(serialization.encode(state, 'json'))
+
+
+def test_engine_save_and_load_game():
+    print("\n🔧 Testing GameEngine save/load...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _played_engine()
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        assert engine.save_game()
+        fresh = GameEngine()
+        fresh.saver.SAVE_FILE = engine.saver.SAVE_FILE
+        assert fresh.load_game()
+        _assert_same(engine, fresh)
+    print("   ✓ Load Game restores the saved session")
+
+
+def test_new_game_asks_before_overwriting():
+    print("\n🔧 Testing New Game over an existing save...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _played_engine()
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        engine.save_game()
+        before = engine.saver.load()
+
+        port = MemoryPort(['1', 'n', '3'])
+        fresh = GameEngine(io=port)
+        fresh.saver.SAVE_FILE = engine.saver.SAVE_FILE
+        fresh.run()
+        assert 'overwrite your saved game' in port.text()
+        assert fresh.saver.load() == before and not os.path.exists(fresh.saver.backup_path(1))
+
+        # Without a save there is nothing to ask
+        os.unlink(engine.saver.SAVE_FILE)
+        port = MemoryPort(['1'])
+        fresh = GameEngine(io=port)
+        fresh.saver.SAVE_FILE = engine.saver.SAVE_FILE
+        fresh.run()
+        assert 'overwrite' not in port.text() and fresh.saver.list_slots() == [0]
+    print("   ✓ Declining keeps the save; a first game starts straight away")
+
+
+def test_migrations():
+    print("\n🔧 Testing schema migrations...")
+    legacy = {'intro_seen': True, 'tutorial_completed': False,
+              'location': 'awakening_point'}
+    engine = serialization.restore(GameEngine(), legacy)
+    assert engine.player_state['intro_seen'] is True
+    assert engine.world.current_room.name == 'Awakening Point'
+
+    try:
+        serialization.migrate({'version': serialization.SCHEMA_VERSION + 1})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Newer saves must be rejected")
+    print("   ✓ Unversioned prototype saves migrate forward")
+
+
+def test_atomic_save_with_rotating_backups():
+    print("\n🔧 Testing atomic saves and backups...")
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SaveLoad(directory=tmp, backups=2)
+        for n in range(4):
+            saver.save({'version': 1, 'player': {'n': n}})
+        assert saver.load()['player'] == {'n': 3}
+        assert saver.load_file(saver.backup_path(1))['player'] == {'n': 2}
+        assert saver.load_file(saver.backup_path(2))['player'] == {'n': 1}
+        assert not os.path.exists(saver.backup_path(3))
+
+        # A crash before the final rename leaves the old save untouched
+        with mock.patch('os.replace', side_effect=OSError('disk vanished')):
+            try:
+                saver.save({'version': 1, 'player': {'n': 99}})
+            except SaveError:
+                pass
+            else:
+                raise AssertionError("Failed save must raise SaveError")
+        assert saver.load()['player'] == {'n': 3}
+        assert not [f for f in os.listdir(tmp) if f.endswith('.tmp')]
+    print("   ✓ Old save survives a failed write, backups rotate")
+
+
+def test_slots_save_concurrently():
+    print("\n🔧 Testing save slots...")
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SaveLoad(directory=tmp)
+        errors = []
+
+        def worker(slot):
+            try:
+                for n in range(10):
+                    saver.save({'version': 1, 'player': {'slot': slot, 'n': n}}, slot=slot)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(s,)) for s in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+        assert saver.list_slots() == list(range(8))
+        assert saver.load(slot=5)['player'] == {'slot': 5, 'n': 9}
+        saver.delete(slot=5)
+        assert saver.load(slot=5) is None
+    print("   ✓ Eight slots saved in parallel")
+
+
+def test_unreadable_save_is_not_missing():
+    print("\n🔧 Testing corrupt vs missing saves...")
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SaveLoad(directory=tmp)
+        assert saver.load() is None
+        with open(saver.path(), 'wb') as f:
+            f.write(b'{"version": 1, "pla')
+        try:
+            saver.load()
+        except SaveError:
+            pass
+        else:
+            raise AssertionError("Corrupt save must raise SaveError")
+    print("   ✓ Corrupt saves fail loudly")
+
+
+def test_slot_headers_without_full_load():
+    print("\n🔧 Testing slot headers...")
+    from terminal_exit.save_load import HEADER_SIZE, describe_header
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SaveLoad(directory=tmp)
+        engine = _played_engine()
+        engine.ai.dialogue_history = ['x' * 100] * 2000  # Big save body
+        saver.save(serialization.capture(engine), slot=2, name='Speedrun')
+        saver.save(serialization.capture(engine), slot=2)  # Name is kept
+        saver.save({'version': 1, 'player': {}})
+        assert os.path.getsize(saver.path(2)) > 100 * HEADER_SIZE
+
+        with mock.patch('terminal_exit.save_load.decode') as decode:
+            headers = dict(saver.list_headers())
+        decode.assert_not_called()
+        assert headers[2]['name'] == 'Speedrun'
+        assert headers[2]['location'] == engine.world.current_room.name
+        assert headers[2]['upgrades'] == 1 and headers[2]['bond'] == 0.05
+        assert headers[0]['name'] == 'Slot 0'
+        assert saver.load(slot=2)['ai']['upgrades'] == ['Shield Subroutine']
+        print(f"   ✓ {describe_header(headers[2])}")
+
+        # Long names are trimmed so the header stays fixed-size
+        saver.save({'version': 1, 'player': {}}, slot=3, name='N' * 500)
+        assert saver.read_header(3)['name'] == 'N' * 32
+        saver.save({'version': 1, 'player': {}}, slot=4, name='\x1b' * 40)
+        name = saver.read_header(4)['name']
+        assert name and set(name) == {'\x1b'} and saver.load(slot=4)['player'] == {}
+        assert 4 in dict(saver.list_headers())
+
+
+def test_compressed_saves_autodetect():
+    print("\n🔧 Testing save compression...")
+    from terminal_exit.compression import CODECS, detect
+    state = serialization.capture(_played_engine())
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = SaveLoad(directory=tmp)
+        for name in CODECS:
+            for fmt in ('json', 'binary'):
+                saver = SaveLoad(fmt, directory=tmp, compression=name)
+                saver.save(state, slot=1)
+                # Any saver loads any codec
+                assert plain.load(slot=1) == saver.load(slot=1)
+                assert plain.read_header(1)['bond'] == 0.05
+            print(f"   ✓ {name}: {os.path.getsize(saver.path(1))} bytes")
+        assert detect(serialization.encode(state, 'json')) == 'none'
+        assert detect(serialization.encode(state, 'binary')) == 'none'
+        try:
+            SaveLoad(compression='zip')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Unknown codecs must be rejected")
+
+
+def test_corrupt_block_falls_back_to_backup():
+    print("\n🔧 Testing checksums and backup fallback...")
+    from terminal_exit.integrity import BLOCK_SIZE
+    from terminal_exit.save_load import HEADER_SIZE, verify_directory
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SaveLoad(directory=tmp)
+        big = {'version': 1, 'player': {'blob': 'x' * (3 * BLOCK_SIZE)}}
+        saver.save(dict(big, player={'gen': 'old'}))
+        saver.save(big)
+        assert verify_directory(tmp) == [(saver.path(), None), (saver.backup_path(1), None)]
+
+        # Flip one byte inside the third block of the current save
+        with open(saver.path(), 'r+b') as f:
+            f.seek(HEADER_SIZE + 8 + 2 * (BLOCK_SIZE + 8) + 100)
+            f.write(b'y')
+        problems = dict(verify_directory(tmp))
+        assert 'block 2 checksum mismatch' in problems[saver.path()]
+        assert problems[saver.backup_path(1)] is None
+
+        assert saver.load()['player'] == {'gen': 'old'}
+        assert 'block 2' in saver.recovered and 'backup 1' in saver.recovered
+        print(f"   ✓ {saver.recovered.split(': ', 1)[1]}")
+
+        # With no good backup the damage is reported, not hidden
+        os.unlink(saver.backup_path(1))
+        try:
+            saver.load()
+        except SaveError as e:
+            assert 'block 2' in str(e)
+        else:
+            raise AssertionError("Corrupt save without backups must raise")
+
+
+if __name__ == '__main__':
+    test_round_trip_both_formats()
+    test_engine_save_and_load_game()
+    test_new_game_asks_before_overwriting()
+    test_migrations()
+    test_atomic_save_with_rotating_backups()
+    test_slots_save_concurrently()
+    test_unreadable_save_is_not_missing()
+    test_slot_headers_without_full_load()
+    test_compressed_saves_autodetect()
+    test_corrupt_block_falls_back_to_backup()
+    print("\n✓ Save tests passed")
+    sys.exit(0)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""Tests for the telnet host (over loopback)."""
+
+import asyncio
+import gc
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+from terminal_exit.game_engine import HIBERNATE_SLOT, GameEngine
+from terminal_exit.save_load import SaveLoad
+from terminal_exit.server import Broadcast, GameServer, Scheduler, Session
+from terminal_exit.terminal_io import NullPort
+from terminal_exit.telnet import (COMPRESS2, DO, DONT, IAC, NAWS, SB, SE, TIMING_MARK,
+                                  WILL, Decompressor, TelnetParser, command,
+                                  subnegotiation)
+
+
+async def _read_until(reader, marker, timeout=5.0):
+    return await asyncio.wait_for(reader.readuntil(marker), timeout)
+
+
+async def _login(server, name, naws=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+    assert await reader.readexactly(3) == command(DO, NAWS)
+    if naws:
+        writer.write(command(WILL, NAWS) + subnegotiation(NAWS, naws))
+    writer.write(name.encode() + b'\r\n')
+    await _read_until(reader, b'Main Menu')
+    await _read_until(reader, b'> ')
+    return reader, writer
+
+
+def test_parser_separates_commands():
+    print("\n🔧 Testing the telnet parser...")
+    parser = TelnetParser()
+    data, events = parser.feed(b'lo' + bytes((IAC, WILL)))
+    assert data == b'lo' and events == []
+    data, events = parser.feed(bytes((NAWS, IAC, SB, NAWS, 0, 100, 0, 30, IAC, SE)) + b'ok\xff\xff\r\n')
+    assert data == b'ok\xff\r\n'
+    assert events == [('will', NAWS), ('sb', NAWS, b'\x00\x64\x00\x1e')]
+    print("   ✓ Split commands, NAWS and escaped IAC handled")
+
+
+def test_sessions_over_loopback():
+    print("\n🔧 Testing telnet sessions over loopback...")
+
+    async def scenario(tmp):
+        server = await GameServer(port=0, saves_dir=tmp, speed=0).start()
+        try:
+            reader, writer = await _login(server, 'alice', naws=b'\x00\x78\x00\x28')
+            session = next(iter(server.sessions.values()))
+            assert (session.port.width, session.port.height) == (120, 40)
+
+            # A second player at the same time, and a duplicate profile
+            other, other_w = await _login(server, 'bob')
+            dup_r, dup_w = await asyncio.open_connection('127.0.0.1', server.port)
+            dup_w.write(b'alice\r\n')
+            await _read_until(dup_r, b'already playing')
+            dup_w.close()
+            assert server.stats()['sessions'] >= 2
+
+            writer.write(b'3\r\n')
+            rest = await asyncio.wait_for(reader.read(), 5)
+            assert b'Goodbye' in rest
+            other_w.close()
+            for _ in range(100):
+                if not server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            assert not server.sessions, server.stats()
+            assert server.errors == 0
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("   ✓ NAWS applied, concurrent players, clean hang-ups")
+
+
+def test_idle_sessions_hibernate_and_resume():
+    print("\n🔧 Testing idle session hibernation...")
+
+    async def wait_for(condition):
+        for _ in range(300):
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError('timed out')
+
+    def engines_on(port):
+        gc.collect()
+        return [o for o in gc.get_objects() if isinstance(o, GameEngine) and o.io is port]
+
+    async def scenario(tmp):
+        saver = SaveLoad(directory=os.path.join(tmp, 'dana'))
+        os.makedirs(os.path.join(tmp, 'dana'))
+        engine = GameEngine(saver=saver, io=NullPort())
+        engine.world.current_room = engine.world.rooms['Void Corridor']
+        engine.journal.start(engine)  # Saved right at an encounter
+
+        server = await GameServer(port=0, saves_dir=tmp, speed=0, idle_timeout=0.1).start()
+        try:
+            reader, writer = await _login(server, 'dana')
+            writer.write(b'2\r\n\r\n\r\n\r\n')  # Load, continue, into the fight
+            await _read_until(reader, b'TURN OPTIONS')
+            await wait_for(lambda: server.stats()['asleep'] == 1)
+            session = next(iter(server.sessions.values()))
+            assert session.thread is None and not engines_on(session.port)
+            assert saver.load(HIBERNATE_SLOT)['point'] == 'combat'
+
+            # Dropping the connection keeps the fight for the next login
+            writer.close()
+            await wait_for(lambda: not server.sessions)
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'dana\r\n')
+            await _read_until(reader, b'Glitched Sentinel')
+            await _read_until(reader, b'TURN OPTIONS')
+            assert saver.load(HIBERNATE_SLOT) is None
+
+            # Asleep again; the next command wakes it in place
+            await wait_for(lambda: server.stats()['asleep'] == 1)
+            writer.write(b'4\r\n')
+            await _read_until(reader, b'too strong')
+            stats = server.stats()
+            assert stats['asleep'] == 0 and stats['wakeups'] == 1, stats
+            assert stats['hibernations'] == 2 and server.errors == 0, stats
+            writer.close()
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("   ✓ Idle fights saved and freed; resumed on input and on reconnect")
+
+
+def test_scheduler_serves_in_arrival_order():
+    print("\n🔧 Testing the turn scheduler...")
+    scheduler, order = Scheduler(1), []
+    scheduler.acquire()
+
+    def session(name):
+        scheduler.acquire()
+        order.append(name)
+        scheduler.release()
+
+    threads = []
+    for name in 'abc':
+        threads.append(threading.Thread(target=session, args=(name,)))
+        threads[-1].start()
+        while scheduler.waiting() < len(threads):
+            time.sleep(0.001)
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+    assert order == ['a', 'b', 'c'] and scheduler.running == 0, order
+    print("   ✓ One turn at a time, longest waiter first")
+
+
+def test_spammers_and_slow_readers_are_contained():
+    print("\n🔧 Testing command caps and slow-consumer limits...")
+
+    async def scenario(tmp):
+        server = await GameServer(port=0, saves_dir=tmp, speed=0, max_queued=4,
+                                  output_limit=16 * 1024, slow_timeout=0.3).start()
+        try:
+            spam_r, spam_w = await _login(server, 'spam')
+            calm_r, calm_w = await _login(server, 'calm')
+            spam_w.write(b'9\r\n' * 500)  # Invalid choices redraw the menu
+            calm_w.write(b'9\r\n')
+            start = time.monotonic()
+            await _read_until(calm_r, b'Main Menu')
+            assert time.monotonic() - start < 2.0
+            spam = next(s for s in server.sessions.values() if s.profile == 'spam')
+            for _ in range(300):
+                if spam.port.queue_depth() == 0 and spam.port.waiting:
+                    break
+                await asyncio.sleep(0.01)
+            stats = server.stats()
+            assert stats['commands_dropped'] > 400 and stats['max_queued'] <= 4, stats
+            assert [row['profile'] for row in server.session_stats()][0] == 'spam'
+
+            # A client that never reads: blocked, then dropped
+            sock = socket.socket()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.connect(('127.0.0.1', server.port))
+            sock.sendall(b'slow\r\n')
+            while len(server.sessions) < 3:
+                await asyncio.sleep(0.01)
+            slow = next(s for s in server.sessions.values() if s.id == max(server.sessions))
+            slow.transport.get_extra_info('socket').setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)  # Fill up sooner
+            for _ in range(1000):
+                if server.slow_disconnects:
+                    break
+                sock.sendall(b'9\r\n' * 4)
+                await asyncio.sleep(0.01)
+            sock.close()
+            assert server.slow_disconnects == 1, server.stats()
+            assert server.errors == 0
+            calm_w.write(b'9\r\n')
+            await _read_until(calm_r, b'Main Menu')
+            for writer in (spam_w, calm_w):
+                writer.close()
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("   ✓ Excess commands dropped; a stuck reader is disconnected")
+
+
+def test_mccp2_compresses_the_stream():
+    print("\n🔧 Testing MCCP2 output compression...")
+
+    async def scenario(tmp):
+        server = await GameServer(port=0, saves_dir=tmp, speed=0).start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        inflate, text, wire = Decompressor(), b'', 0
+
+        async def until(marker, start):
+            nonlocal text, wire
+            while text.find(marker, start) < 0:
+                chunk = await asyncio.wait_for(reader.read(65536), 5)
+                assert chunk, 'connection closed'
+                wire += len(chunk)
+                text += inflate.feed(chunk)
+            return text.find(marker, start) + len(marker)
+
+        try:
+            at = await until(command(WILL, COMPRESS2), 0)
+            writer.write(command(DO, COMPRESS2) + b'zip\r\n')
+            at = await until(b'> ', await until(b'Main Menu', at))
+            first_wire, first_text = wire, len(text)
+            for _ in range(10):
+                writer.write(b'9\r\n')  # The same menu again
+                at = await until(b'> ', await until(b'Main Menu', at))
+            assert server.stats()['compressed'] == 1
+            redraws, raw = wire - first_wire, len(text) - first_text
+            assert redraws * 10 < raw, (redraws, raw)
+
+            writer.write(command(DONT, COMPRESS2) + b'9\r\n')
+            plain = len(text)
+            await until(b'Main Menu', plain)
+            assert inflate._z is None and server.stats()['compressed'] == 0
+            writer.write(b'3\r\n')
+            await until(b'Goodbye', plain)
+        finally:
+            writer.close()
+            await server.close()
+        return redraws, raw
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wire, raw = asyncio.run(scenario(tmp))
+    print(f"   ✓ 10 menu redraws: {raw} B of screen in {wire} B on the wire; "
+          f"DONT returns to plain text")
+
+
+def test_round_trip_is_measured():
+    print("\n🔧 Testing round-trip measurement...")
+
+    async def scenario(tmp):
+        server = await GameServer(port=0, saves_dir=tmp, speed=0, compression=0).start()
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'tim\r\n')
+            await _read_until(reader, command(DO, TIMING_MARK))
+            await asyncio.sleep(0.1)  # A slow link
+            writer.write(command(WILL, TIMING_MARK))
+            await _read_until(reader, b'> ')
+            session = next(iter(server.sessions.values()))
+            for _ in range(100):
+                if session.port.rtt is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert 0.1 <= session.port.rtt < 0.5, session.port.rtt
+            assert server.session_stats()[0]['rtt'] == round(session.port.rtt, 4)
+            assert session.port.key_lag() >= session.port.rtt
+            writer.close()
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("   ✓ TIMING-MARK replies time the link; key lag includes it")
+
+
+class _Transport:
+    def __init__(self):
+        self.sent, self.backlog = [], 0
+
+    def write(self, data):
+        self.sent.append(data)
+
+    def get_write_buffer_size(self):
+        return self.backlog
+
+    def is_closing(self):
+        return False
+
+
+def test_broadcast_encodes_once_and_skips_ahead():
+    print("\n🔧 Testing spectator broadcast...")
+    server = GameServer()
+    broadcast = Broadcast()
+    broadcast.publish(b'old screen')
+    broadcast.publish(b'\033[2J\033[Hmenu')
+    viewers = []
+    for _ in range(3):
+        viewer = Session(server)
+        viewer.transport = _Transport()
+        viewer.spectate(SimpleNamespace(broadcast=broadcast, transport=_Transport()))
+        viewers.append(viewer)
+    assert viewers[0].transport.sent == [b'\033[2J\033[Hmenu']  # Joined at the keyframe
+    frame = b'\r\n> 9'
+    viewers[2].transport.backlog = 10 ** 6  # Stuck
+    broadcast.publish(frame)
+    assert viewers[0].transport.sent[-1] is frame and viewers[1].transport.sent[-1] is frame
+    broadcast.publish(b'more')
+    assert viewers[2].lagging and broadcast.skipped == 2
+    viewers[2].transport.backlog = 0
+    broadcast.publish(b'\033[2J\033[Hmap')
+    broadcast.publish(b' + path')
+    assert viewers[2].transport.sent[-2:] == [b'\033[2J\033[Hmap', b' + path']
+    assert viewers[0].transport.sent[-1] is viewers[2].transport.sent[-1]
+    print("   ✓ One bytes object per frame for every viewer; stuck viewers skip to the latest screen")
+
+
+def test_spectators_over_loopback():
+    print("\n🔧 Testing spectators over loopback...")
+
+    async def scenario(tmp):
+        server = await GameServer(port=0, saves_dir=tmp, speed=0).start()
+        try:
+            reader, writer = await _login(server, 'star')
+            watchers = []
+            for _ in range(2):
+                r, w = await asyncio.open_connection('127.0.0.1', server.port)
+                w.write(b'watch star\r\n')
+                await _read_until(r, b'Main Menu')
+                watchers.append((r, w))
+            assert server.stats()['spectators'] == 2
+            writer.write(b'9\r\n')
+            for r, _ in watchers:
+                await _read_until(r, b'Main Menu')
+            writer.write(b'3\r\n')
+            for r, _ in watchers:
+                assert b'has left' in await asyncio.wait_for(r.read(), 5)
+            await asyncio.wait_for(reader.read(), 5)
+            for _ in range(100):
+                if not server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            assert not server.sessions and server.errors == 0, server.stats()
+        finally:
+            await server.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("   ✓ Viewers join mid-game, follow live, and are told when the player leaves")
+
+
+if __name__ == '__main__':
+    test_parser_separates_commands()
+    test_sessions_over_loopback()
+    test_idle_sessions_hibernate_and_resume()
+    test_scheduler_serves_in_arrival_order()
+    test_spammers_and_slow_readers_are_contained()
+    test_mccp2_compresses_the_stream()
+    test_round_trip_is_measured()
+    test_broadcast_encodes_once_and_skips_ahead()
+    test_spectators_over_loopback()
+    print("\n✓ Server tests passed")
+    sys.exit(0)
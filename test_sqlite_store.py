@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite multi-profile save store."""
+
+import os
+import sys
+import tempfile
+import threading
+
+from terminal_exit.autosave import AutosaveWorker
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.save_load import SaveError
+from terminal_exit.sqlite_store import SqliteStore
+from test_saves import _assert_same
+
+
+def test_engine_on_sqlite_profile():
+    print("\n🔧 Testing engine saves in SQLite...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(os.path.join(tmp, 'saves.db'))
+        worker = AutosaveWorker(interval=60)
+        engine = GameEngine(autosave=worker, saver=store.saver('alice'))
+        engine.journal.start(engine)
+        engine.inventory.add_item('Health Potion')
+        engine.ai.install_upgrade('Shield Subroutine')
+        worker.flush()
+        assert len(engine.saver.read_journal()) == 3
+
+        fresh = GameEngine(autosave=worker, saver=store.saver('alice'))
+        assert fresh.load_game()
+        _assert_same(engine, fresh)
+        assert GameEngine(saver=store.saver('bob')).load_game() is False
+        assert store.profiles() == ['alice', 'bob']
+        engine.save_game()
+        assert dict(engine.saver.list_headers())[0]['upgrades'] == 1
+        assert engine.saver.read_journal() == []
+        worker.stop()
+        store.close()
+    print("   ✓ Snapshot + journal round trip per profile")
+
+
+def test_concurrent_profiles():
+    print("\n🔧 Testing concurrent profile saves...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(os.path.join(tmp, 'saves.db'))
+        errors = []
+
+        def player(n):
+            try:
+                saver = store.saver(f'player{n}')
+                for i in range(20):
+                    saver.save({'version': 1, 'player': {'n': n, 'i': i}})
+                    saver.append_journal([f'[{i},"x",{{}}]'])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=player, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+        for n in range(8):
+            saver = store.saver(f'player{n}')
+            assert saver.load()['player'] == {'n': n, 'i': 19}
+            assert len(saver.read_journal()) == 20
+        store.close()
+    print("   ✓ Eight threads, eight profiles, no lost writes")
+
+
+def test_batched_transaction_is_atomic():
+    print("\n🔧 Testing batched transactions...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(os.path.join(tmp, 'saves.db'))
+        a, b = store.saver('a'), store.saver('b')
+        store.save_many([(a, {'version': 1, 'player': {'v': 1}}),
+                         (b, {'version': 1, 'player': {'v': 1}})])
+        try:
+            store.save_many([(a, {'version': 1, 'player': {'v': 2}}),
+                             (b, {'version': 1, 'player': {'bad': object()}})])
+        except SaveError:
+            pass
+        else:
+            raise AssertionError("Unencodable save must raise SaveError")
+        assert a.load()['player'] == {'v': 1}  # Rolled back with b
+        a.delete()
+        assert a.load() is None and a.list_slots() == []
+        store.close()
+    print("   ✓ A failed batch writes nothing")
+
+
+def test_damaged_database_raises_save_error():
+    print("\n🔧 Testing a damaged save database...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(os.path.join(tmp, 'saves.db'))
+        saver = store.saver('carol')
+        saver.save({'version': 1, 'player': {}})
+        with store.transaction() as db:
+            db.execute("UPDATE slots SET header = '{broken'")
+            db.execute('DROP TABLE journal')
+        for call in (saver.read_header, saver.list_headers, saver.read_journal):
+            try:
+                call()
+            except SaveError:
+                pass
+            else:
+                raise AssertionError(f"{call.__name__} must raise SaveError")
+        store.close()
+    print("   ✓ Bad header rows and database errors surface as SaveError")
+
+
+if __name__ == '__main__':
+    test_engine_on_sqlite_profile()
+    test_concurrent_profiles()
+    test_batched_transaction_is_atomic()
+    test_damaged_database_raises_save_error()
+    print("\n✓ SQLite store tests passed")
+    sys.exit(0)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for streaming save export/import."""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from bench_saves import build_large_engine
+from terminal_exit import serialization
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.streaming import StreamLoader, export_stream, import_stream
+from terminal_exit.terminal_io import MemoryPort, use_port
+from test_saves import _played_engine, _assert_same
+
+
+def _peak(fn):
+    """Transient memory: peak minus what is still held afterwards."""
+    tracemalloc.start()
+    try:
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+        return peak - current
+    finally:
+        tracemalloc.stop()
+
+
+def test_round_trip():
+    print("\n🔧 Testing streaming round trip...")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _played_engine()
+        for name in ('save.ndjson', 'save.ndjson.gz'):
+            path = os.path.join(tmp, name)
+            export_stream(engine, path)
+            _assert_same(engine, import_stream(GameEngine(), path))
+            print(f"   ✓ {name}: {os.path.getsize(path)} bytes")
+
+
+def test_play_starts_before_far_rooms_load():
+    print("\n🔧 Testing early start...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'big.ndjson')
+        engine = build_large_engine(3000)
+        engine.world.current_room = engine.world.rooms['Sector 1500']
+        export_stream(engine, path)
+
+        target = build_large_engine(3000)
+        loader = StreamLoader(target, path).until_ready()
+        here = target.world.current_room
+        assert here.name == 'Sector 1500' and here.visited
+        assert all(r.visited for r in target.world.adjacent(here))
+        assert loader.rooms_loaded < 100 and not loader.done
+        assert not target.world.rooms['Sector 0'].visited  # Far away, not read yet
+        loader.finish()
+        _assert_same(engine, target)
+        print("   ✓ Near rooms first, the rest on demand")
+
+
+def test_engine_import_resumes_journaling():
+    print("\n🔧 Testing engine import...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'export.ndjson')
+        export_stream(build_large_engine(2000), path)
+        engine = build_large_engine(2000)
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        engine.import_save(path)
+        assert engine.importing is not None
+        assert engine.journal.engine is None
+        while engine.importing is not None:
+            engine._continue_import()
+        assert engine.saver.load()['world']['current'] == engine.world.current_room.name
+        assert engine.journal.engine is engine
+        print("   ✓ Snapshot taken once the import completes")
+
+
+def test_truncated_stream_is_rejected():
+    print("\n🔧 Testing truncated exports...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'save.ndjson')
+        export_stream(build_large_engine(200), path)
+        with open(path, 'rb+') as f:
+            f.truncate(os.path.getsize(path) // 2)
+        try:
+            import_stream(GameEngine(), path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Truncated export must raise ValueError")
+    print("   ✓ Missing end record detected")
+
+
+def test_engine_survives_a_truncated_import():
+    print("\n🔧 Testing a truncated export during play...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'export.ndjson')
+        export_stream(build_large_engine(2000), path)
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, 'w') as f:
+            f.writelines(lines[:-200])
+        engine = build_large_engine(2000)
+        engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+        port = MemoryPort([''])
+        with use_port(port):
+            engine.import_save(path)
+            while engine.importing is not None:
+                engine._continue_import()
+        assert 'damaged' in port.text() and not port.inputs
+        assert engine.journal.engine is engine
+        assert engine.world._loaded is None  # Loading mode is over
+        saved = engine.saver.load()['world']
+        assert saved['current'] == engine.world.current_room.name
+        print("   ✓ The player is told; play and journaling go on")
+
+
+def test_export_memory_does_not_grow_with_world():
+    print("\n🔧 Testing streaming memory...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'save.ndjson')
+        peaks = {}
+        for rooms in (2000, 20000):
+            engine = build_large_engine(rooms)
+            target = build_large_engine(rooms)
+            engine.world.room_at((0, 0))  # Build the coordinate index first
+            export = _peak(lambda: export_stream(engine, path))
+            load = _peak(lambda: import_stream(target, path))
+            whole = _peak(lambda: serialization.restore(
+                target, serialization.decode_json(
+                    serialization.encode_json(serialization.capture(engine)))))
+            peaks[rooms] = max(export, load)
+            print(f"   {rooms:>6} rooms: export {export // 1024} KiB, "
+                  f"import {load // 1024} KiB, whole-state JSON {whole // 1024} KiB")
+        assert peaks[20000] < 2 * peaks[2000]
+    print("   ✓ Peak memory does not grow with the world")
+
+
+if __name__ == '__main__':
+    test_round_trip()
+    test_play_starts_before_far_rooms_load()
+    test_engine_import_resumes_journaling()
+    test_truncated_stream_is_rejected()
+    test_engine_survives_a_truncated_import()
+    test_export_memory_does_not_grow_with_world()
+    print("\n✓ Streaming tests passed")
+    sys.exit(0)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Simulated-latency tests for the strike bar's timing judgment."""
+
+import random
+import sys
+import time
+from statistics import mean, pstdev
+from types import SimpleNamespace
+
+from terminal_exit.ai_companion import AICompanion
+from terminal_exit.clock import VirtualClock
+from terminal_exit.combat_system import CombatSystem
+from terminal_exit.inventory import Inventory
+from terminal_exit.server import PING_INTERVAL, TelnetPort
+from terminal_exit.terminal_io import Port
+
+RTTS = (0.0, 0.05, 0.1, 0.2, 0.3)
+SEEDS = (1, 2, 50)
+STRIKES = 300
+
+
+class LaggedPort(Port):
+    """A remote player `rtt` seconds away, on the game's virtual clock.
+
+    Each frame reaches the player half a round trip after it is drawn,
+    and the key they press reaches the host half a round trip later.
+    Every leg jitters by up to `jitter` seconds, plus an occasional
+    queueing spike. The player presses Enter when they see the cursor on
+    the middle of the green zone, give or take human timing.
+
+    The judging is left to a real TelnetPort: it gets a TIMING-MARK
+    sample (one jittered round trip) every PING_INTERVAL, as the host
+    would, and reports key lag from its own smoothed estimate.
+    """
+
+    def __init__(self, clock, rtt, jitter=0.04, timing=0.05, spikes=0.1):
+        self.clock = clock
+        self.rtt = rtt
+        self.jitter = jitter
+        self.timing = timing
+        self.spikes = spikes
+        self.arrives = None  # When the press reaches the host
+        self.host = TelnetPort(SimpleNamespace(server=SimpleNamespace(scheduler=None)))
+        self.samples = []
+        self._next_ping = clock.now()
+
+    def _delay(self):
+        delay = self.rtt / 2 + random.uniform(0, self.jitter)
+        if random.random() < self.spikes:
+            delay += random.uniform(0, 0.1)
+        return delay
+
+    def _ping(self):
+        sample = self._delay() + self._delay()
+        self.samples.append(sample)
+        self.host.observe_rtt(sample)
+        self._next_ping = self.clock.now() + PING_INTERVAL
+
+    def write(self, text):
+        pass
+
+    def readline(self):
+        return ''
+
+    def frame(self, text):
+        if self.clock.now() >= self._next_ping:
+            self._ping()
+        if self.arrives is None:
+            bar = text[2:-1]
+            zone = [i for i, c in enumerate(bar) if c == '=']
+            cursor = bar.index('▸')
+            if zone and cursor == (zone[0] + zone[-1] + 1) // 2:
+                pressed = (self.clock.now() + self._delay()
+                           + random.gauss(0, self.timing))
+                self.arrives = pressed + self._delay()
+        return super().frame(text)
+
+    def has_input(self):
+        return self.arrives is not None and self.arrives <= self.clock.now()
+
+    def key_pressed(self):
+        if not self.has_input():
+            return False
+        # The host stamps arrivals on the real monotonic clock
+        self.host.line_arrived = time.monotonic() - (self.clock.now() - self.arrives)
+        self.arrives = None
+        return True
+
+    def key_lag(self):
+        return self.host.key_lag()
+
+
+def hit_rate(rtt, compensation=CombatSystem.STRIKE_COMPENSATION, strikes=STRIKES, seed=50):
+    """Share of strikes landing in the green zone for a player `rtt`
+    away, and the port they played on."""
+    random.seed(seed)
+    clock = VirtualClock()
+    port = LaggedPort(clock, rtt)
+    combat = CombatSystem(AICompanion(), Inventory(), clock=clock, io=port)
+    combat.STRIKE_COMPENSATION = compensation
+    hits = 0
+    for _ in range(strikes):
+        port.arrives = None
+        base_start = random.randint(10, 16)
+        hits += combat._run_strike_game(30, base_start, 2, []) == 'base'
+    return hits / strikes, port
+
+
+def test_hit_rate_is_stable_across_latency():
+    print("\n🔧 Testing strike timing from 0 to 300 ms RTT...")
+    for seed in SEEDS:
+        rates = []
+        for rtt in RTTS:
+            rate, port = hit_rate(rtt, seed=seed)
+            # The judge only had the host's estimate, and it was noisy
+            assert pstdev(port.samples) > 0.02, port.samples
+            assert abs(port.host.rtt - mean(port.samples)) < 0.1, port.host.rtt
+            rates.append(rate)
+        assert min(rates) > 0.6, rates
+        assert max(rates) - min(rates) < 0.1, (seed, list(zip(RTTS, rates)))
+    print("   ✓ " + ', '.join(f"{rtt * 1000:.0f} ms: {rate:.0%}"
+                               for rtt, rate in zip(RTTS, rates))
+          + f" (seed {seed}, estimate {port.host.rtt * 1000:.0f} ms at the end)")
+
+
+def test_uncompensated_players_hit_late():
+    print("\n🔧 Testing the harness without compensation...")
+    local, _ = hit_rate(0.0, compensation=0)
+    remote, _ = hit_rate(0.3, compensation=0)
+    assert remote < local / 3, (local, remote)
+    print(f"   ✓ Judged on arrival, 300 ms RTT drops hits from {local:.0%} to {remote:.0%}")
+
+
+def test_compensation_is_bounded():
+    print("\n🔧 Testing the compensation window...")
+    window = CombatSystem.STRIKE_COMPENSATION
+    far, _ = hit_rate(window + 0.3)
+    assert far < hit_rate(0.0)[0] / 3, far
+    print(f"   ✓ Lag past {window * 1000:.0f} ms is not forgiven ({far:.0%} hits)")
+
+
+if __name__ == '__main__':
+    test_hit_rate_is_stable_across_latency()
+    test_uncompensated_players_hit_late()
+    test_compensation_is_bounded()
+    print("\n✓ Strike latency tests passed")
+    sys.exit(0)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for the pre-fork supervisor (runs it as a real process)."""
+
+import os
+import queue
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+STATUS = re.compile(r'status: (\d+) workers, (\d+) sessions, (\d+) restarts \| (.*)')
+
+
+class Host:
+    def __init__(self, tmp, workers=2):
+        self.proc = subprocess.Popen(
+            [sys.executable, '-m', 'terminal_exit.supervisor', '--port', '0',
+             '--workers', str(workers), '--speed', '0', '--saves', tmp,
+             '--report', '0.2', '--drain-timeout', '1'],
+            stdout=subprocess.PIPE, text=True)
+        self.lines = queue.Queue()
+        self.ready = set()  # Workers that reported their server started
+        self._ready_changed = threading.Condition()
+        threading.Thread(target=self._pump, daemon=True).start()
+        self.port = int(self.wait_for(r'Listening on .*:(\d+)').group(1))
+        self.first = set(self.ready)
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            line = line.rstrip('\n')
+            ready = re.search(r'worker (\d+) ready', line)
+            if ready:
+                with self._ready_changed:
+                    self.ready.add(int(ready.group(1)))
+                    self._ready_changed.notify_all()
+            self.lines.put(line)
+
+    def wait_ready(self, pids, timeout=15.0):
+        with self._ready_changed:
+            assert self._ready_changed.wait_for(lambda: set(pids) <= self.ready, timeout), pids
+
+    def wait_for(self, pattern, timeout=15.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                line = self.lines.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            match = re.search(pattern, line)
+            if match:
+                return match
+        raise AssertionError(f'timed out waiting for {pattern!r}')
+
+    def status(self, check, timeout=15.0):
+        """Wait for a status line satisfying check(workers, sessions, restarts, pids)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            m = self.wait_for(STATUS.pattern, deadline - time.monotonic())
+            pids = [int(p.split(':')[0]) for p in m.group(4).split(' | ')]
+            if check(int(m.group(1)), int(m.group(2)), int(m.group(3)), pids):
+                return pids
+        raise AssertionError('status never matched')
+
+
+def _connect(host, name, pids):
+    """Log in once every worker in `pids` is listening."""
+    host.wait_ready(pids)
+    sock = socket.create_connection(('127.0.0.1', host.port), timeout=10)
+    sock.sendall(name.encode() + b'\r\n')
+    _read_until(sock, b'Main Menu')
+    return sock
+
+
+def _read_until(sock, marker):
+    data = b''
+    while marker not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def test_supervisor_restarts_reloads_and_drains():
+    print("\n🔧 Testing the pre-fork supervisor...")
+    if not hasattr(os, 'fork'):
+        print("   - skipped (no fork on this platform)")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        host = Host(tmp)
+        try:
+            assert len(host.first) == 2
+            clients = [_connect(host, f'p{n}', host.first) for n in range(6)]
+            pids = host.status(lambda w, s, r, p: w == 2 and s == 6)
+
+            # A crashed worker is replaced
+            os.kill(pids[0], signal.SIGKILL)
+            host.wait_for(rf'worker {pids[0]} exited')
+            survivors = host.status(lambda w, s, r, p: w == 2 and r == 1)
+            assert pids[0] not in survivors
+
+            # Reload: a new generation takes over while the old one drains
+            old = set(survivors)
+            host.proc.send_signal(signal.SIGHUP)
+            fresh = host.status(lambda w, s, r, p: w == 2 and not old & set(p))
+            late = _connect(host, 'late', fresh)
+            for sock in clients:
+                sock.settimeout(10)
+                try:
+                    sock.sendall(b'9\r\n')
+                except OSError:
+                    pass  # This one was on the worker we killed
+                _read_until(sock, b'')  # Drained: hung up after the timeout
+            late.sendall(b'9\r\n')
+            assert b'Main Menu' in _read_until(late, b'Main Menu')
+
+            host.proc.send_signal(signal.SIGTERM)
+            host.wait_for(r'stopped')
+            assert host.proc.wait(timeout=15) == 0
+            print(f"   ✓ Restarted a killed worker, reloaded {sorted(old)} -> {sorted(fresh)}, "
+                  f"drained and stopped")
+        finally:
+            if host.proc.poll() is None:
+                host.proc.kill()
+                host.proc.wait()
+
+
+if __name__ == '__main__':
+    test_supervisor_restarts_reloads_and_drains()
+    print("\n✓ Supervisor tests passed")
+    sys.exit(0)
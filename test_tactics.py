@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for the Tactical Advisor fight solver."""
+
+import random
+import sys
+import time
+from terminal_exit import tactics
+from terminal_exit.ai_companion import AICompanion
+from terminal_exit.combat_system import ENEMIES
+from terminal_exit.effects import Modifiers, compile_modifiers
+from terminal_exit.tactics import get_table, strike_odds, ACTIONS
+
+
+def _sample(dist, rng):
+    r = rng.random()
+    for value, p in dist.items():
+        r -= p
+        if r <= 0:
+            return value
+    return value
+
+
+def _simulate(table, php, ehp, potions, rng):
+    """Play one fight from a state following the table's advice."""
+    m = table.model
+    while True:
+        action, _ = table.lookup(php, ehp, potions)
+        if action == 'attack':
+            ehp -= _sample(m.attack, rng)
+        elif action == 'analyze':
+            ehp -= _sample(m.analyze, rng)
+        elif action == 'item':
+            potions -= 1
+            php = min(m.max_player_hp, php + m.heal)
+        elif action == 'mercy':
+            if rng.random() < m.mercy_chance:
+                return True
+        if ehp <= 0:
+            return True
+        php -= _sample(m.enemy_hit, rng)
+        if php <= 0:
+            return False
+
+
+def test_strike_odds_sum_to_one():
+    print("\n🔧 Testing strike odds...")
+    for upgrades in ([], ['Pattern Recognition', 'Glitch Analyzer']):
+        mods = compile_modifiers(upgrades, 0.0)
+        for skill in (0.0, 0.5, 1.0):
+            odds = strike_odds(mods, skill)
+            assert abs(sum(odds) - 1.0) < 1e-9, odds
+    assert strike_odds(compile_modifiers([], 0.0), 1.0)[0] == 1.0
+    print("   ✓ Base/bonus/miss odds are a distribution")
+
+
+def test_win_probability_is_monotone():
+    print("\n🔧 Testing win probability shape...")
+    table = get_table('echo', compile_modifiers([], 0.0))
+    last = 0.0
+    for php in range(1, 101):
+        action, win = table.lookup(php, 35, 0)
+        assert action in ACTIONS
+        assert win >= last - 1e-12, f"Win chance dropped at {php} HP"
+        last = win
+    assert table.lookup(50, 0, 0) == (None, 1.0)
+    assert table.lookup(0, 10, 0) == (None, 0.0)
+    print("   ✓ More HP never lowers the win chance")
+
+
+def test_table_matches_simulation():
+    print("\n🔧 Testing solver against simulated fights...")
+    rng = random.Random(7)
+    table = get_table('echo', compile_modifiers([], 0.0))
+    php, ehp, potions = 12, 35, 1
+    _, predicted = table.lookup(php, ehp, potions)
+    runs = 4000
+    wins = sum(_simulate(table, php, ehp, potions, rng) for _ in range(runs))
+    assert abs(wins / runs - predicted) < 0.03, (wins / runs, predicted)
+    print(f"   ✓ Predicted {predicted:.1%}, simulated {wins / runs:.1%}")
+
+
+def test_tables_are_cached():
+    print("\n🔧 Testing table cache...")
+    mods = compile_modifiers([], 0.0)
+    assert get_table('glitch', mods) is get_table('glitch', mods)
+    assert get_table('glitch', Modifiers()) is get_table('glitch', mods)  # Equal, not same
+    lru = tactics._LRU(2)
+    for n in range(3):
+        lru.put(n, str(n))
+    assert lru.get(0) is None and lru.get(2) == '2' and len(lru) == 2
+    print("   ✓ Tables solved once per enemy template, in a bounded cache")
+
+
+def test_advisor_install_solves_ahead():
+    print("\n🔧 Testing advisor precompute...")
+    ai = AICompanion()
+    ai.install_upgrade('Tactical Advisor')
+    for _ in range(1000):
+        if tactics._warm_thread is None:
+            break
+        time.sleep(0.01)
+    fights = [(key, tactics._mods_key(ai.modifiers), tactics.DEFAULT_POTION_CAP, 100, 30,
+               tactics.DEFAULT_SKILL) for key in ENEMIES]
+    assert all(tactics._BY_FIGHT.get(fight) is not None for fight in fights)
+    print(f"   ✓ {len(fights)} enemy tables solved off the game thread")
+
+
+if __name__ == '__main__':
+    test_strike_odds_sum_to_one()
+    test_win_probability_is_monotone()
+    test_table_matches_simulation()
+    test_tables_are_cached()
+    test_advisor_install_solves_ahead()
+    print("\n✓ Tactics tests passed")
+    sys.exit(0)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the pluggable terminal I/O ports."""
+
+import os
+import socket
+import sys
+import tempfile
+
+from terminal_exit.ai_companion import AICompanion
+from terminal_exit.ascii_art import cprint
+from terminal_exit.autosave import AutosaveWorker
+from terminal_exit.bots import BotPlayer, POLICIES
+from terminal_exit.clock import VirtualClock
+from terminal_exit.combat_system import CombatSystem
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.intro_sequence import IntroSequence
+from terminal_exit.inventory import Inventory
+from terminal_exit.terminal_io import (Disconnected, MemoryPort, NullPort,
+                                       SocketPort, current_port, use_port)
+
+
+def _engine(tmp, port):
+    engine = GameEngine(clock=VirtualClock(), autosave=AutosaveWorker(), io=port)
+    engine.saver.SAVE_FILE = os.path.join(tmp, 'save.json')
+    return engine
+
+
+def test_memory_port_drives_the_engine():
+    print("\n🔧 Testing a scripted session on a memory port...")
+    with tempfile.TemporaryDirectory() as tmp:
+        port = MemoryPort(['9', '3'])
+        _engine(tmp, port).run()
+        text = port.text()
+        assert 'Goodbye' in text
+        assert not port.inputs
+    print("   ✓ Menu drawn and quit read from the port, nothing on stdout")
+
+
+def test_disconnect_ends_the_session():
+    print("\n🔧 Testing a disconnect mid-game...")
+    with tempfile.TemporaryDirectory() as tmp:
+        port = MemoryPort(['1', '', ''])
+        engine = _engine(tmp, port)
+        engine.run()  # Runs out of input inside the intro
+        assert not engine.running
+        assert os.path.exists(engine.saver.path()), "New game snapshot should be on disk"
+    with use_port(port):
+        try:
+            current_port().input('> ')
+        except Disconnected:
+            pass
+        else:
+            raise AssertionError("Exhausted input should disconnect")
+    print("   ✓ Disconnected unwinds the scenes and flushes saves")
+
+
+def test_ports_are_per_scene():
+    print("\n🔧 Testing port binding...")
+    outer, inner = MemoryPort(), MemoryPort()
+    with use_port(outer):
+        cprint('outer')
+        with use_port(inner):
+            cprint('inner')
+        cprint('outer again')
+    assert 'inner' in inner.text() and 'inner' not in outer.text()
+    assert outer.text().count('outer') == 2
+    print("   ✓ Nested use_port blocks route helpers to the right port")
+
+
+def test_headless_combat_on_null_port():
+    print("\n🔧 Testing combat on a null port...")
+    inventory = Inventory()
+    inventory.add_item('Health Potion')
+    combat = CombatSystem(AICompanion(), inventory, clock=VirtualClock(), io=NullPort())
+    combat.player = BotPlayer(POLICIES['greedy'](), headless=True)
+    combat.start_encounter('glitch')
+    assert combat.outcome is not None
+    print(f"   ✓ Encounter finished ({combat.outcome}) with no terminal")
+
+
+def test_socket_port_round_trip():
+    print("\n🔧 Testing a socket port...")
+    server, client = socket.socketpair()
+    port = SocketPort(server)
+    try:
+        client.sendall(b'look\r\nnorth\n')
+        assert port.input('> ') == 'look'
+        assert port.has_input()
+        assert port.readline() == 'north'
+        port.print('two\nlines')
+        data = client.recv(1024)
+        assert data == b'> two\r\nlines\r\n', data
+        client.close()
+        try:
+            port.readline()
+        except Disconnected:
+            pass
+        else:
+            raise AssertionError("Closed socket should disconnect")
+    finally:
+        port.close()
+    print("   ✓ Lines in, CRLF out, hang-up raises Disconnected")
+
+
+def test_congested_ports_drop_frames():
+    print("\n🔧 Testing frame dropping on a congested port...")
+
+    class Lagging(MemoryPort):
+        def congested(self):
+            return True
+
+    port, clock = Lagging(), VirtualClock()
+    assert not port.frame('|  >  |') and not port.output
+    intro = IntroSequence(AICompanion(), {}, clock=clock, io=port)
+    intro._slow_print('Hello there', delay=0.05)
+    assert 'Hello there' in port.text() and clock.slept == 0
+    assert MemoryPort().frame('x')
+    print("   ✓ Frames skipped; typewriter text shown at once")
+
+
+if __name__ == '__main__':
+    test_memory_port_drives_the_engine()
+    test_disconnect_ends_the_session()
+    test_ports_are_per_scene()
+    test_headless_combat_on_null_port()
+    test_socket_port_round_trip()
+    test_congested_ports_drop_frames()
+    print("\n✓ Terminal I/O tests passed")
+    sys.exit(0)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for the shared world map with per-session progress overlays."""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from bench_saves import large_base
+from terminal_exit import serialization
+from terminal_exit.game_engine import GameEngine
+from terminal_exit.world_manager import BaseWorld, WorldManager
+
+
+def _bits(flags):
+    return sum(1 << i for i, f in enumerate(flags) if f).to_bytes((len(flags) + 7) // 8, 'little')
+
+
+def test_new_sessions_cost_the_same_on_any_map():
+    print("\n🔧 Testing new-session cost on a large map...")
+    small, big = BaseWorld.default(), large_base(20000)
+    costs = []
+    for base in (small, big):
+        WorldManager(base)
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        worlds = [WorldManager(base) for _ in range(50)]
+        took = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        costs.append((used / 50, took))
+        assert len(worlds[0]._overlay) == 1  # Only the starting room
+    (small_bytes, small_time), (big_bytes, big_time) = costs
+    assert big_bytes < small_bytes * 1.5 + 256, costs
+    assert big_time < small_time * 20 + 0.01, costs
+    print(f"   ✓ {len(small.specs)} rooms: {small_bytes:.0f} B, "
+          f"{len(big.specs)} rooms: {big_bytes:.0f} B per world")
+
+
+def test_lookups_fall_through_to_base():
+    print("\n🔧 Testing fall-through lookups...")
+    world = WorldManager()
+    room = world.rooms['Junction']
+    assert not room.visited and room.spec is world.base.specs[world.base.index['Junction']]
+    assert 'Junction' not in world._overlay
+    assert world.rooms['Junction'] is room  # Stable while held
+    room.visited = True
+    assert world._overlay['Junction'] is room
+    del room
+    gc.collect()
+    assert world.rooms['Junction'].visited
+    assert len(world.rooms) == len(world.base.specs)
+    print("   ✓ Untouched rooms read the base; writes land in the overlay")
+
+
+def test_delta_round_trip():
+    print("\n🔧 Testing delta round trip...")
+    engine = GameEngine()
+    engine.world.move('north')
+    room = engine.world.current_room
+    room.encounter_cleared = True
+    room.examined_objects['Examine Console'] = True
+    room.items.append('Data Shard')
+    state = engine.world.to_state()
+    assert set(state['delta']) == {'Awakening Point', room.name}
+    fresh = GameEngine()
+    fresh.world.load_state(serialization.decode(serialization.encode(state, 'binary')))
+    assert fresh.world.delta() == engine.world.delta()
+    assert fresh.world.current_room.name == room.name
+    assert not fresh.world.rooms['Junction'].visited
+    print("   ✓ Only changed rooms are saved and restored")
+
+
+def test_v1_bitset_saves_migrate():
+    print("\n🔧 Testing v1 world migration...")
+    base = BaseWorld.default()
+    names = [spec.name for spec in base.specs]
+    visited = [n in ('Awakening Point', 'Void Corridor') for n in names]
+    cleared = [n == 'Void Corridor' for n in names]
+    state = {'version': 1, 'world': {
+        'layout': base.layout, 'current': 'Void Corridor',
+        'visited': _bits(visited), 'cleared': _bits(cleared),
+        'rooms': {'Void Corridor': {'examined': {'Examine Console': True}, 'items': []}}}}
+    migrated = serialization.migrate(state)
+    assert migrated['version'] == serialization.SCHEMA_VERSION
+    assert migrated['world']['delta'] == {
+        'Awakening Point': [True, False, None, None],
+        'Void Corridor': [True, True, {'Examine Console': True}, None]}
+    world = WorldManager()
+    world.load_state(state['world'])  # The old form still loads directly
+    assert world.delta() == migrated['world']['delta']
+    print("   ✓ Bitsets become a delta; legacy worlds still load")
+
+
+if __name__ == '__main__':
+    test_new_sessions_cost_the_same_on_any_map()
+    test_lookups_fall_through_to_base()
+    test_delta_round_trip()
+    test_v1_bitset_saves_migrate()
+    print("\n✓ World overlay tests passed")
+    sys.exit(0)